@@ -13,3 +13,7 @@ class AccountsConfig(AppConfig):
     def ready(self):
         """Import signals when app is ready."""
         import apps.accounts.models  # noqa: F401
+
+        from .authentication import connect_principal_signals
+
+        connect_principal_signals()
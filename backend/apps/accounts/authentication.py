@@ -0,0 +1,136 @@
+"""
+JWT authentication with a cached principal.
+
+``JWTAuthentication`` loads the ``User`` row on every request, and the
+first ``user.profile`` access (``is_master`` checks, ``/auth/me/``) costs
+another query. ``CachedJWTAuthentication`` keeps both rows' column values
+in the cache for ``AUTH_PRINCIPAL_CACHE_SECONDS`` and rebuilds the
+instances from there, so an authenticated request usually makes no auth
+queries at all. Saving or deleting a ``User`` or ``UserProfile`` drops its
+entry.
+
+The password hash is never cached: the field is left deferred and loaded
+on first access (only password changes need it).
+"""
+
+import logging
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from config.instrumentation import record_cache_lookup
+
+from .models import UserProfile
+
+logger = logging.getLogger(__name__)
+
+USER_FIELDS = [field.attname for field in User._meta.concrete_fields]
+CACHED_USER_FIELDS = [name for name in USER_FIELDS if name != "password"]
+PROFILE_FIELDS = [field.attname for field in UserProfile._meta.concrete_fields]
+
+PROFILE_RELATION = User._meta.get_field("profile")
+PROFILE_USER_FIELD = UserProfile._meta.get_field("user")
+
+
+def principal_key(user_id):
+    return f"auth:principal:{user_id}"
+
+
+def invalidate_principal(user_id):
+    """Forget the cached principal of ``user_id``."""
+    try:
+        cache.delete(principal_key(user_id))
+    except Exception:
+        logger.warning("Could not invalidate cached principal %s", user_id)
+
+
+def _snapshot(user_id):
+    """Column values of a user and its profile, or ``None`` if missing."""
+    user = User.objects.select_related("profile").filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+    if user is None:
+        return None
+    profile = getattr(user, "profile", None)
+    return {
+        "user": [getattr(user, name) for name in CACHED_USER_FIELDS],
+        "profile": ([getattr(profile, name) for name in PROFILE_FIELDS] if profile else None),
+    }
+
+
+def _restore(snapshot):
+    """``User`` with its ``profile`` already attached, from a snapshot."""
+    user = User.from_db("default", CACHED_USER_FIELDS, snapshot["user"])
+    profile = None
+    if snapshot["profile"] is not None:
+        profile = UserProfile.from_db("default", PROFILE_FIELDS, snapshot["profile"])
+        PROFILE_USER_FIELD.set_cached_value(profile, user)
+    # A cached ``None`` makes ``hasattr(user, "profile")`` false without a query
+    PROFILE_RELATION.set_cached_value(user, profile)
+    return user
+
+
+def load_principal(user_id):
+    """``User`` for ``user_id`` through the cache, or ``None``."""
+    key = principal_key(user_id)
+    try:
+        snapshot = cache.get(key)
+    except Exception:
+        logger.warning("Cache unavailable, loading principal %s directly", user_id)
+        snapshot = _snapshot(user_id)
+        return _restore(snapshot) if snapshot else None
+
+    record_cache_lookup("principal", snapshot is not None)
+    if snapshot is None:
+        snapshot = _snapshot(user_id)
+        if snapshot is None:
+            return None
+        try:
+            cache.set(key, snapshot, settings.AUTH_PRINCIPAL_CACHE_SECONDS)
+        except Exception:
+            logger.warning("Could not cache principal %s", user_id)
+    return _restore(snapshot)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """``JWTAuthentication`` resolving the user through ``load_principal``."""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as error:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from error
+
+        user = load_principal(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Reads the deferred password hash: one query, only when enabled
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != (get_md5_hash_password(user.password)):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+        return user
+
+
+def _invalidate_user(sender, instance, **kwargs):
+    invalidate_principal(instance.pk)
+
+
+def _invalidate_profile(sender, instance, **kwargs):
+    invalidate_principal(instance.user_id)
+
+
+def connect_principal_signals():
+    for name, signal in (("save", post_save), ("delete", post_delete)):
+        signal.connect(_invalidate_user, sender=User, dispatch_uid=f"principal-user-{name}")
+        signal.connect(
+            _invalidate_profile,
+            sender=UserProfile,
+            dispatch_uid=f"principal-profile-{name}",
+        )
@@ -5,6 +5,8 @@ from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from config.instrumentation import TimedSerializerMixin
+
 from .models import UserProfile
 
 
@@ -17,7 +19,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ["is_master"]  # Only admin can change this
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """Serializer for user data."""
 
     profile = UserProfileSerializer(read_only=True)
@@ -0,0 +1,68 @@
+"""Tests for cached JWT authentication"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+@pytest.fixture
+def jwt_client(api_client, user):
+    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    return api_client
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestCachedJWTAuthentication:
+    """Test principal caching for bearer-token requests"""
+
+    def test_second_request_makes_no_auth_queries(self, jwt_client, user):
+        """Test the user and profile come from the cache once warmed"""
+        url = reverse("auth_profile")
+        jwt_client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = jwt_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["username"] == user.username
+        assert response.data["is_master"] is False
+        assert len(queries) == 0
+
+    def test_profile_save_invalidates(self, jwt_client, user):
+        """Test promoting a user to master is seen on the next request"""
+        url = reverse("auth_profile")
+        jwt_client.get(url)
+
+        user.profile.is_master = True
+        user.profile.save()
+
+        assert jwt_client.get(url).data["is_master"] is True
+
+    def test_deactivated_user_rejected(self, jwt_client, user):
+        """Test saving an inactive user drops the cached principal"""
+        url = reverse("auth_profile")
+        jwt_client.get(url)
+
+        user.is_active = False
+        user.save()
+
+        assert jwt_client.get(url).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_password_change_loads_deferred_hash(self, jwt_client, user):
+        """Test the uncached password field is fetched when needed"""
+        user.set_password("old-secret-123")
+        user.save()
+        jwt_client.get(reverse("auth_profile"))
+
+        response = jwt_client.post(
+            reverse("auth_change_password"),
+            {"old_password": "old-secret-123", "new_password": "n3w-Secret-456!"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        user.refresh_from_db()
+        assert user.check_password("n3w-Secret-456!")
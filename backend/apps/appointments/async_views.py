@@ -0,0 +1,21 @@
+"""Async mirror of the appointment list (see ``config.async_views``)."""
+
+from config.async_views import async_api_view, json_response, tenant_queryset
+
+from .serializers import AppointmentListSerializer
+from .views import AppointmentPagination, AppointmentViewSet
+
+
+@async_api_view
+async def appointment_list(request):
+    """
+    GET /api/async/appointments/?business=<id>&cursor=...
+
+    Same keyset pages and rows as ``GET /api/appointments/``.
+    """
+    queryset = await tenant_queryset(request, AppointmentViewSet.queryset.all())
+    paginator = AppointmentPagination()
+    rows = [row async for row in paginator.seek(queryset, request)]
+    page = paginator.set_page(rows)
+    data = AppointmentListSerializer(page, many=True).data
+    return json_response(paginator.get_paginated_data(data))
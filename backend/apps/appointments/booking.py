@@ -0,0 +1,143 @@
+"""
+Double-booking protection for appointment writes.
+
+Every write that can move an appointment onto a staff member's time runs
+inside ``booking_guard``: it locks the staff row, so concurrent bookings
+for the same chair queue up behind each other, then looks for a blocking
+appointment overlapping ``[scheduled_at, ends_at)`` through the
+``(staff, ends_at)`` index. On Postgres the ``appointments_staff_no_overlap``
+exclusion constraint backs this up inside the database itself.
+"""
+
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from django.db import IntegrityError, transaction
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from apps.staff.models import Staff
+
+from .models import NO_OVERLAP_CONSTRAINT, NON_BLOCKING_STATUSES, Appointment
+
+# Fields whose change can create a new overlap
+BOOKING_FIELDS = ("staff", "scheduled_at", "service", "status")
+
+
+class BookingConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "The staff member is already booked at that time."
+    default_code = "booking_conflict"
+
+
+def find_conflict(staff_id, start, end, exclude_pk=None):
+    """First blocking appointment of ``staff_id`` overlapping ``[start, end)``."""
+    conflicts = Appointment.objects.blocking().filter(staff_id=staff_id)
+    conflicts = conflicts.overlapping(start, end)
+    if exclude_pk is not None:
+        conflicts = conflicts.exclude(pk=exclude_pk)
+    return conflicts.order_by("scheduled_at").values_list("pk", flat=True).first()
+
+
+def raise_conflict(conflict_id=None):
+    raise BookingConflict({"detail": BookingConflict.default_detail, "conflict": conflict_id})
+
+
+@contextmanager
+def booking_guard(staff, start, service, status, exclude_pk=None):
+    """
+    Atomically reject a booking that overlaps another one for ``staff``.
+
+    The write itself must happen inside the ``with`` block so it commits
+    under the same lock as the check.
+    """
+    try:
+        with transaction.atomic():
+            if status not in NON_BLOCKING_STATUSES:
+                # No-op on SQLite, where writers are serialized anyway
+                list(Staff.objects.select_for_update().filter(pk=staff.pk).values("pk"))
+                end = Appointment.compute_ends_at(start, service)
+                conflict_id = find_conflict(staff.pk, start, end, exclude_pk)
+                if conflict_id is not None:
+                    raise_conflict(conflict_id)
+            yield
+    except IntegrityError as error:
+        if NO_OVERLAP_CONSTRAINT in str(error):
+            raise_conflict()
+        raise
+
+
+def find_batch_conflicts(items):
+    """
+    Overlap check for many bookings at once, for the bulk endpoint.
+
+    ``items`` is ``[(index, appointment), ...]`` with ``ends_at`` set. All
+    staff rows involved are locked in pk order, their blocking appointments
+    across the batch window are loaded with one query, and the batch is
+    walked in request order so the first of two colliding rows wins.
+    Returns ``{index: errors}`` for the rows that must not be written.
+    """
+    blocking = [(index, appointment) for index, appointment in items if appointment.status not in NON_BLOCKING_STATUSES]
+    if not blocking:
+        return {}
+
+    staff_ids = sorted({appointment.staff_id for _, appointment in blocking})
+    list(Staff.objects.select_for_update().filter(pk__in=staff_ids).order_by("pk").values("pk"))
+    moving = [appointment.pk for _, appointment in items if appointment.pk]
+    existing = (
+        Appointment.objects.blocking()
+        .filter(staff_id__in=staff_ids)
+        .overlapping(
+            min(appointment.scheduled_at for _, appointment in blocking),
+            max(appointment.ends_at for _, appointment in blocking),
+        )
+        .exclude(pk__in=moving)
+        .order_by("scheduled_at")
+        .values_list("staff_id", "scheduled_at", "ends_at", "pk")
+    )
+
+    # Per staff member: sorted, non-overlapping (start, end, owner) intervals
+    taken = {staff_id: [] for staff_id in staff_ids}
+    for staff_id, start, end, pk in existing:
+        intervals = taken[staff_id]
+        if intervals and start < intervals[-1][1]:
+            last = intervals[-1]
+            intervals[-1] = (last[0], max(last[1], end), last[2])
+        else:
+            intervals.append((start, end, {"conflict": pk}))
+
+    conflicts = {}
+    for index, appointment in blocking:
+        intervals = taken[appointment.staff_id]
+        start, end = appointment.scheduled_at, appointment.ends_at
+        position = bisect_left(intervals, end, key=lambda interval: interval[0])
+        if position and intervals[position - 1][1] > start:
+            conflicts[index] = {
+                "detail": BookingConflict.default_detail,
+                **intervals[position - 1][2],
+            }
+        else:
+            intervals.insert(position, (start, end, {"conflict_index": index}))
+    return conflicts
+
+
+def guard_for_serializer(serializer):
+    """``booking_guard`` for a create or update serializer."""
+    data = serializer.validated_data
+    instance = serializer.instance
+    if instance is not None and not any(field in data for field in BOOKING_FIELDS):
+        # Notes, price, ... cannot introduce an overlap
+        return transaction.atomic()
+
+    def current(field, default=None):
+        if field in data:
+            return data[field]
+        return getattr(instance, field) if instance is not None else default
+
+    return booking_guard(
+        current("staff"),
+        current("scheduled_at"),
+        current("service"),
+        current("status", "scheduled"),
+        exclude_pk=instance.pk if instance is not None else None,
+    )
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["business", "scheduled_at", "id"],
+                name="appointment_busines_d3e1e6_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="appointment",
+            name="appointment_busines_0704d1_idx",
+        ),
+    ]
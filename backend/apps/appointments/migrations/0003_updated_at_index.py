@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0002_keyset_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["business", "updated_at"], name="appointment_busines_5a58eb_idx"
+            ),
+        ),
+    ]
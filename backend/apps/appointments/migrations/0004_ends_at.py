@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def backfill_ends_at(apps, schema_editor):
+    Appointment = apps.get_model("appointments", "Appointment")
+    pending = Appointment.objects.filter(ends_at__isnull=True).select_related("service")
+    batch = []
+    for appointment in pending.only("scheduled_at", "service__duration").iterator(
+        chunk_size=BATCH_SIZE
+    ):
+        minutes = appointment.service.duration if appointment.service else 30
+        appointment.ends_at = appointment.scheduled_at + timedelta(minutes=minutes)
+        batch.append(appointment)
+        if len(batch) >= BATCH_SIZE:
+            Appointment.objects.bulk_update(batch, ["ends_at"])
+            batch = []
+    Appointment.objects.bulk_update(batch, ["ends_at"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0003_updated_at_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="appointment",
+            name="ends_at",
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_ends_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="appointment",
+            name="ends_at",
+            field=models.DateTimeField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="appointment",
+            index=models.Index(
+                fields=["staff", "ends_at"], name="appointment_staff_i_680c9e_idx"
+            ),
+        ),
+    ]
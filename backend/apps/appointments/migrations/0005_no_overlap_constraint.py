@@ -0,0 +1,96 @@
+"""
+Reject overlapping bookings for the same staff member at the database level.
+
+Postgres only: an exclusion constraint over ``tstzrange(scheduled_at,
+ends_at)`` backed by a GiST index (``btree_gist`` provides the equality
+operator class for ``staff_id``). Other backends rely on the locked check
+in ``apps.appointments.booking``.
+
+The app did not prevent double bookings before, so the constraint would
+fail on existing ones. A first step lists them instead and stops the
+migration, for each to be cancelled or moved before running it again.
+"""
+
+from django.db import migrations
+from django.db.models import F, Max, RowRange, Window
+
+CONSTRAINT = "appointments_staff_no_overlap"
+
+# Double bookings spelled out in the error; the rest are counted
+REPORTED_CONFLICTS = 50
+
+
+def double_bookings(Appointment):
+    """
+    ``(id, staff_id, scheduled_at)`` of each blocking appointment that
+    starts before an earlier one of the same staff member has ended.
+    """
+    earlier_end = Window(
+        Max("ends_at"),
+        partition_by=[F("staff_id")],
+        order_by=[F("scheduled_at").asc(), F("id").asc()],
+        frame=RowRange(start=None, end=-1),
+    )
+    return (
+        Appointment.objects.exclude(status__in=("cancelled", "no_show"))
+        .annotate(earlier_end=earlier_end)
+        .filter(earlier_end__gt=F("scheduled_at"))
+        .order_by("staff_id", "scheduled_at")
+        .values_list("id", "staff_id", "scheduled_at")
+    )
+
+
+def check_double_bookings(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    conflicts = list(double_bookings(apps.get_model("appointments", "Appointment")))
+    if not conflicts:
+        return
+    lines = [
+        f"  appointment {pk} (staff {staff_id}, {scheduled_at.isoformat()})"
+        for pk, staff_id, scheduled_at in conflicts[:REPORTED_CONFLICTS]
+    ]
+    if len(conflicts) > REPORTED_CONFLICTS:
+        lines.append(f"  ... and {len(conflicts) - REPORTED_CONFLICTS} more")
+    raise RuntimeError(
+        f"{len(conflicts)} appointment(s) overlap an earlier booking of the same "
+        "staff member, so the no-overlap constraint cannot be added:\n"
+        + "\n".join(lines)
+        + "\nCancel or move each of them (or the booking they overlap), then run "
+        "migrate again."
+    )
+
+
+def add_constraint(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    schema_editor.execute(
+        f"""
+        ALTER TABLE appointments ADD CONSTRAINT {CONSTRAINT}
+        EXCLUDE USING gist (
+            staff_id WITH =,
+            tstzrange(scheduled_at, ends_at, '[)') WITH &&
+        )
+        WHERE (status NOT IN ('cancelled', 'no_show'))
+        """
+    )
+
+
+def drop_constraint(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"ALTER TABLE appointments DROP CONSTRAINT IF EXISTS {CONSTRAINT}"
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0004_ends_at"),
+    ]
+
+    operations = [
+        migrations.RunPython(check_double_bookings, migrations.RunPython.noop),
+        migrations.RunPython(add_constraint, drop_constraint),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("appointments", "0005_no_overlap_constraint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="appointment",
+            name="reminder_sent_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -1,9 +1,32 @@
-from django.db import models
+from datetime import timedelta
+from django.db import models, transaction
 from apps.businesses.models import Business
 from apps.staff.models import Staff
 from apps.customers.models import Customer
 from apps.services.models import Service
 
+# Minutes booked when an appointment has no service
+DEFAULT_DURATION_MINUTES = 30
+
+# Appointments in these states do not occupy the chair
+NON_BLOCKING_STATUSES = ("cancelled", "no_show")
+
+# Postgres-only guard against double-booking, see migration 0005
+NO_OVERLAP_CONSTRAINT = "appointments_staff_no_overlap"
+
+# Appointments that still get a reminder (apps.appointments.reminders)
+REMINDER_STATUSES = ("scheduled", "confirmed")
+
+
+class AppointmentQuerySet(models.QuerySet):
+    def blocking(self):
+        """Appointments that occupy the staff member's time."""
+        return self.exclude(status__in=NON_BLOCKING_STATUSES)
+
+    def overlapping(self, start, end):
+        """Appointments intersecting the half-open range ``[start, end)``."""
+        return self.filter(scheduled_at__lt=end, ends_at__gt=start)
+
 
 class Appointment(models.Model):
     """Appointment booking model"""
@@ -32,6 +55,8 @@ class Appointment(models.Model):
 
     # Appointment details
     scheduled_at = models.DateTimeField()
+    # scheduled_at + service duration, stored so overlap checks are indexed
+    ends_at = models.DateTimeField(editable=False)
     status = models.CharField(
         max_length=20, choices=STATUS_CHOICES, default="scheduled"
     )
@@ -46,16 +71,72 @@ class Appointment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     completed_at = models.DateTimeField(blank=True, null=True)
+    # When the reminder went out; cleared when the appointment is moved
+    reminder_sent_at = models.DateTimeField(blank=True, null=True, editable=False)
+
+    objects = AppointmentQuerySet.as_manager()
 
     class Meta:
         db_table = "appointments"
         ordering = ["-scheduled_at"]
         indexes = [
-            models.Index(fields=["business", "scheduled_at"]),
+            models.Index(fields=["business", "scheduled_at", "id"]),
             models.Index(fields=["staff", "scheduled_at"]),
+            models.Index(fields=["staff", "ends_at"]),
             models.Index(fields=["customer", "scheduled_at"]),
             models.Index(fields=["status"]),
+            models.Index(fields=["business", "updated_at"]),
         ]
 
     def __str__(self):
         return f"{self.customer.name} with {self.staff.name} at {self.scheduled_at}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what was read so saves can tell how the row changed
+        instance._loaded_values = {
+            name: value for name, value in zip(field_names, values) if value is not models.DEFERRED
+        }
+        return instance
+
+    def completed_visit(self, loaded=False):
+        """
+        ``(customer_id, price, scheduled_at)`` if the row counts as a visit.
+
+        With ``loaded=True`` this describes the row as it was read from the
+        database (``None`` for new rows).
+        """
+        if loaded:
+            state = getattr(self, "_loaded_values", {})
+        else:
+            state = {
+                "status": self.status,
+                "customer_id": self.customer_id,
+                "price": self.price,
+                "scheduled_at": self.scheduled_at,
+            }
+        if state.get("status") != "completed":
+            return None
+        return state["customer_id"], state["price"], state["scheduled_at"]
+
+    @staticmethod
+    def compute_ends_at(scheduled_at, service):
+        minutes = service.duration if service else DEFAULT_DURATION_MINUTES
+        return scheduled_at + timedelta(minutes=minutes)
+
+    def save(self, *args, **kwargs):
+        self.ends_at = self.compute_ends_at(self.scheduled_at, self.service)
+        loaded = getattr(self, "_loaded_values", {})
+        moved = loaded.get("scheduled_at", self.scheduled_at) != self.scheduled_at
+        if moved:
+            self.reminder_sent_at = None
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"scheduled_at", "service"} & set(update_fields):
+            extra = {"ends_at", "reminder_sent_at"} if moved else {"ends_at"}
+            kwargs["update_fields"] = {*update_fields, *extra}
+        # post_save receivers (customer lifetime stats) commit with the row
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        # Receivers above compared against the previous state; this is now it
+        self._loaded_values = {field.attname: getattr(self, field.attname) for field in self._meta.concrete_fields}
@@ -0,0 +1,66 @@
+"""
+Reminder delivery backends, chosen with ``REMINDER_NOTIFIER``.
+
+A notifier gets a batch of reminder dicts (see
+``apps.appointments.reminders.REMINDER_FIELDS``) and delivers them all or
+raises: the batch is then retried and none of it is marked as sent. An
+SMS or e-mail provider plugs in as another class with ``send(reminders)``.
+"""
+
+import sys
+import threading
+
+import orjson
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+
+def get_notifier():
+    """Instance of the ``REMINDER_NOTIFIER`` class."""
+    return import_string(settings.REMINDER_NOTIFIER)()
+
+
+def render(reminder):
+    """One-line text of a reminder."""
+    when = timezone.localtime(reminder["scheduled_at"]).strftime("%a %d %b %H:%M")
+    what = f" for {reminder['service']}" if reminder["service"] else ""
+    return (
+        f"Hi {reminder['customer']}, this is a reminder of your appointment"
+        f"{what} with {reminder['staff']} at {reminder['business']} on {when}."
+    )
+
+
+def _record(reminder):
+    return {
+        "appointment": reminder["id"],
+        "phone": reminder["phone"],
+        "email": reminder["email"],
+        "scheduled_at": reminder["scheduled_at"],
+        "message": render(reminder),
+    }
+
+
+class ConsoleNotifier:
+    """Write reminders to stdout; for development."""
+
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+
+    def send(self, reminders):
+        self.stream.write("".join(f"[reminder] {reminder['phone']}: {render(reminder)}\n" for reminder in reminders))
+        self.stream.flush()
+
+
+class FileNotifier:
+    """Append reminders as JSON lines to ``REMINDER_FILE_PATH``."""
+
+    _lock = threading.Lock()
+
+    def __init__(self, path=None):
+        self.path = path or settings.REMINDER_FILE_PATH
+
+    def send(self, reminders):
+        lines = b"".join(orjson.dumps(_record(reminder), option=orjson.OPT_APPEND_NEWLINE) for reminder in reminders)
+        with self._lock, open(self.path, "ab") as fileobj:
+            fileobj.write(lines)
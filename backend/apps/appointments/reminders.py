@@ -0,0 +1,128 @@
+"""
+Appointment reminders.
+
+The ``schedule_appointment_reminders`` Beat task runs every
+``REMINDER_INTERVAL_SECONDS``. Each run takes the time bucket of
+appointments now due a reminder: starting from now up to
+``REMINDER_LEAD_SECONDS`` ahead, rounded up to the next run. It reads
+the ids of the scheduled/confirmed ones not reminded yet, a chunk of
+businesses per query so each is a range scan of the
+``(business, scheduled_at, id)`` index. It then queues ``send_reminders``
+tasks of ``REMINDER_BATCH_SIZE`` ids.
+
+``send_reminders`` reads its batch in one query and locks the rows
+(``skip_locked``, so overlapping runs don't wait on each other). It
+drops rows already reminded, cancelled or moved out of the bucket since.
+It hands the rest to the notifier and sets ``reminder_sent_at`` with one
+``UPDATE``, in the same transaction. A run that queues a batch twice or
+is retried therefore sends nothing twice. A notifier failure rolls the
+batch back, and the next run picks it up again.
+
+Moving an appointment clears its ``reminder_sent_at``
+(``Appointment.save``, and ``AppointmentViewSet.bulk_build`` for bulk
+updates), so it is reminded again for the new time.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.businesses.models import Business
+
+from .models import REMINDER_STATUSES, Appointment
+from .notifiers import get_notifier
+
+logger = logging.getLogger(__name__)
+
+# Businesses per selection query
+BUSINESS_CHUNK_SIZE = 500
+
+# values() lookups of a reminder, by the key it is known as
+REMINDER_FIELDS = {
+    "id": "id",
+    "scheduled_at": "scheduled_at",
+    "business": "business__name",
+    "customer": "customer__name",
+    "phone": "customer__phone",
+    "email": "customer__email",
+    "staff": "staff__name",
+    "service": "service__name",
+}
+
+
+def due_window(now=None):
+    """``(start, end)`` of the appointments due a reminder at ``now``."""
+    now = now or timezone.now()
+    interval = settings.REMINDER_INTERVAL_SECONDS
+    # Round up to the next run, so consecutive buckets meet
+    epoch = int(now.timestamp())
+    next_run = datetime.fromtimestamp(epoch - epoch % interval + interval, tz=dt_timezone.utc)
+    return now, next_run + timedelta(seconds=settings.REMINDER_LEAD_SECONDS)
+
+
+def pending(queryset, start, end):
+    return queryset.filter(
+        scheduled_at__gte=start,
+        scheduled_at__lt=end,
+        status__in=REMINDER_STATUSES,
+        reminder_sent_at__isnull=True,
+    )
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def due_reminders(start, end):
+    """Ids of appointments to remind in ``[start, end)``, in batches."""
+    business_ids = Business.objects.values_list("id", flat=True).order_by()
+    for businesses in _chunks(business_ids.iterator(), BUSINESS_CHUNK_SIZE):
+        ids = (
+            pending(Appointment.objects.filter(business_id__in=businesses), start, end)
+            .order_by()
+            .values_list("id", flat=True)
+        )
+        yield from _chunks(ids.iterator(), settings.REMINDER_BATCH_SIZE)
+
+
+def schedule_reminders(now=None):
+    """Queue a ``send_reminders`` task per batch due; returns the count queued."""
+    from .tasks import send_reminders
+
+    start, end = due_window(now)
+    queued = 0
+    for batch in due_reminders(start, end):
+        send_reminders.delay(batch, end.isoformat())
+        queued += len(batch)
+    if queued:
+        logger.info("Queued %d reminders for %s - %s", queued, start, end)
+    return queued
+
+
+def send_reminders(ids, until):
+    """Send the reminders of ``ids`` still due before ``until``; returns the count."""
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            pending(Appointment.objects.filter(id__in=ids), now, until)
+            .select_for_update(skip_locked=True, of=("self",))
+            .order_by("scheduled_at")
+            .values(*REMINDER_FIELDS.values())
+        )
+        if not rows:
+            return 0
+        reminders = [{key: row[lookup] for key, lookup in REMINDER_FIELDS.items()} for row in rows]
+        get_notifier().send(reminders)
+        Appointment.objects.filter(id__in=[row["id"] for row in rows]).update(reminder_sent_at=now)
+    return len(rows)
@@ -1,11 +1,24 @@
 from rest_framework import serializers
+from apps.businesses.bulk import PrefetchedPrimaryKeyRelatedField
+from config.fieldsets import FieldsetSerializerMixin
+from config.instrumentation import TimedSerializerMixin
 from .models import Appointment
 from apps.staff.serializers import StaffSerializer
 from apps.customers.serializers import CustomerSerializer
 from apps.services.serializers import ServiceSerializer
 
 
-class AppointmentSerializer(serializers.ModelSerializer):
+EXPANDABLE_FIELDS = {
+    "staff": "staff_details",
+    "customer": "customer_details",
+    "service": "service_details",
+}
+
+
+class AppointmentSerializer(TimedSerializerMixin, FieldsetSerializerMixin, serializers.ModelSerializer):
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+    expandable_fields = EXPANDABLE_FIELDS
+
     staff_details = StaffSerializer(source="staff", read_only=True)
     customer_details = CustomerSerializer(source="customer", read_only=True)
     service_details = ServiceSerializer(source="service", read_only=True)
@@ -24,6 +37,7 @@ class AppointmentSerializer(serializers.ModelSerializer):
             "customer_details",
             "service_details",
             "scheduled_at",
+            "ends_at",
             "status",
             "status_display",
             "price",
@@ -32,9 +46,10 @@ class AppointmentSerializer(serializers.ModelSerializer):
             "updated_at",
             "completed_at",
         ]
-        read_only_fields = ["id", "created_at", "updated_at"]
+        read_only_fields = ["id", "ends_at", "created_at", "updated_at"]
 
-    def create(self, validated_data):
+    @staticmethod
+    def fill_default_price(validated_data):
         """Auto-fill price from service if not provided."""
         if "price" not in validated_data or validated_data.get("price") is None:
             service = validated_data.get("service")
@@ -42,11 +57,21 @@ class AppointmentSerializer(serializers.ModelSerializer):
                 validated_data["price"] = service.price
             else:
                 validated_data["price"] = 0
-        return super().create(validated_data)
+        return validated_data
+
+    def create(self, validated_data):
+        return super().create(self.fill_default_price(validated_data))
+
 
+class AppointmentListSerializer(TimedSerializerMixin, FieldsetSerializerMixin, serializers.ModelSerializer):
+    """Lighter serializer for list views; nested details only on ?expand="""
 
-class AppointmentListSerializer(serializers.ModelSerializer):
-    """Lighter serializer for list views"""
+    expandable_fields = EXPANDABLE_FIELDS
+    default_expand = ()
+
+    staff_details = StaffSerializer(source="staff", read_only=True)
+    customer_details = CustomerSerializer(source="customer", read_only=True)
+    service_details = ServiceSerializer(source="service", read_only=True)
 
     staff_name = serializers.CharField(source="staff.name", read_only=True)
     customer_name = serializers.CharField(source="customer.name", read_only=True)
@@ -64,7 +89,11 @@ class AppointmentListSerializer(serializers.ModelSerializer):
             "customer_name",
             "service",
             "service_name",
+            "staff_details",
+            "customer_details",
+            "service_details",
             "scheduled_at",
+            "ends_at",
             "status",
             "status_display",
             "price",
@@ -0,0 +1,20 @@
+from celery import shared_task
+
+from . import reminders
+
+
+@shared_task(ignore_result=True)
+def schedule_appointment_reminders():
+    """Queue the reminders due in the current bucket."""
+    return reminders.schedule_reminders()
+
+
+@shared_task(
+    ignore_result=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def send_reminders(ids, until):
+    """Send one batch of reminders."""
+    return reminders.send_reminders(ids, until)
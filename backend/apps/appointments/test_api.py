@@ -1,9 +1,14 @@
 """API tests for Appointment endpoints"""
 
+import importlib
+import json
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
 from datetime import datetime, timedelta
+from django.utils import timezone
+from apps.appointments.models import Appointment
 
 
 @pytest.mark.django_db
@@ -52,3 +57,280 @@ class TestAppointmentAPI:
         assert "staff_details" in response.data
         assert "customer_details" in response.data
         assert "service_details" in response.data
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestAppointmentKeysetPagination:
+    """Test cursor pagination on the appointment list"""
+
+    @pytest.fixture
+    def appointments(self, business, staff, customer, service):
+        from conftest import AppointmentFactory
+        from django.utils import timezone
+
+        base = timezone.now()
+        # Two rows share a timestamp so the id tie-breaker is exercised
+        times = [base - timedelta(hours=i // 2) for i in range(7)]
+        return [
+            AppointmentFactory(
+                business=business,
+                staff=staff,
+                customer=customer,
+                service=service,
+                scheduled_at=when,
+            )
+            for when in times
+        ]
+
+    def _walk(self, client, url, params):
+        pages = []
+        response = client.get(url, params)
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            pages.append(response.data)
+            if not response.data["next"]:
+                return pages
+            response = client.get(response.data["next"])
+
+    def test_pages_cover_all_rows_in_order(self, authenticated_client, appointments):
+        """Test following next cursors visits every row exactly once"""
+        url = reverse("appointment-list")
+        pages = self._walk(authenticated_client, url, {"page_size": 3})
+
+        seen = [row["id"] for page in pages for row in page["results"]]
+        expected = [a.id for a in sorted(appointments, key=lambda a: (a.scheduled_at, a.id), reverse=True)]
+        assert seen == expected
+        assert len(pages) == 3
+        assert "count" not in pages[0]
+        assert pages[0]["previous"] is None
+
+    def test_previous_cursor_returns_prior_page(self, authenticated_client, appointments):
+        """Test previous cursor walks back to the same rows"""
+        url = reverse("appointment-list")
+        first = authenticated_client.get(url, {"page_size": 3}).data
+        second = authenticated_client.get(first["next"]).data
+
+        back = authenticated_client.get(second["previous"]).data
+
+        assert [r["id"] for r in back["results"]] == [r["id"] for r in first["results"]]
+        assert back["previous"] is None
+
+    def test_invalid_cursor(self, authenticated_client, appointment):
+        """Test a tampered cursor is rejected"""
+        url = reverse("appointment-list")
+        response = authenticated_client.get(url, {"cursor": "garbage"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize(
+        "position",
+        [["not-a-date", "x"], ["2030-01-01T10:00:00Z", "x"], [None, 1], [[], {}]],
+    )
+    def test_cursor_with_bad_values(self, authenticated_client, appointment, position):
+        """Test well-formed cursors with unusable values are rejected"""
+        from config.pagination import encode_cursor
+
+        response = authenticated_client.get(reverse("appointment-list"), {"cursor": encode_cursor(position)})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestDoubleBooking:
+    """Test overlapping bookings for one staff member are rejected"""
+
+    @pytest.fixture
+    def payload(self, business, staff, customer, service, appointment):
+        return {
+            "business": str(business.id),
+            "staff": staff.id,
+            "customer": customer.id,
+            "service": service.id,
+            "scheduled_at": appointment.scheduled_at.isoformat(),
+        }
+
+    def test_ends_at_follows_service_duration(self, appointment, service):
+        """Test the stored end time is start plus service duration"""
+        assert appointment.ends_at == appointment.scheduled_at + timedelta(minutes=service.duration)
+
+    def test_overlapping_create_conflicts(self, authenticated_client, payload):
+        """Test booking a taken slot returns 409"""
+        url = reverse("appointment-list")
+        start = datetime.fromisoformat(payload["scheduled_at"])
+        payload["scheduled_at"] = (start + timedelta(minutes=15)).isoformat()
+
+        response = authenticated_client.post(url, payload)
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data["conflict"] is not None
+
+    def test_back_to_back_allowed(self, authenticated_client, payload, appointment):
+        """Test a booking starting when the previous one ends is accepted"""
+        url = reverse("appointment-list")
+        payload["scheduled_at"] = appointment.ends_at.isoformat()
+
+        response = authenticated_client.post(url, payload)
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_cancelled_appointment_frees_slot(self, authenticated_client, payload, appointment):
+        """Test cancelled bookings do not block the chair"""
+        appointment.status = "cancelled"
+        appointment.save()
+
+        response = authenticated_client.post(reverse("appointment-list"), payload)
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_move_onto_taken_slot_conflicts(self, authenticated_client, payload, appointment):
+        """Test rescheduling onto another booking returns 409"""
+        payload["scheduled_at"] = appointment.ends_at.isoformat()
+        other = authenticated_client.post(reverse("appointment-list"), payload)
+        url = reverse("appointment-detail", kwargs={"pk": other.data["id"]})
+
+        response = authenticated_client.patch(url, {"scheduled_at": appointment.scheduled_at.isoformat()})
+
+        assert response.status_code == status.HTTP_409_CONFLICT
+
+    def test_update_without_time_change_skips_check(self, authenticated_client, appointment):
+        """Test editing notes is allowed even next to a legacy overlap"""
+        Appointment.objects.create(
+            business=appointment.business,
+            staff=appointment.staff,
+            customer=appointment.customer,
+            service=appointment.service,
+            scheduled_at=appointment.scheduled_at,
+            price=appointment.price,
+        )
+        url = reverse("appointment-detail", kwargs={"pk": appointment.id})
+
+        response = authenticated_client.patch(url, {"notes": "Beard trim too"})
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_migration_finds_legacy_double_bookings(self, appointment):
+        """Test the pre-constraint check lists the later booking of each overlap"""
+        from django.apps import apps
+
+        migration = importlib.import_module("apps.appointments.migrations.0005_no_overlap_constraint")
+
+        def book(minutes, status="scheduled"):
+            return Appointment.objects.create(
+                business=appointment.business,
+                staff=appointment.staff,
+                customer=appointment.customer,
+                service=appointment.service,
+                scheduled_at=appointment.scheduled_at + timedelta(minutes=minutes),
+                status=status,
+                price=appointment.price,
+            )
+
+        overlap = book(10)
+        book(5, status="cancelled")
+        book(24 * 60)
+
+        conflicts = migration.double_bookings(apps.get_model("appointments", "Appointment"))
+
+        assert [pk for pk, _, _ in conflicts] == [overlap.pk]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestBulkAppointments:
+    """Test the list-body bulk appointment endpoint"""
+
+    def row(self, business, staff, customer, service, start):
+        return {
+            "business": str(business.id),
+            "staff": staff.id,
+            "customer": customer.id,
+            "service": service.id,
+            "scheduled_at": start.isoformat(),
+        }
+
+    def test_bulk_create(
+        self,
+        authenticated_client,
+        business,
+        staff,
+        customer,
+        service,
+        django_assert_max_num_queries,
+    ):
+        """Test bulk rows get default prices and stored end times"""
+        start = timezone.now().replace(microsecond=0) + timedelta(days=2)
+        rows = [self.row(business, staff, customer, service, start + timedelta(minutes=30 * i)) for i in range(50)]
+
+        with django_assert_max_num_queries(12):
+            response = authenticated_client.post(reverse("appointment-bulk"), rows, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        created = Appointment.objects.get(pk=response.data["results"][0]["id"])
+        assert created.price == service.price
+        assert created.ends_at == start + timedelta(minutes=service.duration)
+
+    def test_bulk_create_rejects_overlaps(self, authenticated_client, business, staff, customer, service, appointment):
+        """Test overlaps with stored and in-batch bookings are per-row errors"""
+        later = appointment.ends_at + timedelta(hours=2)
+        rows = [
+            self.row(business, staff, customer, service, appointment.scheduled_at),
+            self.row(business, staff, customer, service, later),
+            self.row(business, staff, customer, service, later + timedelta(minutes=5)),
+        ]
+
+        response = authenticated_client.post(reverse("appointment-bulk"), rows, format="json")
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        results = response.data["results"]
+        assert [r["status"] for r in results] == ["error", "created", "error"]
+        assert results[0]["errors"]["conflict"] == appointment.id
+        assert results[2]["errors"]["conflict_index"] == 1
+
+    def test_bulk_update_moves_booking(self, authenticated_client, appointment):
+        """Test bulk updates recompute the stored end time"""
+        start = appointment.scheduled_at + timedelta(days=1)
+        rows = [{"id": appointment.id, "scheduled_at": start.isoformat()}]
+
+        response = authenticated_client.patch(reverse("appointment-bulk"), rows, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        before = appointment.scheduled_at
+        appointment.refresh_from_db()
+        assert appointment.scheduled_at.date() == (before + timedelta(days=1)).date()
+        assert appointment.ends_at == appointment.scheduled_at + timedelta(minutes=appointment.service.duration)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestAppointmentExport:
+    """Test the streaming appointment export"""
+
+    def test_csv_export(self, authenticated_client, business, appointment):
+        """Test CSV export streams a header and one line per appointment"""
+        url = reverse("appointment-export")
+
+        response = authenticated_client.get(url, {"business": str(business.id)})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"].startswith("text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        assert lines[0].startswith("id,business_id,scheduled_at,ends_at")
+        assert len(lines) == 2
+        assert appointment.customer.name in lines[1]
+
+    def test_jsonl_export(self, authenticated_client, appointment):
+        """Test JSON Lines export yields one object per line"""
+        url = reverse("appointment-export")
+
+        response = authenticated_client.get(url, {"output": "jsonl"})
+
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        assert [row["id"] for row in rows] == [appointment.id]
+        assert rows[0]["staff_name"] == appointment.staff.name
+
+    def test_unknown_output_rejected(self, authenticated_client):
+        """Test unsupported export formats return 400"""
+        url = reverse("appointment-export")
+        response = authenticated_client.get(url, {"output": "xlsx"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,94 @@
+"""Tests for the compiled appointment list serializer"""
+
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+
+from apps.appointments.models import Appointment
+from apps.appointments.serializers import AppointmentListSerializer, AppointmentSerializer
+from config.fastlist import compile_serializer
+from config.renderers import ORJSONRenderer
+
+
+@pytest.mark.unit
+class TestCompileSerializer:
+    """Test which serializers compile"""
+
+    def test_list_serializer_compiles(self):
+        """Test flat fields map to values() lookups"""
+        compiled = compile_serializer(AppointmentListSerializer)
+
+        assert "staff__name" in compiled.lookups
+        assert "status" in compiled.lookups
+        assert "staff_details" not in dict((n, l) for n, l, _ in compiled.spec)
+
+    def test_nested_serializer_does_not_compile(self):
+        """Test serializers rendering nested objects fall back"""
+        assert compile_serializer(AppointmentSerializer) is None
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestCompiledList:
+    """Test the compiled list matches the serializer output"""
+
+    def test_list_matches_serializer(self, authenticated_client, appointment):
+        """Test every field renders exactly as AppointmentListSerializer does"""
+        appointment.price = Decimal("12.5")
+        appointment.status = "confirmed"
+        appointment.save()
+        url = reverse("appointment-list")
+
+        response = authenticated_client.get(url, {"business": appointment.business_id})
+
+        assert response.status_code == status.HTTP_200_OK
+        expected = AppointmentListSerializer(Appointment.objects.get(pk=appointment.pk)).data
+        assert json.loads(response.content)["results"] == [json.loads(JSONRenderer().render(expected))]
+
+    def test_cursor_pages_through_rows(self, authenticated_client, appointment, business, staff, customer, service):
+        """Test keyset cursors work on values() rows"""
+        later = Appointment.objects.create(
+            business=business,
+            staff=staff,
+            customer=customer,
+            service=service,
+            scheduled_at=appointment.scheduled_at + timedelta(days=1),
+            price=service.price,
+        )
+        url = reverse("appointment-list")
+
+        first = authenticated_client.get(url, {"business": business.id, "page_size": 1})
+        second = authenticated_client.get(first.data["next"])
+
+        assert [row["id"] for row in first.data["results"]] == [later.id]
+        assert [row["id"] for row in second.data["results"]] == [appointment.id]
+
+    def test_fieldset_request_uses_serializer(self, authenticated_client, appointment):
+        """Test ?expand= still goes through the serializer"""
+        url = reverse("appointment-list")
+
+        response = authenticated_client.get(url, {"business": appointment.business_id, "expand": "staff"})
+
+        assert response.data["results"][0]["staff_details"]["id"] == appointment.staff_id
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+class TestORJSONRenderer:
+    """Test the orjson renderer matches JSONRenderer"""
+
+    def test_output_matches_json_renderer(self, appointment):
+        """Test datetimes, decimals and UUIDs encode like DRF's encoder"""
+        data = {
+            "at": appointment.scheduled_at,
+            "price": Decimal("10.00"),
+            "id": appointment.business_id,
+            "nested": [1, "two", None],
+        }
+
+        assert json.loads(ORJSONRenderer().render(data)) == json.loads(JSONRenderer().render(data))
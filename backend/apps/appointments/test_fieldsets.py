@@ -0,0 +1,81 @@
+"""Tests for ?fields= and ?expand= on appointment and customer endpoints"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+
+def select_sql(queries):
+    return [q["sql"] for q in queries if q["sql"].lstrip().upper().startswith("SELECT")]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestSparseFieldsets:
+    """Test sparse fieldsets trim payloads and column reads"""
+
+    def test_list_fields_trim_payload_and_columns(self, authenticated_client, appointment):
+        """Test only the requested columns are selected and rendered"""
+        url = reverse("appointment-list")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get(url, {"business": appointment.business_id, "fields": "id,status"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == [{"id": appointment.id, "status": appointment.status}]
+        page_sql = [sql for sql in select_sql(queries) if "LIMIT" in sql][-1]
+        assert '"notes"' not in page_sql
+        assert "JOIN" not in page_sql
+
+    def test_list_expand_nests_details(self, authenticated_client, appointment):
+        """Test ?expand= adds nested objects the list leaves out by default"""
+        url = reverse("appointment-list")
+        params = {"business": appointment.business_id}
+
+        default = authenticated_client.get(url, params).data["results"][0]
+        expanded = authenticated_client.get(url, {**params, "expand": "customer"}).data["results"][0]
+
+        assert "customer_details" not in default
+        assert expanded["customer_details"]["name"] == appointment.customer.name
+        assert "staff_details" not in expanded
+
+    def test_dotted_fields_trim_nested(self, authenticated_client, appointment):
+        """Test a dotted path renders only part of a nested object"""
+        url = reverse("appointment-detail", args=[appointment.id])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get(url, {"fields": "id,customer_details.name"})
+
+        assert response.data == {
+            "id": appointment.id,
+            "customer_details": {"name": appointment.customer.name},
+        }
+        assert not any('"preferences"' in sql for sql in select_sql(queries))
+
+    def test_detail_expand_limits_nesting(self, authenticated_client, appointment):
+        """Test ?expand= on detail keeps only the named nested objects"""
+        url = reverse("appointment-detail", args=[appointment.id])
+
+        response = authenticated_client.get(url, {"expand": "staff"})
+
+        assert "staff_details" in response.data
+        assert "customer_details" not in response.data
+        assert "service_details" not in response.data
+
+    def test_unknown_names_rejected(self, authenticated_client, appointment):
+        """Test unknown fields or expansions are a 400"""
+        url = reverse("appointment-detail", args=[appointment.id])
+
+        assert authenticated_client.get(url, {"fields": "id,nope"}).status_code == status.HTTP_400_BAD_REQUEST
+        assert authenticated_client.get(url, {"expand": "owner"}).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_writes_ignore_fieldsets(self, authenticated_client, business):
+        """Test ?fields= does not drop writable fields on create"""
+        url = reverse("customer-list") + "?fields=id"
+
+        response = authenticated_client.post(url, {"business": str(business.id), "name": "New", "phone": "+1555000999"})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["name"] == "New"
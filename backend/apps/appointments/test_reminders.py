@@ -0,0 +1,212 @@
+"""Tests for the appointment reminder pipeline"""
+
+import io
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.appointments import reminders, tasks
+from apps.appointments.models import Appointment
+from apps.appointments.notifiers import ConsoleNotifier
+
+
+@pytest.fixture
+def book(business, staff, customer, service):
+    def book(hours_ahead, status="scheduled", **kwargs):
+        return Appointment.objects.create(
+            business=business,
+            staff=staff,
+            customer=customer,
+            service=service,
+            scheduled_at=timezone.now() + timedelta(hours=hours_ahead),
+            status=status,
+            price=Decimal("25.00"),
+            **kwargs,
+        )
+
+    return book
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    """Capture the send_reminders batches instead of queueing them"""
+    batches = []
+    monkeypatch.setattr(tasks.send_reminders, "delay", lambda ids, until: batches.append((ids, until)))
+    return batches
+
+
+@pytest.fixture
+def outbox(settings, tmp_path):
+    """Deliver reminders to a FileNotifier file; returns its records"""
+    path = tmp_path / "reminders.jsonl"
+    settings.REMINDER_NOTIFIER = "apps.appointments.notifiers.FileNotifier"
+    settings.REMINDER_FILE_PATH = str(path)
+
+    def read():
+        if not path.exists():
+            return []
+        return [json.loads(line) for line in path.read_text().splitlines()]
+
+    return read
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestScheduleReminders:
+    """Test selecting the appointments due a reminder"""
+
+    def test_queues_due_appointments_in_batches(self, book, queued, settings):
+        """Test only pending, upcoming appointments in the bucket are queued"""
+        settings.REMINDER_LEAD_SECONDS = 24 * 60 * 60
+        settings.REMINDER_BATCH_SIZE = 2
+        due = [book(1), book(5, status="confirmed"), book(23)]
+        book(2, status="completed")
+        book(3, status="cancelled")
+        book(4, reminder_sent_at=timezone.now())
+        book(30)
+        book(-1)
+
+        assert reminders.schedule_reminders() == 3
+
+        assert [len(ids) for ids, _ in queued] == [2, 1]
+        assert {pk for ids, _ in queued for pk in ids} == {a.pk for a in due}
+
+    def test_selection_queries(self, business, staff, customer, service, queued, query_budget):
+        """Test selection runs one query per chunk of businesses"""
+        start = timezone.now() + timedelta(hours=1)
+        Appointment.objects.bulk_create(
+            Appointment(
+                business=business,
+                staff=staff,
+                customer=customer,
+                service=service,
+                scheduled_at=start + timedelta(minutes=minutes),
+                ends_at=start + timedelta(minutes=minutes + 30),
+                price=Decimal("25.00"),
+            )
+            for minutes in range(0, 50 * 10, 10)
+        )
+
+        with query_budget(2):
+            assert reminders.schedule_reminders() == 50
+
+    def test_bucket_rounds_up_to_next_run(self, settings):
+        """Test consecutive runs cover adjacent buckets"""
+        settings.REMINDER_INTERVAL_SECONDS = 300
+        settings.REMINDER_LEAD_SECONDS = 3600
+        now = timezone.now().replace(minute=7, second=30, microsecond=0)
+
+        start, end = reminders.due_window(now)
+
+        assert start == now
+        assert end == now.replace(minute=10, second=0) + timedelta(hours=1)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestSendReminders:
+    """Test delivering a batch of reminders"""
+
+    def test_sends_and_marks_once(self, book, outbox, customer):
+        """Test a batch is delivered once, however often it runs"""
+        appointments = [book(1), book(2)]
+        ids = [a.pk for a in appointments]
+        until = timezone.now() + timedelta(days=1)
+
+        assert reminders.send_reminders(ids, until) == 2
+        assert reminders.send_reminders(ids, until) == 0
+
+        records = outbox()
+        assert [r["appointment"] for r in records] == ids
+        assert records[0]["phone"] == customer.phone
+        assert customer.name in records[0]["message"]
+        for appointment in appointments:
+            appointment.refresh_from_db()
+            assert appointment.reminder_sent_at is not None
+
+    def test_skips_appointments_changed_since_queued(self, book, outbox):
+        """Test cancelled or moved appointments are not reminded"""
+        cancelled, moved = book(1), book(2)
+        cancelled.status = "cancelled"
+        cancelled.save()
+        moved.scheduled_at += timedelta(days=3)
+        moved.save()
+
+        sent = reminders.send_reminders([cancelled.pk, moved.pk], timezone.now() + timedelta(days=1))
+
+        assert sent == 0
+        assert outbox() == []
+
+    def test_notifier_failure_leaves_batch_pending(self, book, settings):
+        """Test a failed delivery is not marked as sent"""
+        settings.REMINDER_NOTIFIER = "apps.appointments.test_reminders.BrokenNotifier"
+        appointment = book(1)
+
+        with pytest.raises(ConnectionError):
+            reminders.send_reminders([appointment.pk], timezone.now() + timedelta(days=1))
+
+        appointment.refresh_from_db()
+        assert appointment.reminder_sent_at is None
+
+    def test_batch_queries(self, book, outbox, query_budget):
+        """Test a batch costs a fixed number of queries"""
+        ids = [book(hours).pk for hours in range(1, 21)]
+
+        with query_budget(4):
+            assert reminders.send_reminders(ids, timezone.now() + timedelta(days=1)) == 20
+
+    def test_moving_clears_marker(self, book):
+        """Test a rescheduled appointment is reminded again"""
+        appointment = book(1, reminder_sent_at=timezone.now())
+
+        appointment.scheduled_at += timedelta(hours=2)
+        appointment.save(update_fields=["scheduled_at"])
+
+        appointment.refresh_from_db()
+        assert appointment.reminder_sent_at is None
+
+    def test_bulk_move_clears_marker(self, authenticated_client, book):
+        """Test moving through the bulk endpoint also clears the marker"""
+        moved = book(1, reminder_sent_at=timezone.now())
+        renamed = book(5, reminder_sent_at=timezone.now())
+        rows = [
+            {
+                "id": moved.pk,
+                "scheduled_at": (moved.scheduled_at + timedelta(hours=2)).isoformat(),
+            },
+            {"id": renamed.pk, "notes": "Bring a photo"},
+        ]
+
+        response = authenticated_client.patch(reverse("appointment-bulk"), rows, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        moved.refresh_from_db()
+        renamed.refresh_from_db()
+        assert moved.reminder_sent_at is None
+        assert renamed.reminder_sent_at is not None
+
+    def test_console_notifier(self, book):
+        """Test the console backend writes one line per reminder"""
+        appointment = book(1)
+        stream = io.StringIO()
+        row = {
+            key: value
+            for key, value in zip(
+                reminders.REMINDER_FIELDS,
+                Appointment.objects.filter(pk=appointment.pk).values_list(*reminders.REMINDER_FIELDS.values()).get(),
+            )
+        }
+
+        ConsoleNotifier(stream).send([row])
+
+        assert stream.getvalue().startswith(f"[reminder] {row['phone']}: Hi ")
+
+
+class BrokenNotifier:
+    def send(self, reminders):
+        raise ConnectionError("provider unavailable")
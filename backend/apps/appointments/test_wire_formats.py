@@ -0,0 +1,45 @@
+"""Tests for the orjson and MessagePack renderers and parsers"""
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestWireFormats:
+    """Test content negotiation on the API"""
+
+    def test_json_is_default(self, authenticated_client, appointment):
+        """Test responses without an Accept header are JSON"""
+        url = reverse("appointment-list")
+
+        response = authenticated_client.get(url, {"business": appointment.business_id})
+
+        assert response["Content-Type"] == "application/json"
+        assert response.json()["results"][0]["id"] == appointment.id
+
+    def test_invalid_json_body(self, authenticated_client, business):
+        """Test malformed JSON is a 400, not a server error"""
+        url = reverse("customer-list")
+
+        response = authenticated_client.post(url, data=b"{not json", content_type="application/json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "JSON parse error" in response.data["detail"]
+
+    def test_msgpack_round_trip(self, authenticated_client, business):
+        """Test MessagePack bodies are accepted and returned on request"""
+        msgpack = pytest.importorskip("msgpack")
+        url = reverse("customer-list")
+
+        response = authenticated_client.post(
+            url,
+            data=msgpack.packb({"business": str(business.id), "name": "Ana", "phone": "3001234567"}),
+            content_type="application/msgpack",
+            HTTP_ACCEPT="application/msgpack",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response["Content-Type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content)["name"] == "Ana"
@@ -1,14 +1,75 @@
 from rest_framework import viewsets
+from apps.businesses.bulk import BulkWriteMixin
+from apps.businesses.tenancy import TenantScopedMixin
+from apps.customers.stats import recompute_customer_stats
+from apps.reports.rollups import mark_dirty, touched_days
+from config.conditional import ConditionalGetMixin
+from config.export import ExportMixin
+from config.fastlist import CompiledListMixin
+from config.fieldsets import FieldsetViewMixin
+from config.pagination import KeysetPagination
+from .booking import find_batch_conflicts, guard_for_serializer
 from .models import Appointment
 from .serializers import AppointmentSerializer, AppointmentListSerializer
 
 
-class AppointmentViewSet(viewsets.ModelViewSet):
+class AppointmentPagination(KeysetPagination):
+    """Seek on (business_id, scheduled_at, id), newest first"""
+
+    ordering = ("-scheduled_at", "-id")
+
+
+class AppointmentViewSet(
+    BulkWriteMixin,
+    ExportMixin,
+    ConditionalGetMixin,
+    FieldsetViewMixin,
+    CompiledListMixin,
+    TenantScopedMixin,
+    viewsets.ModelViewSet,
+):
     """
-    ViewSet for Appointment CRUD operations
+    ViewSet for Appointment CRUD operations, scoped to the user's businesses
+
+    Lists are keyset-paginated: follow the opaque ``next``/``previous``
+    cursors instead of ``?page=``, and rendered from ``values()`` rows by
+    a compiled serializer. Writes that overlap another booking for
+    the same staff member are rejected with ``409 Conflict``.
+    ``/api/appointments/bulk/`` creates, updates or deletes many at once;
+    ``/api/appointments/export/`` streams them as CSV or JSON Lines.
+    ``?fields=`` and ``?expand=staff,customer,service`` shape reads.
     """
 
-    queryset = Appointment.objects.all()
+    queryset = Appointment.objects.select_related("staff", "customer", "service", "business")
+    pagination_class = AppointmentPagination
+    # Nested staff/customer/service data is rendered, so their edits count too
+    etag_fields = (
+        "updated_at",
+        "staff__updated_at",
+        "customer__updated_at",
+        "service__updated_at",
+    )
+    bulk_derived_fields = ("ends_at", "reminder_sent_at")
+    export_columns = {
+        "id": "id",
+        "business_id": "business_id",
+        "scheduled_at": "scheduled_at",
+        "ends_at": "ends_at",
+        "status": "status",
+        "price": "price",
+        "staff_id": "staff_id",
+        "staff_name": "staff__name",
+        "customer_id": "customer_id",
+        "customer_name": "customer__name",
+        "customer_phone": "customer__phone",
+        "service_id": "service_id",
+        "service_name": "service__name",
+        "notes": "notes",
+        "created_at": "created_at",
+        "completed_at": "completed_at",
+    }
+    # Walks the (business, scheduled_at, id) index
+    export_ordering = ("-scheduled_at", "-id")
     # permission_classes = [permissions.AllowAny]  # Using global settings
 
     def get_serializer_class(self):
@@ -17,8 +78,37 @@ class AppointmentViewSet(viewsets.ModelViewSet):
             return AppointmentListSerializer
         return AppointmentSerializer
 
-    def get_queryset(self):
-        """Return all appointments for development"""
-        return Appointment.objects.all().select_related(
-            "staff", "customer", "service", "business"
-        )
+    def perform_create(self, serializer):
+        with guard_for_serializer(serializer):
+            super().perform_create(serializer)
+
+    def perform_update(self, serializer):
+        with guard_for_serializer(serializer):
+            super().perform_update(serializer)
+
+    def bulk_build(self, data, instance=None):
+        if instance is None:
+            data = AppointmentSerializer.fill_default_price(data)
+        moved = instance is not None and data.get("scheduled_at", instance.scheduled_at) != instance.scheduled_at
+        appointment = super().bulk_build(data, instance)
+        appointment.ends_at = Appointment.compute_ends_at(appointment.scheduled_at, appointment.service)
+        if moved:
+            # As Appointment.save: remind again for the new time
+            appointment.reminder_sent_at = None
+        return appointment
+
+    def bulk_check(self, items):
+        return find_batch_conflicts(items)
+
+    def bulk_written(self, objects):
+        # bulk_create/bulk_update skip post_save: rebuild lifetime stats and
+        # queue the touched days for the rollups here instead
+        customers = set()
+        for appointment in objects:
+            customers.add(appointment.customer_id)
+            loaded = getattr(appointment, "_loaded_values", {})
+            customers.add(loaded.get("customer_id"))
+        customers.discard(None)
+        if customers:
+            recompute_customer_stats(customers)
+        mark_dirty(pair for obj in objects for pair in touched_days(obj))
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class BusinessesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.businesses"
+
+    def ready(self):
+        """Connect cache invalidation signals when app is ready."""
+        from .signals import connect_tenant_signals
+
+        connect_tenant_signals()
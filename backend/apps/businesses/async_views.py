@@ -0,0 +1,27 @@
+"""Async mirrors of the stats and workspace reads (see ``config.async_views``)."""
+
+from asgiref.sync import sync_to_async
+
+from config.async_views import async_api_view, get_business, json_response, not_modified
+from config.conditional import etag_matches, make_etag
+
+from .stats import get_business_stats
+from .workspace import abuild_workspace, aworkspace_validator, parse_limits
+
+
+@async_api_view
+async def business_stats(request, pk):
+    """GET /api/async/businesses/{id}/stats/"""
+    business = await get_business(request, pk)
+    return json_response(await sync_to_async(get_business_stats)(business.pk))
+
+
+@async_api_view
+async def business_workspace(request, pk):
+    """GET /api/async/businesses/{id}/workspace/ (honors If-None-Match)"""
+    business = await get_business(request, pk)
+    limits = parse_limits(request.query_params)
+    etag = make_etag(request, *await aworkspace_validator(business))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return json_response(await abuild_workspace(business, limits), etag=etag)
@@ -0,0 +1,353 @@
+"""
+List-body bulk create / update / delete for tenant ViewSets.
+
+``POST``, ``PATCH`` and ``DELETE`` on ``/api/<resource>/bulk/`` take a JSON
+array and answer with one result per row, in request order::
+
+    {"created": 2, "failed": 1, "results": [
+        {"index": 0, "status": "created", "id": 41},
+        {"index": 1, "status": "error", "errors": {"phone": ["..."]}},
+        ...
+    ]}
+
+Valid rows are written even when others fail. The whole batch is checked
+before anything is written, with a fixed number of queries:
+
+- foreign keys are resolved with one ``in_bulk`` per related field
+  (``PrefetchedPrimaryKeyRelatedField`` reads from that map);
+- ``unique`` columns are checked with one ``__in`` query per column
+  instead of one query per row;
+- rows to update are loaded with one ``in_bulk`` on the tenant queryset;
+- related rows must belong to the row's business (no extra queries).
+
+Writes go through ``bulk_create`` / ``bulk_update`` in chunks of
+``bulk_batch_size``. These skip ``Model.save()`` and ``post_save``, so the
+mixin bumps the stats cache of every business it touched itself.
+"""
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.validators import UniqueValidator
+
+from .stats import invalidate_business_stats
+from .tenancy import can_access_business, foreign_tenant_errors
+
+PREFETCH_CONTEXT_KEY = "prefetched_related"
+
+
+class PrefetchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    ``PrimaryKeyRelatedField`` that can be primed with pre-fetched objects.
+
+    When the serializer context holds ``{field_name: {pk: obj}}`` under
+    ``prefetched_related`` the lookup is a dict access; otherwise it
+    behaves exactly like the DRF field.
+    """
+
+    def to_internal_value(self, data):
+        prefetched = self.context.get(PREFETCH_CONTEXT_KEY, {}).get(self.field_name)
+        if prefetched is None:
+            return super().to_internal_value(data)
+        if self.pk_field is not None:
+            data = self.pk_field.to_internal_value(data)
+        pk = _to_pk(self.get_queryset().model, data)
+        if pk is None:
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return prefetched[pk]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+
+
+def _to_pk(model, value):
+    if isinstance(value, bool):
+        return None
+    try:
+        return model._meta.pk.to_python(value)
+    except (DjangoValidationError, TypeError, ValueError):
+        return None
+
+
+def prime_related_fields(serializer, rows):
+    """Resolve every related pk used in ``rows`` with one query per field."""
+    prefetched = {}
+    for name, field in serializer.fields.items():
+        if field.read_only or not isinstance(field, PrefetchedPrimaryKeyRelatedField):
+            continue
+        model = field.get_queryset().model
+        pks = {_to_pk(model, row.get(name)) for row in rows if row.get(name)}
+        pks.discard(None)
+        prefetched[name] = field.get_queryset().in_bulk(pks) if pks else {}
+    serializer.context[PREFETCH_CONTEXT_KEY] = prefetched
+
+
+def detach_unique_validators(serializer):
+    """
+    Pull per-row ``UniqueValidator`` checks off ``serializer``'s fields.
+
+    Returns ``{field_name: queryset}`` so the batch can be checked at once.
+    """
+    unique = {}
+    for name, field in serializer.fields.items():
+        validators = [v for v in field.validators if isinstance(v, UniqueValidator)]
+        if validators:
+            unique[name] = validators[0].queryset
+            field.validators = [v for v in field.validators if v not in validators]
+    return unique
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        end = start + size
+        yield items[start:end]
+
+
+class BulkWriteMixin:
+    """
+    Add ``/bulk/`` create, update and delete to a tenant ViewSet.
+
+    Subclasses may override ``bulk_build`` to fill in values ``save()``
+    would normally compute, and ``bulk_check`` for cross-row rules such as
+    double-booking. Both run on the whole batch.
+    """
+
+    bulk_max_rows = 10000
+    bulk_batch_size = 500
+    # Columns computed by ``bulk_build`` that must be written on update
+    bulk_derived_fields = ()
+
+    @action(detail=False, methods=["post", "patch", "delete"], url_path="bulk")
+    def bulk(self, request):
+        """
+        Bulk write endpoint.
+
+        POST   /api/<resource>/bulk/   [{...}, {...}]
+        PATCH  /api/<resource>/bulk/   [{"id": 1, ...}, ...]
+        DELETE /api/<resource>/bulk/   [1, 2, 3]
+        """
+        rows = request.data
+        if not isinstance(rows, list):
+            raise ValidationError({"detail": "Expected a list of items."})
+        if len(rows) > self.bulk_max_rows:
+            raise ValidationError({"detail": f"At most {self.bulk_max_rows} items per request."})
+        if request.method == "DELETE":
+            return self.bulk_destroy(rows)
+        return self.bulk_write(rows, partial=request.method == "PATCH")
+
+    # Hooks
+
+    def bulk_build(self, data, instance=None):
+        """Model instance for validated ``data`` (applied onto ``instance``)."""
+        if instance is None:
+            return self.get_queryset().model(**data)
+        for name, value in data.items():
+            setattr(instance, name, value)
+        return instance
+
+    def bulk_check(self, items):
+        """
+        Cross-row validation inside the write transaction.
+
+        ``items`` is ``[(index, instance), ...]``; return ``{index: errors}``
+        for the rows that must not be written.
+        """
+        return {}
+
+    def bulk_written(self, objects):
+        """
+        Called inside the write transaction with the rows just written.
+
+        Use it to maintain whatever ``post_save`` receivers would have.
+        """
+
+    # Implementation
+
+    def bulk_write(self, rows, partial):
+        results = [None] * len(rows)
+        instances = {}
+        if partial:
+            instances = self._bulk_load_targets(rows, results)
+
+        serializer = self.get_serializer(partial=partial)
+        objects = [row for row in rows if isinstance(row, dict)]
+        prime_related_fields(serializer, objects)
+        unique = detach_unique_validators(serializer)
+
+        validated = []
+        for index, row in enumerate(rows):
+            if results[index] is not None:
+                continue
+            if not isinstance(row, dict):
+                results[index] = _error(index, {"detail": "Expected an object."})
+                continue
+            try:
+                data = serializer.run_validation(row)
+            except ValidationError as error:
+                results[index] = _error(index, error.detail)
+                continue
+            validated.append((index, data, instances.get(index)))
+
+        self._bulk_check_unique(unique, validated, results)
+
+        model = self.get_queryset().model
+        # Access is checked once per business, not once per row
+        access = {}
+        items = []
+        for index, data, instance in validated:
+            if results[index] is not None:
+                continue
+            # Related rows come from unscoped querysets: keep them in-tenant
+            errors = foreign_tenant_errors(model, data, instance)
+            if errors:
+                results[index] = _error(index, errors)
+                continue
+            obj = self.bulk_build(data, instance)
+            if obj.business_id not in access:
+                access[obj.business_id] = can_access_business(self.request.user, obj.business_id)
+            if not access[obj.business_id]:
+                results[index] = _error(index, {"business": ["You do not have access to this business."]})
+                continue
+            items.append((index, obj, set(data)))
+
+        with transaction.atomic():
+            for index, errors in self.bulk_check([(index, obj) for index, obj, _ in items]).items():
+                results[index] = _error(index, errors)
+            items = [item for item in items if results[item[0]] is None]
+            if partial:
+                self._bulk_update(items)
+            else:
+                self._bulk_create(items)
+            self.bulk_written([obj for _, obj, _ in items])
+
+        outcome = "updated" if partial else "created"
+        for index, obj, _ in items:
+            results[index] = {"index": index, "status": outcome, "id": obj.pk}
+        self._bulk_invalidate(obj for _, obj, _ in items)
+        return _bulk_response(
+            results,
+            outcome,
+            status.HTTP_200_OK if partial else status.HTTP_201_CREATED,
+        )
+
+    def _bulk_load_targets(self, rows, results):
+        model = self.get_queryset().model
+        wanted = {}
+        for index, row in enumerate(rows):
+            pk = _to_pk(model, row.get("id")) if isinstance(row, dict) else None
+            if pk is None:
+                results[index] = _error(index, {"id": ["This field is required."]})
+            else:
+                wanted[index] = pk
+        found = self.get_queryset().in_bulk(set(wanted.values()))
+        instances = {}
+        for index, pk in wanted.items():
+            if pk in found:
+                instances[index] = found[pk]
+            else:
+                results[index] = _error(index, {"id": ["Not found."]})
+        return instances
+
+    def _bulk_check_unique(self, unique, validated, results):
+        for name, queryset in unique.items():
+            claimed = {}
+            for index, data, instance in validated:
+                value = data.get(name)
+                if value is None or results[index] is not None:
+                    continue
+                if value in claimed:
+                    results[index] = _error(index, {name: ["Duplicate value within this request."]})
+                else:
+                    claimed[value] = instance.pk if instance is not None else None
+            taken = dict(queryset.filter(**{f"{name}__in": list(claimed)}).values_list(name, "pk"))
+            for index, data, instance in validated:
+                value = data.get(name)
+                if results[index] is not None or value not in taken:
+                    continue
+                if instance is None or taken[value] != instance.pk:
+                    field = queryset.model._meta.get_field(name)
+                    results[index] = _error(
+                        index,
+                        {
+                            name: [
+                                f"{queryset.model._meta.verbose_name} with this "
+                                f"{field.verbose_name} already exists."
+                            ]
+                        },
+                    )
+
+    def _bulk_create(self, items):
+        model = self.get_queryset().model
+        for chunk in _chunks(items, self.bulk_batch_size):
+            model.objects.bulk_create([obj for _, obj, _ in chunk])
+
+    def _bulk_update(self, items):
+        model = self.get_queryset().model
+        touched = set(self.bulk_derived_fields)
+        for _, _, changed in items:
+            touched |= changed
+        if any(field.name == "updated_at" for field in model._meta.fields):
+            now = timezone.now()
+            for _, obj, _ in items:
+                obj.updated_at = now
+            touched.add("updated_at")
+        if not items:
+            return
+        model.objects.bulk_update(
+            [obj for _, obj, _ in items],
+            sorted(touched),
+            batch_size=self.bulk_batch_size,
+        )
+
+    def _bulk_invalidate(self, objects):
+        for business_id in {obj.business_id for obj in objects}:
+            invalidate_business_stats(business_id)
+
+    def bulk_destroy(self, pks):
+        model = self.get_queryset().model
+        results = []
+        wanted = {}
+        for index, value in enumerate(pks):
+            pk = _to_pk(model, value)
+            if pk is None:
+                results.append(_error(index, {"id": ["Invalid id."]}))
+            else:
+                wanted[index] = pk
+                results.append(None)
+
+        found = dict(self.get_queryset().filter(pk__in=set(wanted.values())).values_list("pk", "business_id"))
+        with transaction.atomic():
+            for chunk in _chunks(list(found), self.bulk_batch_size):
+                model.objects.filter(pk__in=chunk).delete()
+
+        for index, pk in wanted.items():
+            if pk in found:
+                results[index] = {"index": index, "status": "deleted", "id": pk}
+            else:
+                results[index] = _error(index, {"id": ["Not found."]})
+        for business_id in set(found.values()):
+            invalidate_business_stats(business_id)
+        return _bulk_response(results, "deleted", status.HTTP_200_OK)
+
+
+def _error(index, errors):
+    return {"index": index, "status": "error", "errors": errors}
+
+
+def _bulk_response(results, outcome, success_status):
+    failed = sum(1 for result in results if result["status"] == "error")
+    succeeded = len(results) - failed
+    if not failed:
+        response_status = success_status
+    elif succeeded:
+        response_status = status.HTTP_207_MULTI_STATUS
+    else:
+        response_status = status.HTTP_400_BAD_REQUEST
+    return Response(
+        {outcome: succeeded, "failed": failed, "results": results},
+        status=response_status,
+    )
@@ -0,0 +1,110 @@
+"""
+Per-business cache namespaces with version-based invalidation.
+
+Every cached value for a business lives under a key that embeds the
+current version of its namespace. Invalidating is a single ``set`` of a
+new version: old entries simply stop being addressed and age out, so
+there is no need to enumerate or delete keys.
+
+The cache is an optimization only. If Redis is unavailable the helpers
+log and fall through to computing the value.
+"""
+
+import hashlib
+import logging
+import time
+
+from django.core.cache import cache
+
+from config.instrumentation import record_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 300
+
+
+def _version_key(namespace, business_id):
+    return f"bizcache:{namespace}:{business_id}:version"
+
+
+def get_version(namespace, business_id):
+    """Current version token for a business namespace."""
+    key = _version_key(namespace, business_id)
+    version = cache.get(key)
+    if version is None:
+        # A timestamp rather than a counter, so a flushed cache can never
+        # hand out a version that was already used for older content.
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace, business_id):
+    """Invalidate everything cached for a business namespace."""
+    try:
+        cache.set(_version_key(namespace, business_id), time.time_ns(), None)
+    except Exception:
+        logger.warning("Could not invalidate %s cache for %s", namespace, business_id)
+
+
+def make_key(namespace, business_id, *parts):
+    """Versioned cache key for a value in a business namespace."""
+    version = get_version(namespace, business_id)
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode(), usedforsecurity=False).hexdigest()
+    return f"bizcache:{namespace}:{business_id}:{version}:{digest}"
+
+
+def get_or_compute(namespace, business_id, parts, compute, timeout=DEFAULT_TIMEOUT):
+    """
+    Read-through cache lookup.
+
+    Returns ``(value, hit)`` where ``hit`` tells whether the value came
+    from the cache.
+    """
+    try:
+        key = make_key(namespace, business_id, *parts)
+        value = cache.get(key)
+    except Exception:
+        logger.warning("Cache unavailable, computing %s directly", namespace)
+        return compute(), False
+
+    record_cache_lookup(namespace, value is not None)
+    if value is not None:
+        return value, True
+
+    value = compute()
+    try:
+        cache.set(key, value, timeout)
+    except Exception:
+        logger.warning("Could not store %s cache for %s", namespace, business_id)
+    return value, False
+
+
+def _counter_key(namespace, outcome):
+    return f"bizcache:{namespace}:{outcome}"
+
+
+def record_lookup(namespace, hit):
+    """Count a hit or miss for a namespace, shared across workers."""
+    key = _counter_key(namespace, "hits" if hit else "misses")
+    try:
+        cache.add(key, 0, None)
+        cache.incr(key)
+    except Exception:
+        pass
+
+
+def lookup_counters(namespace):
+    """Hit/miss counters and hit ratio for a namespace."""
+    try:
+        hits = cache.get(_counter_key(namespace, "hits")) or 0
+        misses = cache.get(_counter_key(namespace, "misses")) or 0
+    except Exception:
+        hits = misses = 0
+    total = hits + misses
+    return {
+        "namespace": namespace,
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / total, 4) if total else None,
+    }
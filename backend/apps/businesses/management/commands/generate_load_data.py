@@ -0,0 +1,136 @@
+import argparse
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from apps.businesses.models import Business
+from apps.businesses.synthetic import DEFAULT_BATCH_SIZE, business_id, generate_business, phone_prefix
+from apps.customers.models import Customer
+
+COUNTS = ["businesses", "staff", "services", "customers", "appointments"]
+
+# Customer phones have 5 digits for the shop and 6 for the customer
+MAX_BUSINESSES = 10**5
+MAX_CUSTOMERS = 10**6
+
+
+def _anchor_date(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Not a YYYY-MM-DD date: {value!r}")
+
+
+def _generate_in_process(index, **options):
+    try:
+        return generate_business(index, **options)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic shops, customers and appointments for load testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--businesses", type=int, default=2)
+        parser.add_argument("--staff", type=int, default=3, help="Staff per shop")
+        parser.add_argument("--services", type=int, default=5, help="Per shop, max 8")
+        parser.add_argument("--customers", type=int, default=100, help="Per shop")
+        parser.add_argument("--months", type=int, default=3, help="Months of appointment history")
+        parser.add_argument(
+            "--appointments-per-day",
+            type=int,
+            default=6,
+            help="Bookings per staff member and day, within opening hours",
+        )
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--anchor-date",
+            type=_anchor_date,
+            help="Day history ends and upcoming bookings start (default: today); "
+            "fix it to get identical data from the same seed on any day",
+        )
+        parser.add_argument("--owner", default="admin", help="Username owning the generated shops")
+        parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Shops generated in parallel processes (PostgreSQL only)",
+        )
+        parser.add_argument(
+            "--skip-derived",
+            action="store_true",
+            help="Do not rebuild customer stats and daily rollups afterwards",
+        )
+
+    def handle(self, *args, **options):
+        sizes = ["businesses", "staff", "services", "customers", "batch_size"]
+        if any(options[name] < 1 for name in sizes) or options["workers"] < 1:
+            raise CommandError(
+                "--businesses, --staff, --services, --customers, --batch-size " "and --workers must be positive"
+            )
+        if options["businesses"] > MAX_BUSINESSES or options["customers"] > MAX_CUSTOMERS:
+            raise CommandError(f"At most {MAX_BUSINESSES} shops of {MAX_CUSTOMERS} customers per seed")
+        if options["months"] < 0 or options["appointments_per_day"] < 0:
+            raise CommandError("--months and --appointments-per-day can't be negative")
+        if options["workers"] > 1 and connection.vendor == "sqlite":
+            raise CommandError("SQLite allows one writer; use --workers 1")
+        try:
+            owner = User.objects.get(username=options["owner"])
+        except User.DoesNotExist:
+            raise CommandError(f"No user named {options['owner']!r}")
+
+        seed, total = options["seed"], options["businesses"]
+        if Business.objects.filter(pk__in=[business_id(seed, index) for index in range(total)]).exists():
+            raise CommandError(f"Shops for seed {seed} already exist; pass another --seed")
+        # Customer.phone is unique across shops; another seed may share the prefix
+        if Customer.objects.filter(phone__startswith=phone_prefix(seed)).exists():
+            raise CommandError(
+                f"Customer phones of seed {seed} collide with existing customers; " "pass another --seed"
+            )
+
+        generate = functools.partial(
+            generate_business,
+            seed=seed,
+            owner_id=owner.pk,
+            staff=options["staff"],
+            services=options["services"],
+            customers=options["customers"],
+            months=options["months"],
+            appointments_per_day=options["appointments_per_day"],
+            batch_size=options["batch_size"],
+            anchor=options["anchor_date"],
+        )
+        counts = dict.fromkeys(COUNTS, 0)
+        for done, result in enumerate(self.run(generate, total, options), 1):
+            for name in COUNTS:
+                counts[name] += result[name]
+            if options["verbosity"] > 1:
+                self.stdout.write(f"{done}/{total} shops")
+
+        if not options["skip_derived"]:
+            call_command("recompute_customer_stats", verbosity=0)
+            call_command("rebuild_rollups", verbosity=0)
+
+        self.stdout.write(self.style.SUCCESS("Generated " + ", ".join(f"{counts[name]} {name}" for name in COUNTS)))
+
+    @staticmethod
+    def run(generate, total, options):
+        if options["workers"] == 1:
+            yield from map(generate, range(total))
+            return
+        # Forked children must not share the parent's database sockets
+        connections.close_all()
+        worker = functools.partial(_generate_in_process, **generate.keywords)
+        with ProcessPoolExecutor(
+            max_workers=options["workers"],
+            mp_context=multiprocessing.get_context("fork"),
+        ) as pool:
+            yield from pool.map(worker, range(total))
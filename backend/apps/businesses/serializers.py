@@ -1,8 +1,10 @@
 from rest_framework import serializers
+from config.fieldsets import FieldsetSerializerMixin
+from config.instrumentation import TimedSerializerMixin
 from .models import Business
 
 
-class BusinessSerializer(serializers.ModelSerializer):
+class BusinessSerializer(TimedSerializerMixin, FieldsetSerializerMixin, serializers.ModelSerializer):
     owner_username = serializers.CharField(source="owner.username", read_only=True)
 
     class Meta:
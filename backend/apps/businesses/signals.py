@@ -0,0 +1,49 @@
+"""Invalidate per-business caches when tenant rows change."""
+
+from django.db.models.signals import post_delete, post_save
+
+from . import cache as business_cache
+from .models import Business
+from .stats import invalidate_business_stats
+from .tenancy import ACCESS_NAMESPACE
+
+# Models whose list responses are cached, keyed by their cache namespace
+CATALOG_NAMESPACES = {
+    "services.service": "services",
+    "staff.staff": "staff",
+}
+
+
+def invalidate_stats_for_instance(sender, instance, **kwargs):
+    """Any write to a tenant row makes that business's stats stale."""
+    invalidate_business_stats(instance.business_id)
+
+
+def invalidate_catalog_for_instance(sender, instance, **kwargs):
+    """Service and staff writes drop that business's cached catalog lists."""
+    namespace = CATALOG_NAMESPACES[sender._meta.label_lower]
+    business_cache.bump_version(namespace, instance.business_id)
+
+
+def invalidate_access_for_business(sender, instance, **kwargs):
+    """Ownership may have changed, so forget cached access answers."""
+    business_cache.bump_version(ACCESS_NAMESPACE, instance.pk)
+
+
+def _connect(receiver, model, name):
+    label = model._meta.label_lower
+    post_save.connect(receiver, sender=model, dispatch_uid=f"{name}-{label}-save")
+    post_delete.connect(receiver, sender=model, dispatch_uid=f"{name}-{label}-delete")
+
+
+def connect_tenant_signals():
+    from apps.appointments.models import Appointment
+    from apps.customers.models import Customer
+    from apps.services.models import Service
+    from apps.staff.models import Staff
+
+    for model in (Customer, Staff, Service, Appointment):
+        _connect(invalidate_stats_for_instance, model, "business-stats")
+    for model in (Service, Staff):
+        _connect(invalidate_catalog_for_instance, model, "business-catalog")
+    _connect(invalidate_access_for_business, Business, "business-access")
@@ -0,0 +1,150 @@
+"""Dashboard statistics for a single business."""
+
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from . import cache as business_cache
+from .models import Business
+
+STATS_NAMESPACE = "stats"
+
+
+def _count_subquery(model):
+    """Scalar subquery counting ``model`` rows for the outer business."""
+    counts = (
+        model.objects.filter(business=OuterRef("pk")).order_by().values("business").annotate(n=Count("pk")).values("n")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def _window_annotations(prefix, start, end, statuses):
+    """Per-status counts and revenue for appointments in ``[start, end)``."""
+    in_window = Q(appointments__scheduled_at__gte=start, appointments__scheduled_at__lt=end)
+    annotations = {f"{prefix}_total": Count("appointments", filter=in_window)}
+    for status in statuses:
+        annotations[f"{prefix}_{status}"] = Count("appointments", filter=in_window & Q(appointments__status=status))
+    annotations[f"{prefix}_revenue"] = Coalesce(
+        Sum(
+            "appointments__price",
+            filter=in_window & Q(appointments__status="completed"),
+        ),
+        Decimal("0"),
+        output_field=DecimalField(max_digits=12, decimal_places=2),
+    )
+    return annotations
+
+
+def _rollup_sum(field, start_day, end_day):
+    """Scalar subquery summing a ``DailyRollup`` column for the outer business."""
+    from apps.reports.models import DailyRollup
+
+    sums = (
+        DailyRollup.objects.filter(business=OuterRef("pk"), day__gte=start_day, day__lt=end_day)
+        .order_by()
+        .values("business")
+        .annotate(total=Sum(field))
+        .values("total")
+    )
+    return Subquery(sums)
+
+
+def _rollup_annotations(prefix, start_day, end_day, statuses):
+    """The window figures summed from daily rollups for ``[start_day, end_day)``."""
+    annotations = {f"{prefix}_total": Coalesce(_rollup_sum("appointments", start_day, end_day), 0)}
+    for status in statuses:
+        annotations[f"{prefix}_{status}"] = Coalesce(_rollup_sum(status, start_day, end_day), 0)
+    annotations[f"{prefix}_revenue"] = Coalesce(
+        _rollup_sum("revenue", start_day, end_day),
+        Decimal("0"),
+        output_field=DecimalField(max_digits=14, decimal_places=2),
+    )
+    return annotations
+
+
+def _window_result(row, prefix, statuses):
+    return {
+        "total": row[f"{prefix}_total"],
+        "by_status": {status: row[f"{prefix}_{status}"] for status in statuses},
+        "revenue": str(Decimal(row[f"{prefix}_revenue"]).quantize(Decimal("0.01"))),
+    }
+
+
+def _month_result(row, statuses):
+    """Rolled-up earlier days of the month plus today's live figures."""
+    revenue = Decimal(row["month_revenue"]) + Decimal(row["today_revenue"])
+    return {
+        "total": row["month_total"] + row["today_total"],
+        "by_status": {status: row[f"month_{status}"] + row[f"today_{status}"] for status in statuses},
+        "revenue": str(revenue.quantize(Decimal("0.01"))),
+    }
+
+
+def compute_business_stats(business_id, now=None):
+    """
+    Compute dashboard counters for a business in a single query.
+
+    Catalog totals are scalar subqueries; appointment totals and the
+    today/this-week breakdowns are conditional aggregates over one join,
+    so the whole payload is one round trip. The month figures add today's
+    live numbers to daily rollups of the earlier days, so they cost
+    O(days) rather than O(appointments).
+    """
+    from apps.appointments.models import Appointment
+    from apps.customers.models import Customer
+    from apps.services.models import Service
+    from apps.staff.models import Staff
+
+    now = now or timezone.now()
+    today = timezone.localdate(now)
+    day_start = timezone.make_aware(datetime.combine(today, time.min))
+    week_start = day_start - timedelta(days=today.weekday())
+    statuses = [status for status, _ in Appointment.STATUS_CHOICES]
+
+    row = (
+        Business.objects.filter(pk=business_id)
+        .annotate(
+            total_customers=_count_subquery(Customer),
+            total_staff=_count_subquery(Staff),
+            total_services=_count_subquery(Service),
+            total_appointments=Count("appointments"),
+            **_window_annotations("today", day_start, day_start + timedelta(days=1), statuses),
+            **_window_annotations("week", week_start, week_start + timedelta(days=7), statuses),
+            **_rollup_annotations("month", today.replace(day=1), today, statuses),
+        )
+        .values()
+        .first()
+    )
+    if row is None:
+        return None
+
+    return {
+        "business": str(business_id),
+        "total_customers": row["total_customers"],
+        "total_staff": row["total_staff"],
+        "total_services": row["total_services"],
+        "total_appointments": row["total_appointments"],
+        "today": _window_result(row, "today", statuses),
+        "week": _window_result(row, "week", statuses),
+        "month": _month_result(row, statuses),
+        "generated_at": now.isoformat(),
+    }
+
+
+def get_business_stats(business_id):
+    """Cached stats for a business, invalidated whenever its rows change."""
+    today = timezone.localdate()
+    stats, _ = business_cache.get_or_compute(
+        STATS_NAMESPACE,
+        business_id,
+        [today.isoformat()],
+        lambda: compute_business_stats(business_id),
+    )
+    return stats
+
+
+def invalidate_business_stats(business_id):
+    business_cache.bump_version(STATS_NAMESPACE, business_id)
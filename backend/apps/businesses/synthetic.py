@@ -0,0 +1,224 @@
+"""
+Synthetic tenants for development and load testing.
+
+``generate_business`` writes one shop (staff, services, customers and a
+span of appointments) with batched ``bulk_create``. Everything about a
+shop is derived from ``(seed, index)`` and the ``anchor`` date the
+history is laid out around, including its UUID and customer phones, so
+shops can be generated in any order or in parallel processes and the
+result is the same. Without an explicit anchor it is today, so runs on
+different days differ in dates and statuses.
+
+Appointments are laid out per staff member and day inside opening
+hours, so they never overlap. Past bookings are mostly completed, with
+some cancellations and no-shows; upcoming ones are scheduled or
+confirmed. ``bulk_create`` skips ``save()``: ``ends_at`` and
+``phone_normalized`` are filled in here, while customer stats and the
+reporting rollups are left to their rebuild commands.
+"""
+
+import random
+import uuid
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.appointments.models import Appointment
+from apps.customers.models import Customer
+from apps.customers.phones import phone_search_key
+from apps.services.models import Service
+from apps.staff.models import Staff
+
+from .models import Business
+
+DEFAULT_BATCH_SIZE = 5000
+
+OPENING, CLOSING = time(9), time(19)
+UPCOMING_DAYS = 14
+
+FIRST_NAMES = [
+    "Ana", "Carlos", "Daniel", "Diego", "Elena", "Felipe", "Gabriel", "Isabel",
+    "James", "Julia", "Laura", "Lucas", "Maria", "Mateo", "Michael", "Nicolas",
+    "Olivia", "Pablo", "Robert", "Sara", "Sofia", "Thomas", "Valentina", "William",
+]  # fmt: skip
+LAST_NAMES = [
+    "Brown", "Castro", "Davis", "Diaz", "Garcia", "Gomez", "Johnson", "Lopez",
+    "Martinez", "Moreno", "Perez", "Ramirez", "Rodriguez", "Smith", "Taylor",
+    "Torres", "Vargas", "Williams",
+]  # fmt: skip
+SHOP_WORDS = ["Downtown", "Uptown", "Classic", "Modern", "Royal", "Urban", "Old Town"]
+SHOP_KINDS = ["Cuts", "Barbers", "Styles", "Grooming", "Barbershop"]
+SERVICES = [
+    ("Classic Haircut", "haircut", 25, 30),
+    ("Beard Trim", "beard", 15, 20),
+    ("Hot Towel Shave", "shave", 35, 45),
+    ("Modern Cut & Style", "haircut", 40, 45),
+    ("Kids Cut", "haircut", 18, 20),
+    ("Cut & Beard", "combo", 38, 50),
+    ("Color Treatment", "color", 80, 90),
+    ("Deluxe Package", "combo", 120, 120),
+]
+PAST_STATUSES = {"completed": 85, "cancelled": 10, "no_show": 5}
+UPCOMING_STATUSES = {"scheduled": 60, "confirmed": 40}
+
+
+def business_id(seed, index):
+    """Deterministic UUID of shop ``index`` for ``seed``."""
+    return uuid.UUID(int=random.Random(f"{seed}:{index}:id").getrandbits(128), version=4)
+
+
+def phone_prefix(seed):
+    """Leading digits of every customer phone generated for ``seed``."""
+    return f"+{random.Random(f'{seed}:phones').randrange(1000, 10000)}"
+
+
+def customer_phone(seed, index, number):
+    # 15 digits at most (E.164): 4 for the seed, 5 for the shop, 6 per customer
+    return f"{phone_prefix(seed)}{index:05d}{number:06d}"
+
+
+def _person(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def _weighted(rng, weights):
+    return rng.choices(list(weights), list(weights.values()))[0]
+
+
+def _appointments(rng, business, staff, services, customers, months, per_day, anchor):
+    """Non-overlapping appointments for every staff member and day."""
+    first = anchor - timedelta(days=30 * months)
+    # Bookings before the anchor day are history, the rest upcoming
+    now = timezone.make_aware(datetime.combine(anchor, time.min))
+    opening = timedelta(hours=OPENING.hour)
+    closing = timedelta(hours=CLOSING.hour)
+    for offset in range((anchor - first).days + UPCOMING_DAYS):
+        midnight = timezone.make_aware(datetime.combine(first + timedelta(days=offset), time.min))
+        for member in staff:
+            cursor = opening
+            for _ in range(per_day):
+                cursor += timedelta(minutes=rng.choice((0, 0, 15, 30, 45)))
+                service = rng.choice(services)
+                end = cursor + timedelta(minutes=service.duration)
+                if end > closing:
+                    break
+                scheduled_at = midnight + cursor
+                past = scheduled_at < now
+                status = _weighted(rng, PAST_STATUSES if past else UPCOMING_STATUSES)
+                yield Appointment(
+                    business=business,
+                    staff=member,
+                    customer=rng.choice(customers),
+                    service=service,
+                    scheduled_at=scheduled_at,
+                    ends_at=Appointment.compute_ends_at(scheduled_at, service),
+                    status=status,
+                    price=service.price,
+                    completed_at=(
+                        scheduled_at + timedelta(minutes=service.duration) if status == "completed" else None
+                    ),
+                )
+                cursor = end
+
+
+def _bulk_create(model, rows, batch_size):
+    created, batch = 0, []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            model.objects.bulk_create(batch)
+            created, batch = created + len(batch), []
+    if batch:
+        model.objects.bulk_create(batch)
+        created += len(batch)
+    return created
+
+
+def generate_business(
+    index,
+    *,
+    seed,
+    owner_id,
+    staff=3,
+    services=5,
+    customers=100,
+    months=3,
+    appointments_per_day=6,
+    batch_size=DEFAULT_BATCH_SIZE,
+    anchor=None,
+):
+    """
+    Create shop ``index`` of ``seed``; returns row counts per model.
+
+    ``anchor`` is the date history ends and upcoming bookings start
+    (today by default).
+    """
+    anchor = anchor or timezone.localdate()
+    rng = random.Random(f"{seed}:{index}")
+    with transaction.atomic():
+        business = Business.objects.create(
+            id=business_id(seed, index),
+            owner_id=owner_id,
+            name=f"{rng.choice(SHOP_WORDS)} {rng.choice(SHOP_KINDS)} {index + 1}",
+            phone=f"555-{index:04d}",
+            email=f"shop{index + 1}@example.com",
+            address=f"{rng.randint(1, 999)} Main Street",
+        )
+        staff_rows = Staff.objects.bulk_create(
+            Staff(
+                business=business,
+                name=_person(rng),
+                phone=f"555-{index:04d}-{number:03d}",
+                role=rng.choice(("barber", "barber", "stylist")),
+            )
+            for number in range(staff)
+        )
+        catalog = rng.sample(SERVICES, min(services, len(SERVICES)))
+        service_rows = Service.objects.bulk_create(
+            Service(
+                business=business,
+                name=name,
+                category=category,
+                price=Decimal(price),
+                duration=duration,
+            )
+            for name, category, price, duration in catalog
+        )
+        # Phone numbers are unique across shops: derived from seed and index
+        phones = (customer_phone(seed, index, n) for n in range(customers))
+        customer_rows = Customer.objects.bulk_create(
+            [
+                Customer(
+                    business=business,
+                    name=_person(rng),
+                    phone=phone,
+                    phone_normalized=phone_search_key(phone),
+                    email=f"customer{number}@shop{index + 1}.example.com",
+                )
+                for number, phone in enumerate(phones)
+            ],
+            batch_size=batch_size,
+        )
+        appointments = _bulk_create(
+            Appointment,
+            _appointments(
+                rng,
+                business,
+                staff_rows,
+                service_rows,
+                customer_rows,
+                months,
+                appointments_per_day,
+                anchor,
+            ),
+            batch_size,
+        )
+    return {
+        "businesses": 1,
+        "staff": len(staff_rows),
+        "services": len(service_rows),
+        "customers": len(customer_rows),
+        "appointments": appointments,
+    }
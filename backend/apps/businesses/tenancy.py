@@ -0,0 +1,219 @@
+"""Tenant scoping shared by every business-owned ViewSet."""
+
+import uuid
+
+from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.response import Response
+
+from config.conditional import ConditionalGetMixin, etag_matches, not_modified
+
+from . import cache as business_cache
+from .models import Business
+
+ACCESS_NAMESPACE = "access"
+
+
+def is_master_user(user):
+    """Masters and Django staff can see every business."""
+    if not user.is_authenticated:
+        return False
+    if user.is_staff:
+        return True
+    return user.profile.is_master if hasattr(user, "profile") else False
+
+
+def accessible_businesses(user):
+    """
+    Businesses visible to the given user.
+
+    - Master / staff accounts: all businesses
+    - Regular users: only businesses they own
+    - Anonymous: all (for dev, change in production)
+    """
+    if not user.is_authenticated or is_master_user(user):
+        return Business.objects.all()
+    return Business.objects.filter(owner=user)
+
+
+def can_access_business(user, business_id):
+    """
+    Whether ``user`` may read or write rows of ``business_id``.
+
+    Ownership answers are cached per business and invalidated whenever the
+    business is saved or deleted, so repeat requests skip the lookup.
+    """
+    if not user.is_authenticated or is_master_user(user):
+        return True
+    allowed, _ = business_cache.get_or_compute(
+        ACCESS_NAMESPACE,
+        business_id,
+        [user.pk],
+        lambda: Business.objects.filter(pk=business_id, owner=user).exists(),
+    )
+    return allowed
+
+
+def parse_business_id(value):
+    """Validate a ``business`` query parameter and return it as a UUID."""
+    try:
+        return uuid.UUID(str(value))
+    except (TypeError, ValueError):
+        raise ValidationError({"business": "Must be a valid business id."})
+
+
+def scope_to_tenant(queryset, user, business_param=None, tenant_field="business"):
+    """
+    ``queryset`` limited to the businesses ``user`` can access.
+
+    ``business_param`` (the raw ``?business=`` value) narrows it to one
+    business, or to nothing when the user may not see that business.
+    """
+    lookup = f"{tenant_field}_id"
+    if business_param:
+        business_id = parse_business_id(business_param)
+        if not can_access_business(user, business_id):
+            return queryset.none()
+        return queryset.filter(**{lookup: business_id})
+
+    if not user.is_authenticated or is_master_user(user):
+        return queryset
+    owned = Business.objects.filter(owner=user).values("pk")
+    return queryset.filter(**{f"{lookup}__in": owned})
+
+
+def foreign_tenant_errors(model, data, instance=None, tenant_field="business"):
+    """
+    ``{field: [message]}`` for related rows of another business.
+
+    ``data`` holds validated values (related objects, not ids). Every
+    foreign key of ``model`` to another tenant model must point at a row
+    of the same business as the one being written. When an update moves
+    ``instance`` to another business, its unchanged relations are checked
+    too.
+    """
+    if tenant_field in data:
+        business = data[tenant_field]
+        business_id = business.pk if business is not None else None
+    else:
+        business_id = getattr(instance, f"{tenant_field}_id", None)
+    if business_id is None:
+        return {}
+    moved = instance is not None and business_id != getattr(instance, f"{tenant_field}_id")
+    errors = {}
+    for field in model._meta.concrete_fields:
+        if not field.many_to_one or field.name == tenant_field:
+            continue
+        if not hasattr(field.related_model, f"{tenant_field}_id"):
+            continue
+        if field.name in data:
+            related = data[field.name]
+        elif moved:
+            related = getattr(instance, field.name)
+        else:
+            continue
+        if related is not None and getattr(related, f"{tenant_field}_id") != business_id:
+            errors[field.name] = ["Must belong to the same business."]
+    return errors
+
+
+class TenantScopedMixin:
+    """
+    Restrict a ViewSet's queryset to the businesses the user can access.
+
+    Honors ``?business=<id>`` so a dashboard only pulls rows for the shop it
+    is showing. Filtering on ``business_id`` directly (rather than joining
+    through ``business__owner``) lets the planner use the ``(business, ...)``
+    composite indexes on every tenant table.
+    """
+
+    tenant_field = "business"
+
+    def get_queryset(self):
+        return scope_to_tenant(
+            super().get_queryset(),
+            self.request.user,
+            self.request.query_params.get("business"),
+            self.tenant_field,
+        )
+
+    def check_business_access(self, business):
+        """Reject writes that target a business the user does not own."""
+        if business is None:
+            return
+        if not can_access_business(self.request.user, business.pk):
+            raise PermissionDenied("You do not have access to this business.")
+
+    def check_related_tenancy(self, serializer):
+        """Reject related rows (staff, customer...) of another business."""
+        errors = foreign_tenant_errors(
+            serializer.Meta.model,
+            serializer.validated_data,
+            serializer.instance,
+            self.tenant_field,
+        )
+        if errors:
+            raise ValidationError(errors)
+
+    def perform_create(self, serializer):
+        self.check_business_access(serializer.validated_data.get(self.tenant_field))
+        self.check_related_tenancy(serializer)
+        super().perform_create(serializer)
+
+    def perform_update(self, serializer):
+        self.check_business_access(serializer.validated_data.get(self.tenant_field))
+        self.check_related_tenancy(serializer)
+        super().perform_update(serializer)
+
+
+class CachedListMixin(ConditionalGetMixin):
+    """
+    Read-through cache for a tenant ViewSet's ``list`` responses.
+
+    Only requests scoped with ``?business=<id>`` are cached, keyed by the
+    full URL under the business's ``cache_namespace`` version. Signals bump
+    that version on every save/delete of the model, so steady-state reads
+    of rarely changing catalogs never reach the database. The ETag is
+    stored next to the body, so conditional requests are answered from the
+    cache too. Responses carry an ``X-Cache: HIT|MISS`` header.
+    """
+
+    cache_namespace = None
+    cache_timeout = business_cache.DEFAULT_TIMEOUT
+
+    def list(self, request, *args, **kwargs):
+        business_param = request.query_params.get("business")
+        if not business_param:
+            return super().list(request, *args, **kwargs)
+
+        business_id = parse_business_id(business_param)
+        if not can_access_business(request.user, business_id):
+            return super().list(request, *args, **kwargs)
+
+        entry, hit = business_cache.get_or_compute(
+            self.cache_namespace,
+            business_id,
+            [request.build_absolute_uri(), request.accepted_media_type],
+            lambda: self._build_cached_list(request, *args, **kwargs),
+            self.cache_timeout,
+        )
+        business_cache.record_lookup(self.cache_namespace, hit)
+
+        if etag_matches(request, entry["etag"]):
+            response = not_modified(entry["etag"])
+        else:
+            response = Response(entry["data"])
+            response["ETag"] = entry["etag"]
+        response["X-Cache"] = "HIT" if hit else "MISS"
+        return response
+
+    def _build_cached_list(self, request, *args, **kwargs):
+        etag = self.get_list_etag(request)
+        # Skip ConditionalGetMixin.list: a cached body must always be complete
+        response = super(ConditionalGetMixin, self).list(request, *args, **kwargs)
+        return {"etag": etag, "data": response.data}
+
+    @action(detail=False, methods=["get"], url_path="cache-stats")
+    def cache_stats(self, request):
+        """Hit/miss counters for this catalog's list cache."""
+        return Response(business_cache.lookup_counters(self.cache_namespace))
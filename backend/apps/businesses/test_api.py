@@ -71,3 +71,139 @@ class TestBusinessAPI:
         business_ids = [b["id"] for b in response.data]
         assert str(business.id) in business_ids
         assert str(other_business.id) not in business_ids
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestBusinessStatsAPI:
+    """Test the per-business dashboard stats endpoint"""
+
+    def _stats(self, client, business):
+        url = reverse("business-stats", kwargs={"pk": business.id})
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return response.data
+
+    def test_stats_counts(self, authenticated_client, business, staff, service):
+        """Test catalog totals and today's breakdown"""
+        from decimal import Decimal
+
+        from conftest import AppointmentFactory, CustomerFactory
+        from django.utils import timezone
+
+        customers = CustomerFactory.create_batch(2, business=business)
+        now = timezone.now()
+        for status_value, price in [("completed", "30.00"), ("scheduled", "20.00")]:
+            AppointmentFactory(
+                business=business,
+                staff=staff,
+                customer=customers[0],
+                service=service,
+                scheduled_at=now,
+                status=status_value,
+                price=Decimal(price),
+            )
+
+        data = self._stats(authenticated_client, business)
+
+        assert data["total_customers"] == 2
+        assert data["total_staff"] == 1
+        assert data["total_services"] == 1
+        assert data["total_appointments"] == 2
+        assert data["today"]["total"] == 2
+        assert data["today"]["by_status"]["completed"] == 1
+        assert data["today"]["by_status"]["scheduled"] == 1
+        assert data["today"]["revenue"] == "30.00"
+        assert data["week"]["total"] == 2
+
+    def test_stats_single_query_and_cached(self, authenticated_client, business, django_assert_num_queries):
+        """Test stats take one aggregate query and are then served from cache"""
+        url = reverse("business-stats", kwargs={"pk": business.id})
+        # get_object + the aggregate
+        with django_assert_num_queries(2):
+            authenticated_client.get(url)
+        with django_assert_num_queries(1):
+            authenticated_client.get(url)
+
+    def test_stats_invalidated_on_change(self, authenticated_client, business):
+        """Test writes to tenant rows refresh the cached stats"""
+        from conftest import CustomerFactory
+
+        assert self._stats(authenticated_client, business)["total_customers"] == 0
+        customer = CustomerFactory(business=business)
+        assert self._stats(authenticated_client, business)["total_customers"] == 1
+        customer.delete()
+        assert self._stats(authenticated_client, business)["total_customers"] == 0
+
+    def test_stats_hidden_for_other_tenants(self, authenticated_client):
+        """Test users cannot read another tenant's stats"""
+        from conftest import BusinessFactory, UserFactory
+
+        other = BusinessFactory(owner=UserFactory())
+        url = reverse("business-stats", kwargs={"pk": other.id})
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestBusinessWorkspaceAPI:
+    """Test the single-request workspace bootstrap endpoint"""
+
+    def _url(self, business):
+        return reverse("business-workspace", kwargs={"pk": business.id})
+
+    def test_workspace_returns_all_collections(self, authenticated_client, business, appointment):
+        """Test every collection and the stats are included"""
+        response = authenticated_client.get(self._url(business))
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data
+        assert [c["id"] for c in data["customers"]] == [appointment.customer.id]
+        assert [s["id"] for s in data["staff"]] == [appointment.staff.id]
+        assert [s["id"] for s in data["services"]] == [appointment.service.id]
+        assert [a["id"] for a in data["appointments"]] == [appointment.id]
+        assert data["stats"]["total_appointments"] == 1
+
+    def test_workspace_query_count_is_fixed(
+        self, authenticated_client, business, staff, service, django_assert_num_queries
+    ):
+        """Test the number of queries does not grow with row count"""
+        from conftest import AppointmentFactory, CustomerFactory
+
+        for customer in CustomerFactory.create_batch(5, business=business):
+            AppointmentFactory(business=business, staff=staff, customer=customer, service=service)
+
+        # get_object + ETag validator + four collections + stats aggregate
+        with django_assert_num_queries(7):
+            response = authenticated_client.get(self._url(business))
+        assert len(response.data["appointments"]) == 5
+
+    def test_workspace_limits(self, authenticated_client, business):
+        """Test global and per-collection limits"""
+        from conftest import CustomerFactory, StaffFactory
+
+        CustomerFactory.create_batch(3, business=business)
+        StaffFactory.create_batch(3, business=business)
+
+        response = authenticated_client.get(self._url(business), {"limit": 2, "staff_limit": 0})
+
+        assert len(response.data["customers"]) == 2
+        assert response.data["staff"] == []
+
+    def test_workspace_invalid_limit(self, authenticated_client, business):
+        """Test non-numeric limits are rejected"""
+        response = authenticated_client.get(self._url(business), {"limit": "many"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_workspace_not_modified(self, authenticated_client, business, customer):
+        """Test the workspace supports conditional requests"""
+        url = self._url(business)
+        etag = authenticated_client.get(url)["ETag"]
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        customer.save()
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
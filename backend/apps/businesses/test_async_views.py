@@ -0,0 +1,115 @@
+"""Tests for the async read endpoints under /api/async/"""
+
+import json
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.appointments.models import Appointment
+from apps.businesses.models import Business
+
+
+@pytest.fixture
+def bearer(user):
+    return {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+
+
+def body(response):
+    return json.loads(response.content)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestAsyncReadEndpoints:
+    """Test the async views answer like their DRF counterparts"""
+
+    def test_appointment_list_matches_drf(self, client, bearer, business, staff, customer, service):
+        """Test the async list pages through the same keyset cursors"""
+        start = timezone.now() + timedelta(days=1)
+        for hour in range(3):
+            Appointment.objects.create(
+                business=business,
+                staff=staff,
+                customer=customer,
+                service=service,
+                scheduled_at=start + timedelta(hours=hour),
+                price=10,
+            )
+        params = {"business": business.id, "page_size": 2}
+
+        sync = body(client.get(reverse("appointment-list"), params, **bearer))
+        response = client.get(reverse("async-appointment-list"), params, **bearer)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = body(response)
+        assert data["results"] == sync["results"]
+        assert data["next"].split("cursor=")[1] == sync["next"].split("cursor=")[1]
+
+        second = client.get(data["next"], **bearer)
+        assert len(body(second)["results"]) == 1
+
+    def test_workspace_and_etag(self, client, bearer, business, staff, customer):
+        """Test the workspace payload and its If-None-Match revalidation"""
+        url = reverse("async-business-workspace", args=[business.id])
+
+        response = client.get(url, **bearer)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = body(response)
+        assert [row["id"] for row in data["customers"]] == [customer.id]
+        assert data["stats"]["total_staff"] == 1
+        cached = client.get(url, HTTP_IF_NONE_MATCH=response["ETag"], **bearer)
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_stats(self, client, bearer, business, customer):
+        """Test the stats payload matches the DRF action"""
+        sync = client.get(reverse("business-stats", args=[business.id]), **bearer)
+        response = client.get(reverse("async-business-stats", args=[business.id]), **bearer)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert body(response)["total_customers"] == body(sync)["total_customers"] == 1
+
+    def test_availability(self, client, bearer, business, staff, service):
+        """Test staff and business availability windows"""
+        params = {"service": service.id, "step": 60}
+        one = client.get(reverse("async-staff-availability", args=[staff.id]), params, **bearer)
+        everyone = client.get(
+            reverse("async-staff-business-availability"),
+            {"business": business.id, **params},
+            **bearer,
+        )
+
+        assert one.status_code == status.HTTP_200_OK
+        assert body(one)["duration"] == service.duration
+        assert body(everyone)["staff"][0]["slots"] == body(one)["slots"]
+
+    def test_foreign_business_is_not_found(self, client, bearer, django_user_model):
+        """Test another owner's business is hidden"""
+        stranger = django_user_model.objects.create_user("stranger", password="x")
+        foreign = Business.objects.create(owner=stranger, name="Foreign")
+
+        response = client.get(reverse("async-business-stats", args=[foreign.id]), **bearer)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_bad_token_is_rejected(self, client, business):
+        """Test an invalid bearer token gets a DRF-style 401"""
+        response = client.get(
+            reverse("async-business-stats", args=[business.id]),
+            HTTP_AUTHORIZATION="Bearer nope",
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "detail" in body(response)
+        assert response["WWW-Authenticate"].startswith("Bearer")
+
+    def test_validation_errors(self, client, bearer):
+        """Test parameter errors come back as 400 JSON"""
+        response = client.get(reverse("async-staff-business-availability"), **bearer)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert body(response) == {"business": "This parameter is required."}
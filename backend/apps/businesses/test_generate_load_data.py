@@ -0,0 +1,116 @@
+"""Tests for the generate_load_data command"""
+
+from datetime import date, timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import F, OuterRef, Subquery
+from django.utils import timezone
+
+from apps.appointments.models import Appointment
+from apps.businesses.models import Business
+from apps.businesses.synthetic import customer_phone
+from apps.customers.models import Customer
+from apps.staff.models import Staff
+
+
+def generate(**options):
+    out = StringIO()
+    options = {
+        "businesses": 2,
+        "customers": 20,
+        "months": 1,
+        "skip_derived": True,
+        **options,
+    }
+    call_command("generate_load_data", stdout=out, **options)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestGenerateLoadData:
+    """Test synthetic data generation"""
+
+    def test_creates_requested_rows(self, user):
+        """Test shop, staff, service and customer counts follow the options"""
+        generate(owner=user.username, staff=2, services=4)
+
+        assert Business.objects.filter(owner=user).count() == 2
+        assert Staff.objects.count() == 4
+        assert Customer.objects.count() == 40
+        assert Customer.objects.exclude(phone_normalized="").count() == 40
+        assert Appointment.objects.filter(ends_at__gt=F("scheduled_at")).exists()
+
+    def test_same_seed_is_deterministic(self, user):
+        """Test a seed always produces the same shops"""
+        generate(owner=user.username, seed=7)
+        first = list(
+            Appointment.objects.order_by("scheduled_at", "staff__name").values_list(
+                "business_id", "scheduled_at", "status", "price"
+            )
+        )
+        Business.objects.all().delete()
+
+        generate(owner=user.username, seed=7)
+
+        assert (
+            list(
+                Appointment.objects.order_by("scheduled_at", "staff__name").values_list(
+                    "business_id", "scheduled_at", "status", "price"
+                )
+            )
+            == first
+        )
+
+    def test_staff_bookings_do_not_overlap(self, user):
+        """Test no appointment starts before the staff member's previous one ends"""
+        generate(owner=user.username, appointments_per_day=12)
+
+        previous_end = Subquery(
+            Appointment.objects.filter(staff=OuterRef("staff"), scheduled_at__lt=OuterRef("scheduled_at"))
+            .order_by("-scheduled_at")
+            .values("ends_at")[:1]
+        )
+        overlapping = Appointment.objects.annotate(previous_end=previous_end).filter(previous_end__gt=F("scheduled_at"))
+        assert not overlapping.exists()
+
+    def test_rerun_with_same_seed_is_rejected(self, user):
+        """Test generating the same seed twice fails instead of duplicating"""
+        generate(owner=user.username)
+
+        with pytest.raises(CommandError, match="already exist"):
+            generate(owner=user.username)
+
+    def test_unknown_owner(self):
+        """Test the owner must exist"""
+        with pytest.raises(CommandError, match="No user named"):
+            generate(owner="nobody")
+
+    def test_seeds_sharing_low_digits_do_not_collide(self, user):
+        """Test customer phones depend on the whole seed"""
+        generate(owner=user.username, seed=42)
+        generate(owner=user.username, seed=1042)
+
+        assert Customer.objects.count() == 80
+
+    def test_phone_collision_is_rejected(self, user, customer):
+        """Test a seed whose phones are already taken fails up front"""
+        customer.phone = customer_phone(9, 0, 0)
+        customer.save()
+
+        with pytest.raises(CommandError, match="collide"):
+            generate(owner=user.username, seed=9)
+
+    def test_anchor_date(self, user):
+        """Test --anchor-date fixes the dates whatever the current day"""
+        generate(owner=user.username, anchor_date=date(2030, 1, 7), staff=1)
+
+        upcoming = Appointment.objects.filter(status__in=["scheduled", "confirmed"])
+        first = upcoming.order_by("scheduled_at").first().scheduled_at
+        last = Appointment.objects.order_by("scheduled_at").last().scheduled_at
+        assert timezone.localdate(first) >= date(2030, 1, 7)
+        assert timezone.localdate(last) < date(2030, 1, 7) + timedelta(days=14)
+        assert not Appointment.objects.filter(status="completed", scheduled_at__gte=first).exists()
@@ -0,0 +1,122 @@
+"""Tests for per-request metrics and endpoint query budgets"""
+
+import json
+import re
+
+import pytest
+from django.urls import reverse
+
+from conftest import AppointmentFactory, BusinessFactory, CustomerFactory
+
+
+@pytest.fixture(autouse=True)
+def server_timing(settings):
+    """Send the header whatever DEBUG is"""
+    settings.SERVER_TIMING_ENABLED = True
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestRequestMetrics:
+    """Test the Server-Timing header and request log"""
+
+    def test_server_timing_counts_queries(self, authenticated_client, appointment, query_budget):
+        """Test the header reports the queries the request ran"""
+        url = reverse("appointment-list")
+
+        with query_budget(10) as queries:
+            response = authenticated_client.get(url, {"business": appointment.business_id})
+
+        timing = response["Server-Timing"]
+        assert f'desc="{len(queries)} queries"' in timing
+        assert re.search(r"serializer;dur=[\d.]+", timing)
+        assert re.search(r"total;dur=[\d.]+", timing)
+
+    def test_cache_hits_reported(self, authenticated_client, staff):
+        """Test a repeated cached list reports hits and no queries"""
+        url = reverse("staff-list")
+        params = {"business": staff.business_id}
+
+        authenticated_client.get(url, params)
+        response = authenticated_client.get(url, params)
+
+        assert 'db;dur=0.0;desc="0 queries"' in response["Server-Timing"]
+        assert 'cache;desc="2 hits, 0 misses"' in response["Server-Timing"]
+
+    def test_request_logged_as_json(self, authenticated_client, business, caplog):
+        """Test each request logs one structured line"""
+        url = reverse("business-detail", args=[business.id])
+
+        with caplog.at_level("INFO", logger="config.instrumentation"):
+            authenticated_client.get(url)
+
+        entry = json.loads(caplog.records[-1].getMessage())
+        assert entry["view"] == "business-detail"
+        assert entry["status"] == 200
+        assert entry["queries"] >= 1
+
+    def test_server_timing_can_be_disabled(self, authenticated_client, settings):
+        """Test SERVER_TIMING_ENABLED=False drops the header"""
+        settings.SERVER_TIMING_ENABLED = False
+
+        response = authenticated_client.get(reverse("business-list"))
+
+        assert "Server-Timing" not in response
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestQueryBudgets:
+    """Test list endpoints run a fixed number of queries, however many rows"""
+
+    @pytest.fixture
+    def rows(self, user, business, staff, customer, service):
+        BusinessFactory.create_batch(3, owner=user)
+        CustomerFactory.create_batch(5, business=business)
+        AppointmentFactory.create_batch(5, business=business, staff=staff, customer=customer, service=service)
+        return business
+
+    @pytest.mark.parametrize(
+        "name,budget",
+        [
+            ("business-list", 4),
+            ("staff-list", 4),
+            ("service-list", 4),
+            ("customer-list", 4),
+            ("appointment-list", 3),
+        ],
+    )
+    def test_list_budget(self, authenticated_client, rows, query_budget, name, budget):
+        """Test the list stays within its query budget"""
+        with query_budget(budget):
+            response = authenticated_client.get(reverse(name), {"business": rows.id})
+
+        assert response.status_code == 200
+
+    def test_appointment_detail_budget(self, authenticated_client, appointment, query_budget):
+        """Test nested details are joined, not fetched one by one"""
+        url = reverse("appointment-detail", args=[appointment.id])
+
+        with query_budget(2):
+            response = authenticated_client.get(url)
+
+        assert response.data["staff_details"]["id"] == appointment.staff_id
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+class TestAsyncRequestMetrics:
+    """Test metrics follow requests into the async views"""
+
+    @pytest.mark.asyncio
+    async def test_async_view_reports_queries(self, async_client, user, business):
+        """Test queries run through sync_to_async are counted"""
+        from rest_framework_simplejwt.tokens import AccessToken
+
+        url = reverse("async-business-stats", args=[business.id])
+
+        response = await async_client.get(url, HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+        assert response.status_code == 200
+        queries = re.search(r'db;dur=[\d.]+;desc="(\d+) queries"', response["Server-Timing"])
+        assert int(queries.group(1)) > 0, response["Server-Timing"]
@@ -0,0 +1,173 @@
+"""Tests for tenant-scoped querysets"""
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from conftest import AppointmentFactory, BusinessFactory, CustomerFactory, ServiceFactory, StaffFactory, UserFactory
+
+
+def _ids(response):
+    return {str(row["id"]) for row in response.data["results"]}
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestTenantScoping:
+    """Tenant ViewSets only return rows for the user's businesses"""
+
+    @pytest.fixture
+    def other_business(self):
+        return BusinessFactory(owner=UserFactory())
+
+    @pytest.mark.parametrize(
+        "route,factory",
+        [
+            ("customer-list", CustomerFactory),
+            ("staff-list", StaffFactory),
+            ("service-list", ServiceFactory),
+        ],
+    )
+    def test_list_excludes_other_tenants(self, authenticated_client, business, other_business, route, factory):
+        """Test rows from businesses the user does not own are hidden"""
+        own = factory(business=business)
+        foreign = factory(business=other_business)
+
+        response = authenticated_client.get(reverse(route))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert str(own.id) in _ids(response)
+        assert str(foreign.id) not in _ids(response)
+
+    def test_appointments_scoped_to_owned_businesses(self, authenticated_client, appointment, other_business):
+        """Test appointments of other tenants are hidden"""
+        foreign = AppointmentFactory(business=other_business)
+
+        response = authenticated_client.get(reverse("appointment-list"))
+
+        assert str(appointment.id) in _ids(response)
+        assert str(foreign.id) not in _ids(response)
+
+    def test_business_param_filters_to_one_shop(self, authenticated_client, user):
+        """Test ?business= narrows the list to a single owned business"""
+        first = BusinessFactory(owner=user)
+        second = BusinessFactory(owner=user)
+        in_first = CustomerFactory(business=first)
+        in_second = CustomerFactory(business=second)
+
+        response = authenticated_client.get(reverse("customer-list"), {"business": str(first.id)})
+
+        assert _ids(response) == {str(in_first.id)}
+        assert str(in_second.id) not in _ids(response)
+
+    def test_business_param_for_foreign_shop_is_empty(self, authenticated_client, other_business):
+        """Test asking for another tenant's business returns nothing"""
+        CustomerFactory(business=other_business)
+
+        response = authenticated_client.get(reverse("customer-list"), {"business": str(other_business.id)})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == []
+
+    def test_invalid_business_param(self, authenticated_client):
+        """Test a malformed business id is rejected"""
+        response = authenticated_client.get(reverse("customer-list"), {"business": "not-a-uuid"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_master_sees_all_tenants(self, api_client, business, other_business):
+        """Test master accounts are not restricted"""
+        master = UserFactory()
+        master.profile.is_master = True
+        master.profile.save()
+        api_client.force_authenticate(user=master)
+        own = CustomerFactory(business=business)
+        foreign = CustomerFactory(business=other_business)
+
+        response = api_client.get(reverse("customer-list"))
+
+        assert {str(own.id), str(foreign.id)} <= _ids(response)
+
+    def test_cannot_create_in_foreign_business(self, authenticated_client, other_business):
+        """Test writes into another tenant's business are forbidden"""
+        data = {
+            "business": str(other_business.id),
+            "name": "Intruder",
+            "phone": "555-9999",
+        }
+        response = authenticated_client.post(reverse("customer-list"), data)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    @pytest.fixture
+    def booking(self, business, staff, customer, service):
+        return {
+            "business": str(business.id),
+            "staff": staff.id,
+            "customer": customer.id,
+            "service": service.id,
+            "scheduled_at": "2030-01-07T10:00:00Z",
+        }
+
+    @pytest.mark.parametrize(
+        "field,factory",
+        [
+            ("customer", CustomerFactory),
+            ("staff", StaffFactory),
+            ("service", ServiceFactory),
+        ],
+    )
+    def test_cannot_book_foreign_related_rows(self, authenticated_client, other_business, booking, field, factory):
+        """Test an appointment can't reference another tenant's rows"""
+        booking[field] = factory(business=other_business).id
+
+        response = authenticated_client.post(reverse("appointment-list"), booking, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert field in response.data
+
+    def test_cannot_move_booking_to_foreign_customer(self, authenticated_client, appointment, other_business):
+        """Test updates can't swap in another tenant's customer"""
+        foreign = CustomerFactory(business=other_business)
+
+        response = authenticated_client.patch(
+            reverse("appointment-detail", args=[appointment.id]),
+            {"customer": foreign.id},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        appointment.refresh_from_db()
+        assert appointment.customer_id != foreign.id
+
+    @pytest.mark.parametrize(
+        "field,factory",
+        [
+            ("customer", CustomerFactory),
+            ("staff", StaffFactory),
+            ("service", ServiceFactory),
+        ],
+    )
+    def test_bulk_rejects_foreign_related_rows(self, authenticated_client, other_business, booking, field, factory):
+        """Test bulk rows referencing another tenant's rows fail per row"""
+        foreign = dict(booking, scheduled_at="2030-01-07T12:00:00Z")
+        foreign[field] = factory(business=other_business).id
+
+        response = authenticated_client.post(reverse("appointment-bulk"), [booking, foreign], format="json")
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        results = response.data["results"]
+        assert [r["status"] for r in results] == ["created", "error"]
+        assert field in results[1]["errors"]
+
+    def test_bulk_update_rejects_foreign_customer(self, authenticated_client, appointment, other_business):
+        """Test bulk updates can't swap in another tenant's customer"""
+        foreign = CustomerFactory(business=other_business)
+
+        response = authenticated_client.patch(
+            reverse("appointment-bulk"),
+            [{"id": appointment.id, "customer": foreign.id}],
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        appointment.refresh_from_db()
+        assert appointment.customer_id != foreign.id
@@ -1,9 +1,41 @@
+from datetime import timedelta
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from apps.reports.rollups import BREAKDOWNS, PERIODS, revenue_report
+from config.conditional import (
+    ConditionalGetMixin,
+    etag_matches,
+    make_etag,
+    not_modified,
+)
+from config.fieldsets import FieldsetViewMixin
 from .models import Business
 from .serializers import BusinessSerializer
+from .stats import get_business_stats
+from .tenancy import accessible_businesses
+from .workspace import build_workspace, parse_limits, workspace_validator
 
+MAX_REPORT_DAYS = 5 * 366
 
-class BusinessViewSet(viewsets.ModelViewSet):
+
+def _parse_day(params, name, default):
+    value = params.get(name)
+    if not value:
+        return default
+    try:
+        day = parse_date(value)
+    except ValueError:
+        day = None
+    if day is None:
+        raise ValidationError({name: "Must be a date (YYYY-MM-DD)."})
+    return day
+
+
+class BusinessViewSet(ConditionalGetMixin, FieldsetViewMixin, viewsets.ModelViewSet):
     """
     ViewSet for Business CRUD operations.
 
@@ -23,23 +55,8 @@ class BusinessViewSet(viewsets.ModelViewSet):
         - Regular users: See only their own businesses
         - Anonymous: See all (for dev, change in production)
         """
-        user = self.request.user
-
-        # Anonymous user - return all for development
-        if not user.is_authenticated:
-            return Business.objects.all()
-
-        # Check if user is master
-        is_master = False
-        if hasattr(user, "profile"):
-            is_master = user.profile.is_master
-
-        # Master or staff can see all
-        if is_master or user.is_staff:
-            return Business.objects.all()
-
-        # Regular users see only their businesses
-        return Business.objects.filter(owner=user)
+        # owner_username reads the owner row
+        return accessible_businesses(self.request.user).select_related("owner")
 
     def perform_create(self, serializer):
         """Set the owner to the current user."""
@@ -51,3 +68,64 @@ class BusinessViewSet(viewsets.ModelViewSet):
 
             default_user = User.objects.first()
             serializer.save(owner=default_user)
+
+    @action(detail=True, methods=["get"])
+    def stats(self, request, pk=None):
+        """
+        Dashboard counters for one business.
+
+        GET /api/businesses/{id}/stats/
+
+        Computed in a single aggregate query and cached per business until
+        one of its customers, staff, services or appointments changes.
+        """
+        business = self.get_object()
+        return Response(get_business_stats(business.pk))
+
+    @action(detail=True, methods=["get"])
+    def workspace(self, request, pk=None):
+        """
+        Customers, staff, services, recent appointments and stats in one call.
+
+        GET /api/businesses/{id}/workspace/?limit=100&appointments_limit=50
+
+        ``limit`` caps every collection; ``<collection>_limit`` overrides it
+        for one of customers, staff, services or appointments. Supports
+        ``If-None-Match`` so an unchanged workspace costs a
+        single validator query.
+        """
+        business = self.get_object()
+        limits = parse_limits(request.query_params)
+        etag = make_etag(request, *workspace_validator(business))
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response = Response(build_workspace(business, limits))
+        response["ETag"] = etag
+        return response
+
+    @action(detail=True, methods=["get"])
+    def reports(self, request, pk=None):
+        """
+        Revenue and utilization from the daily rollups.
+
+        GET /api/businesses/{id}/reports/?from=2025-01-01&to=2025-12-31&period=month
+
+        ``period`` is day (default), week or month; ``by`` optionally splits
+        rows by staff or service. Figures lag writes by up to one rollup
+        refresh; ``pending_days`` counts days still waiting for it.
+        """
+        business = self.get_object()
+        params = request.query_params
+        end = _parse_day(params, "to", timezone.localdate())
+        start = _parse_day(params, "from", end - timedelta(days=30))
+        if start > end:
+            raise ValidationError({"from": "Must not be after 'to'."})
+        if (end - start).days > MAX_REPORT_DAYS:
+            raise ValidationError({"from": "Reports may span at most five years."})
+        period = params.get("period", "day")
+        if period not in PERIODS:
+            raise ValidationError({"period": "Must be day, week or month."})
+        breakdown = params.get("by") or None
+        if breakdown is not None and breakdown not in BREAKDOWNS:
+            raise ValidationError({"by": "Must be staff or service."})
+        return Response(revenue_report(business.pk, start, end, period, breakdown))
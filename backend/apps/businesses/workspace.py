@@ -0,0 +1,135 @@
+"""Single-response bootstrap payload for the frontend workspace."""
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
+
+from .models import Business
+from .stats import get_business_stats
+
+DEFAULT_LIMIT = api_settings.PAGE_SIZE
+MAX_LIMIT = 500
+COLLECTIONS = ("customers", "staff", "services", "appointments")
+
+
+def parse_limits(query_params):
+    """
+    Read ``?limit=`` and per-collection ``?<collection>_limit=`` overrides.
+
+    A limit of ``0`` skips that collection entirely.
+    """
+    default = _parse_limit(query_params, "limit", DEFAULT_LIMIT)
+    return {name: _parse_limit(query_params, f"{name}_limit", default) for name in COLLECTIONS}
+
+
+def _parse_limit(query_params, param, default):
+    value = query_params.get(param)
+    if value in (None, ""):
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValidationError({param: "Must be an integer."})
+    if limit < 0:
+        raise ValidationError({param: "Must not be negative."})
+    return min(limit, MAX_LIMIT)
+
+
+def _sources():
+    from apps.appointments.models import Appointment
+    from apps.appointments.serializers import AppointmentListSerializer
+    from apps.customers.models import Customer
+    from apps.customers.serializers import CustomerSerializer
+    from apps.services.models import Service
+    from apps.services.serializers import ServiceSerializer
+    from apps.staff.models import Staff
+    from apps.staff.serializers import StaffSerializer
+
+    return {
+        "customers": (Customer.objects.all(), CustomerSerializer),
+        "staff": (Staff.objects.all(), StaffSerializer),
+        "services": (Service.objects.all(), ServiceSerializer),
+        "appointments": (
+            Appointment.objects.select_related("staff", "customer", "service"),
+            AppointmentListSerializer,
+        ),
+    }
+
+
+def build_workspace(business, limits):
+    """
+    Everything the dashboard needs for one business.
+
+    One query per collection (appointments joined to their staff, customer
+    and service) plus the cached stats, so the query count is fixed no
+    matter how much data the shop has.
+    """
+    payload = {"business": str(business.pk)}
+    for name, (queryset, serializer_class) in _sources().items():
+        limit = limits[name]
+        rows = list(queryset.filter(business=business)[:limit]) if limit else []
+        payload[name] = serializer_class(rows, many=True).data
+    payload["stats"] = get_business_stats(business.pk)
+    return payload
+
+
+async def abuild_workspace(business, limits):
+    """Async ``build_workspace``: the same queries through the async ORM."""
+    payload = {"business": str(business.pk)}
+    for name, (queryset, serializer_class) in _sources().items():
+        limit = limits[name]
+        rows = [row async for row in queryset.filter(business=business)[:limit]] if limit else []
+        payload[name] = serializer_class(rows, many=True).data
+    # Stats sit behind the sync cache helpers; one hop to a worker thread
+    payload["stats"] = await sync_to_async(get_business_stats)(business.pk)
+    return payload
+
+
+def _aggregate_subquery(model, aggregate):
+    rows = (
+        model.objects.filter(business=OuterRef("pk"))
+        .order_by()
+        .values("business")
+        .annotate(value=aggregate)
+        .values("value")
+    )
+    return Subquery(rows)
+
+
+def _validator_query(business):
+    from apps.appointments.models import Appointment
+    from apps.customers.models import Customer
+    from apps.services.models import Service
+    from apps.staff.models import Staff
+
+    annotations = {}
+    for name, model in (
+        ("customers", Customer),
+        ("staff", Staff),
+        ("services", Service),
+        ("appointments", Appointment),
+    ):
+        annotations[f"{name}_updated"] = _aggregate_subquery(model, Max("updated_at"))
+        annotations[f"{name}_count"] = _aggregate_subquery(model, Count("pk"))
+
+    return Business.objects.filter(pk=business.pk).annotate(**annotations).values(*annotations)
+
+
+def workspace_validator(business):
+    """
+    Cheap change detector for the whole workspace payload.
+
+    Newest ``updated_at`` and row count of every collection, read with
+    scalar subqueries in one query, plus today's date because the embedded
+    stats roll over at midnight.
+    """
+    row = _validator_query(business).first()
+    return [timezone.localdate().isoformat(), *row.values()]
+
+
+async def aworkspace_validator(business):
+    """Async ``workspace_validator``."""
+    row = await _validator_query(business).afirst()
+    return [timezone.localdate().isoformat(), *row.values()]
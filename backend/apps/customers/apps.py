@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CustomersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.customers"
+
+    def ready(self):
+        """Connect lifetime stats signals when app is ready."""
+        from .signals import connect_customer_signals
+
+        connect_customer_signals()
@@ -0,0 +1,260 @@
+"""
+Customer CSV import.
+
+The file is read as a stream and processed in chunks. In each chunk,
+phones are normalized and matched against the business's customers on
+``phone_normalized`` with a single query, so "(555) 123-4567" typed in
+the app matches "5551234567" in a file. Matches are updated by primary
+key with one ``bulk_update``; new customers are inserted with one
+``bulk_create``. Rows of other businesses are never written. Memory is
+bounded by the chunk size plus the set of phones already seen in the
+file.
+"""
+
+import csv
+import io
+import uuid
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.businesses.stats import invalidate_business_stats
+
+from .models import Customer
+from .phones import normalize_phone, phone_search_key
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Accepted header spellings, lowercased
+COLUMN_ALIASES = {
+    "name": "name",
+    "full name": "name",
+    "customer": "name",
+    "phone": "phone",
+    "phone number": "phone",
+    "mobile": "phone",
+    "email": "email",
+    "e-mail": "email",
+    "notes": "notes",
+}
+OPTIONAL_COLUMNS = ("email", "notes")
+
+NAME_MAX_LENGTH = Customer._meta.get_field("name").max_length
+
+
+def open_text(fileobj):
+    """Text stream over a binary upload or file, tolerating a UTF-8 BOM."""
+    if isinstance(fileobj, io.TextIOBase):
+        return fileobj
+    return io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+
+
+def read_rows(fileobj):
+    """
+    Yield ``(line_number, row)`` with canonical column names.
+
+    Raises ``ValueError`` if the header has no name or phone column, or
+    the file is not valid CSV (e.g. contains NUL bytes).
+    """
+    reader = csv.reader(open_text(fileobj))
+    try:
+        header = next(reader, None) or []
+    except csv.Error as error:
+        raise ValueError(f"Line {reader.line_num}: {error}")
+    columns = [COLUMN_ALIASES.get(column.strip().lower()) for column in header]
+    missing = {"name", "phone"} - set(columns)
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(sorted(missing))}")
+    while True:
+        try:
+            values = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as error:
+            raise ValueError(f"Line {reader.line_num}: {error}")
+        if not any(value.strip() for value in values):
+            continue
+        row = {column: value.strip() for column, value in zip(columns, values) if column is not None}
+        yield reader.line_num, row
+
+
+def _clean(row):
+    """Validated customer fields for one row, or ``(None, errors)``."""
+    errors = {}
+    # Depending on the Python version csv either rejects NUL or passes it
+    # through; databases don't store it
+    for column, value in row.items():
+        if "\x00" in value:
+            errors[column] = "Contains a NUL character."
+    if errors:
+        return None, errors
+    name = row.get("name", "")
+    if not name:
+        errors["name"] = "This field is required."
+    elif len(name) > NAME_MAX_LENGTH:
+        message = f"Ensure this field has no more than {NAME_MAX_LENGTH} characters."
+        errors["name"] = message
+    try:
+        phone = normalize_phone(row.get("phone"))
+    except ValueError as error:
+        errors["phone"] = str(error)
+        phone = None
+    email = row.get("email") or None
+    if email:
+        try:
+            validate_email(email)
+        except DjangoValidationError:
+            errors["email"] = "Enter a valid email address."
+    if errors:
+        return None, errors
+    data = {"name": name, "phone": phone, "phone_normalized": phone_search_key(phone)}
+    # Columns missing from the file are left untouched on existing rows
+    if "email" in row:
+        data["email"] = email
+    if "notes" in row:
+        data["notes"] = row["notes"] or None
+    return data, None
+
+
+class CustomerImport:
+    """
+    One import run into a business.
+
+    ``update_existing`` decides whether rows whose phone already belongs
+    to a customer of the same business overwrite that customer or are
+    skipped. Phones owned by another business are always rejected.
+    """
+
+    def __init__(self, business_id, update_existing=True, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.business_id = uuid.UUID(str(business_id))
+        self.update_existing = update_existing
+        self.chunk_size = chunk_size
+        self.seen = set()
+        self.counts = {"created": 0, "updated": 0, "skipped": 0, "failed": 0}
+        self.rows = []
+
+    def run(self, fileobj):
+        """Import every row of ``fileobj`` and return the report."""
+        chunk = []
+        for line, row in read_rows(fileobj):
+            chunk.append((line, row))
+            if len(chunk) >= self.chunk_size:
+                self.import_chunk(chunk)
+                chunk = []
+        if chunk:
+            self.import_chunk(chunk)
+        invalidate_business_stats(self.business_id)
+        return self.report()
+
+    def report(self):
+        rows = sorted(self.rows, key=lambda row: row["line"])
+        return {"business": str(self.business_id), **self.counts, "rows": rows}
+
+    def _record(self, line, status, **extra):
+        key = {"error": "failed", "duplicate": "skipped"}.get(status, status)
+        self.counts[key] += 1
+        self.rows.append({"line": line, "status": status, **extra})
+
+    def import_chunk(self, chunk):
+        candidates = []
+        for line, row in chunk:
+            data, errors = _clean(row)
+            if errors:
+                self._record(line, "error", errors=errors)
+            elif data["phone_normalized"] in self.seen:
+                self._record(line, "duplicate", phone=data["phone"])
+            else:
+                self.seen.add(data["phone_normalized"])
+                candidates.append((line, data))
+        if not candidates:
+            return
+
+        # Customers entered through the API keep their phone as typed, so
+        # match on the normalized key; the raw phone is unique across shops
+        keys = [data["phone_normalized"] for _, data in candidates]
+        phones = [data["phone"] for _, data in candidates]
+        existing = {}
+        taken = set()
+        for pk, phone, key, business_id in (
+            Customer.objects.filter(Q(phone_normalized__in=keys) | Q(phone__in=phones))
+            .order_by("pk")
+            .values_list("pk", "phone", "phone_normalized", "business_id")
+        ):
+            if business_id == self.business_id:
+                existing.setdefault(key, pk)
+            else:
+                taken.add(phone)
+
+        to_create, to_update = [], []
+        for line, data in candidates:
+            pk = existing.get(data["phone_normalized"])
+            if pk is not None:
+                if self.update_existing:
+                    to_update.append((line, data, pk))
+                else:
+                    self._record(line, "skipped", phone=data["phone"])
+            elif data["phone"] in taken:
+                self._record_foreign(line, data)
+            else:
+                to_create.append((line, data))
+
+        with transaction.atomic():
+            self._update(to_update)
+            created = self._create(to_create)
+        for line, data, _ in to_update:
+            self._record(line, "updated", phone=data["phone"])
+        for line, data in to_create:
+            if data["phone"] in created:
+                self._record(line, "created", phone=data["phone"])
+            else:
+                self._record_foreign(line, data)
+
+    def _record_foreign(self, line, data):
+        self._record(
+            line,
+            "error",
+            phone=data["phone"],
+            errors={"phone": "Phone belongs to another business."},
+        )
+
+    def _update(self, to_update):
+        """Overwrite matched customers of this business, by primary key."""
+        # Columns a row lacks are left untouched: one bulk_update per set
+        groups = {}
+        for _, data, pk in to_update:
+            columns = [column for column in OPTIONAL_COLUMNS if column in data]
+            groups.setdefault(tuple(columns), []).append((data, pk))
+        now = timezone.now()
+        for columns, rows in groups.items():
+            fields = ["name", *columns]
+            Customer.objects.bulk_update(
+                [Customer(pk=pk, updated_at=now, **{name: data[name] for name in fields}) for data, pk in rows],
+                [*fields, "updated_at"],
+            )
+
+    def _create(self, to_create):
+        """
+        Insert new customers; returns the phones now owned by this business.
+
+        A shop inserting the same phone since the lookup wins the unique
+        constraint: the row is left alone (never overwritten) and
+        reported as failed.
+        """
+        if not to_create:
+            return set()
+        phones = [data["phone"] for _, data in to_create]
+        Customer.objects.bulk_create(
+            [Customer(business_id=self.business_id, **data) for _, data in to_create],
+            ignore_conflicts=True,
+        )
+        return set(
+            Customer.objects.filter(business_id=self.business_id, phone__in=phones).values_list("phone", flat=True)
+        )
+
+
+def import_customers(business_id, fileobj, **options):
+    """Import a customer CSV into ``business_id`` and return the report."""
+    return CustomerImport(business_id, **options).run(fileobj)
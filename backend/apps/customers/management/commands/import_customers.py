@@ -0,0 +1,51 @@
+import json
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.businesses.models import Business
+from apps.customers.importer import DEFAULT_CHUNK_SIZE, import_customers
+
+
+class Command(BaseCommand):
+    help = "Import customers from a CSV file (name, phone, email, notes columns)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file to import")
+        parser.add_argument("--business", required=True, help="Target business id")
+        parser.add_argument(
+            "--skip-existing",
+            action="store_true",
+            help="Leave customers whose phone is already on file untouched",
+        )
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument("--report", help="Write the per-row report as JSON here")
+
+    def handle(self, *args, **options):
+        try:
+            business_id = uuid.UUID(options["business"])
+        except ValueError:
+            raise CommandError(f"Invalid business id: {options['business']}")
+        if not Business.objects.filter(pk=business_id).exists():
+            raise CommandError(f"Business {business_id} does not exist")
+
+        try:
+            with open(options["path"], "rb") as fileobj:
+                report = import_customers(
+                    business_id,
+                    fileobj,
+                    update_existing=not options["skip_existing"],
+                    chunk_size=options["chunk_size"],
+                )
+        except (OSError, ValueError) as error:
+            raise CommandError(str(error))
+
+        if options["report"]:
+            with open(options["report"], "w") as out:
+                json.dump(report, out, indent=2)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Created {created}, updated {updated}, skipped {skipped}, " "failed {failed}".format(**report)
+            )
+        )
@@ -0,0 +1,65 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from apps.customers.models import Customer
+from apps.customers.stats import recompute_customer_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild customer total_visits, total_spent and last_visit from appointments"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--business", help="Only customers of this business")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Batches updated in parallel, each on its own connection",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Customer.objects.order_by("pk")
+        if options["business"]:
+            try:
+                business_id = uuid.UUID(options["business"])
+            except ValueError:
+                raise CommandError(f"Invalid business id: {options['business']}")
+            queryset = queryset.filter(business_id=business_id)
+        if options["batch_size"] < 1 or options["workers"] < 1:
+            raise CommandError("--batch-size and --workers must be positive")
+
+        batches = self.batches(queryset, options["batch_size"])
+        if options["workers"] == 1:
+            updated = sum(self.recompute(batch) for batch in batches)
+        else:
+            with ThreadPoolExecutor(max_workers=options["workers"]) as pool:
+                updated = sum(pool.map(self.recompute_in_thread, batches))
+
+        self.stdout.write(self.style.SUCCESS(f"Recomputed stats for {updated} customers"))
+
+    @staticmethod
+    def batches(queryset, size):
+        """Customer pks in keyset-paginated batches."""
+        last = 0
+        while True:
+            batch = list(queryset.filter(pk__gt=last).values_list("pk", flat=True)[:size])
+            if not batch:
+                return
+            yield batch
+            last = batch[-1]
+
+    @staticmethod
+    def recompute(batch):
+        with transaction.atomic():
+            return recompute_customer_stats(batch)
+
+    def recompute_in_thread(self, batch):
+        try:
+            return self.recompute(batch)
+        finally:
+            # Each worker thread opened its own connection
+            connection.close()
@@ -0,0 +1,50 @@
+import django.db.models.functions.text
+from django.db import migrations, models
+
+from apps.customers.phones import phone_search_key
+
+BATCH_SIZE = 1000
+
+
+def backfill_phone_normalized(apps, schema_editor):
+    Customer = apps.get_model("customers", "Customer")
+    batch = []
+    for customer in Customer.objects.only("phone").iterator(chunk_size=BATCH_SIZE):
+        customer.phone_normalized = phone_search_key(customer.phone)
+        batch.append(customer)
+        if len(batch) >= BATCH_SIZE:
+            Customer.objects.bulk_update(batch, ["phone_normalized"])
+            batch = []
+    Customer.objects.bulk_update(batch, ["phone_normalized"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("customers", "0002_updated_at_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="customer",
+            name="phone_normalized",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=20
+            ),
+        ),
+        migrations.RunPython(backfill_phone_normalized, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="customer",
+            index=models.Index(
+                fields=["business", "phone_normalized"],
+                name="customers_busines_86dbd4_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="customer",
+            index=models.Index(
+                models.F("business"),
+                django.db.models.functions.text.Lower("name"),
+                name="customers_business_lname_idx",
+            ),
+        ),
+    ]
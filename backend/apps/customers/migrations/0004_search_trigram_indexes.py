@@ -0,0 +1,46 @@
+"""
+Indexes for the customer typeahead search.
+
+Postgres only: ``pg_trgm`` GIN indexes let ``ILIKE '%term%'`` on the
+lower-cased name and on the phone digits use an index, and a
+``text_pattern_ops`` index serves ``LIKE 'term%'`` prefix scans under any
+collation. Other backends use the btree indexes from 0003 for prefix
+matches only.
+"""
+
+from django.db import migrations
+
+INDEXES = {
+    "customers_name_trgm_idx": "USING gin (lower(name) gin_trgm_ops)",
+    "customers_phone_trgm_idx": "USING gin (phone_normalized gin_trgm_ops)",
+    "customers_business_lname_prefix_idx": (
+        "(business_id, lower(name) text_pattern_ops)"
+    ),
+}
+
+
+def add_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, definition in INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON customers {definition}"
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("customers", "0003_phone_normalized"),
+    ]
+
+    operations = [
+        migrations.RunPython(add_indexes, drop_indexes),
+    ]
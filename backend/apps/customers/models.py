@@ -1,5 +1,7 @@
 from django.db import models
+from django.db.models.functions import Lower
 from apps.businesses.models import Business
+from .phones import phone_search_key
 
 
 class Customer(models.Model):
@@ -10,6 +12,8 @@ class Customer(models.Model):
     )
     name = models.CharField(max_length=255)
     phone = models.CharField(max_length=20, unique=True)
+    # Digits of the normalized phone, kept for prefix/trigram search
+    phone_normalized = models.CharField(max_length=20, blank=True, default="", editable=False)
     email = models.EmailField(blank=True, null=True)
 
     # Customer notes and preferences
@@ -31,7 +35,17 @@ class Customer(models.Model):
         indexes = [
             models.Index(fields=["business", "phone"]),
             models.Index(fields=["business", "name"]),
+            models.Index(fields=["business", "updated_at"]),
+            models.Index(fields=["business", "phone_normalized"]),
+            models.Index("business", Lower("name"), name="customers_business_lname_idx"),
         ]
 
+    def save(self, *args, **kwargs):
+        self.phone_normalized = phone_search_key(self.phone)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "phone" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "phone_normalized"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.name} ({self.phone})"
@@ -0,0 +1,58 @@
+"""Phone number normalization used to dedupe customers."""
+
+import re
+
+from django.conf import settings
+
+_EXTENSION = re.compile(r"\s*(?:x|ext\.?|extension|#)\s*\d+\s*$", re.IGNORECASE)
+_DIGITS = re.compile(r"\D")
+_INTERNATIONAL = re.compile(r"^[\s(]*(\+|00)")
+
+MIN_DIGITS = 7
+MAX_DIGITS = 15  # E.164
+SEARCH_KEY_LENGTH = 20  # Customer.phone_normalized max_length
+
+
+def normalize_phone(raw, country_code=None):
+    """
+    Canonical E.164-style form of ``raw``: ``+`` followed by digits.
+
+    Punctuation, spaces and extensions are dropped and a leading ``00``
+    becomes ``+``. Numbers without an international prefix get
+    ``country_code`` (``PHONE_DEFAULT_COUNTRY_CODE`` by default) when one
+    is configured, and are kept as bare digits otherwise.
+    Raises ``ValueError`` when too few or too many digits remain.
+    """
+    if raw is None:
+        raise ValueError("Phone number is required.")
+    value = _EXTENSION.sub("", str(raw).strip())
+    prefix = _INTERNATIONAL.match(value)
+    international = prefix is not None
+    digits = _DIGITS.sub("", value)
+    if international and prefix.group(1) == "00":
+        digits = digits[2:]
+
+    if not international:
+        if country_code is None:
+            country_code = settings.PHONE_DEFAULT_COUNTRY_CODE
+        country_code = _DIGITS.sub("", country_code or "")
+        if country_code:
+            digits = country_code + digits.lstrip("0")
+            international = True
+
+    if not MIN_DIGITS <= len(digits) <= MAX_DIGITS:
+        raise ValueError(f"Not a valid phone number: {raw!r}")
+    return f"+{digits}" if international else digits
+
+
+def phone_search_key(raw):
+    """
+    Digits-only form stored in ``Customer.phone_normalized`` for lookups.
+
+    Numbers that cannot be normalized keep their raw digits, so every
+    customer stays searchable.
+    """
+    try:
+        return normalize_phone(raw).lstrip("+")
+    except ValueError:
+        return _DIGITS.sub("", str(raw or ""))[:SEARCH_KEY_LENGTH]
@@ -0,0 +1,59 @@
+"""
+Typeahead search over a business's customers.
+
+A query matches a customer when it is a prefix of the name, of any word in
+the name, or (with at least ``MIN_PHONE_DIGITS`` digits) of the stored
+phone digits. On Postgres the match is a substring match served by the
+``pg_trgm`` indexes.
+
+Elsewhere (SQLite in development) name and phone prefixes are ``LIKE
+'term%'`` matches over the ``(business, lower(name))`` and ``(business,
+phone_normalized)`` indexes. The match on later words of the name, ``LIKE
+'% term%'``, cannot use an index: it filters every customer of the
+business. Results are ranked by most recent visit, then visit count.
+"""
+
+from django.db import connection
+from django.db.models import F, Q
+from django.db.models.functions import Lower
+
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 50
+MIN_PHONE_DIGITS = 3
+
+RESULT_FIELDS = ("id", "name", "phone", "email", "total_visits", "last_visit")
+
+
+def _digits(term):
+    return "".join(char for char in term if char.isdigit())
+
+
+def search_filter(term, substring=None):
+    """``Q`` matching ``term`` against the name and phone search columns."""
+    if substring is None:
+        substring = connection.vendor == "postgresql"
+    term = " ".join(term.lower().split())
+    if substring:
+        condition = Q(lower_name__contains=term)
+    else:
+        # The word match scans the business's customers; see the module docstring
+        condition = Q(lower_name__startswith=term) | Q(lower_name__contains=f" {term}")
+    digits = _digits(term)
+    if len(digits) >= MIN_PHONE_DIGITS:
+        lookup = "contains" if substring else "startswith"
+        condition |= Q(**{f"phone_normalized__{lookup}": digits})
+    return condition
+
+
+def search_customers(queryset, term, limit=DEFAULT_LIMIT):
+    """Top ``limit`` customers in ``queryset`` matching ``term``, as dicts."""
+    term = term.strip()
+    if not term:
+        return []
+    limit = max(1, min(limit, MAX_LIMIT))
+    return list(
+        queryset.annotate(lower_name=Lower("name"))
+        .filter(search_filter(term))
+        .order_by(F("last_visit").desc(nulls_last=True), "-total_visits", "name", "pk")
+        .values(*RESULT_FIELDS)[:limit]
+    )
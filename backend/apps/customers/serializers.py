@@ -1,8 +1,13 @@
 from rest_framework import serializers
+from apps.businesses.bulk import PrefetchedPrimaryKeyRelatedField
+from config.fieldsets import FieldsetSerializerMixin
+from config.instrumentation import TimedSerializerMixin
 from .models import Customer
 
 
-class CustomerSerializer(serializers.ModelSerializer):
+class CustomerSerializer(TimedSerializerMixin, FieldsetSerializerMixin, serializers.ModelSerializer):
+    serializer_related_field = PrefetchedPrimaryKeyRelatedField
+
     class Meta:
         model = Customer
         fields = [
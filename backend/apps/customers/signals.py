@@ -0,0 +1,31 @@
+"""Keep customer lifetime stats in step with their appointments."""
+
+from django.db.models.signals import post_delete, post_save
+
+from .stats import VISIT_FIELDS, apply_visit_change, recompute_customer_stats
+
+
+def update_stats_on_save(sender, instance, created, **kwargs):
+    loaded = getattr(instance, "_loaded_values", None)
+    if created or (loaded is not None and set(VISIT_FIELDS) <= loaded.keys()):
+        before = None if created else instance.completed_visit(loaded=True)
+        apply_visit_change(before, instance.completed_visit())
+    else:
+        # Loaded with deferred fields: the old state is unknown
+        customers = {instance.customer_id, (loaded or {}).get("customer_id")}
+        recompute_customer_stats(customers - {None})
+
+
+def update_stats_on_delete(sender, instance, **kwargs):
+    apply_visit_change(instance.completed_visit(), None)
+
+
+def connect_customer_signals():
+    from apps.appointments.models import Appointment
+
+    post_save.connect(update_stats_on_save, sender=Appointment, dispatch_uid="customer-stats-save")
+    post_delete.connect(
+        update_stats_on_delete,
+        sender=Appointment,
+        dispatch_uid="customer-stats-delete",
+    )
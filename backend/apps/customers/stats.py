@@ -0,0 +1,97 @@
+"""
+Customer lifetime stats: ``total_visits``, ``total_spent`` and ``last_visit``.
+
+A completed appointment is one visit, worth its ``price``, on its
+``scheduled_at``. The counters are kept up to date incrementally:
+appointment saves and deletes that move a row into or out of
+``completed`` apply the difference with a single ``F()`` ``UPDATE`` in
+the same transaction as the write. ``recompute_customer_stats`` rebuilds
+them from the appointment history for backfills and repairs.
+"""
+
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Case, Count, DecimalField, F, Max, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Now
+
+from .models import Customer
+
+VISIT_FIELDS = ("status", "customer_id", "price", "scheduled_at")
+
+
+def _completed(customer=OuterRef("pk")):
+    from apps.appointments.models import Appointment
+
+    return Appointment.objects.filter(customer=customer, status="completed").order_by().values("customer")
+
+
+def _aggregate(expression, alias):
+    return Subquery(_completed().annotate(**{alias: expression}).values(alias)[:1])
+
+
+def _latest_visit():
+    return _aggregate(Max("scheduled_at"), "latest")
+
+
+def add_visit(customer_id, price, when):
+    Customer.objects.filter(pk=customer_id).update(
+        total_visits=F("total_visits") + 1,
+        total_spent=F("total_spent") + price,
+        last_visit=Case(
+            When(last_visit__isnull=True, then=Value(when)),
+            When(last_visit__lt=when, then=Value(when)),
+            default=F("last_visit"),
+        ),
+        updated_at=Now(),
+    )
+
+
+def remove_visit(customer_id, price, when):
+    Customer.objects.filter(pk=customer_id).update(
+        total_visits=F("total_visits") - 1,
+        total_spent=F("total_spent") - price,
+        # A maximum cannot be decremented; look it up only when it was ours
+        last_visit=Case(
+            When(last_visit=when, then=_latest_visit()),
+            default=F("last_visit"),
+        ),
+        updated_at=Now(),
+    )
+
+
+def apply_visit_change(before, after):
+    """
+    Move a customer's counters from ``before`` to ``after``.
+
+    Both are ``Appointment.completed_visit()`` tuples or ``None``.
+    """
+    if before == after:
+        return
+    with transaction.atomic():
+        if before is not None:
+            remove_visit(*before)
+        if after is not None:
+            add_visit(*after)
+
+
+def recompute_customer_stats(customer_ids=None):
+    """
+    Rebuild lifetime stats from the appointment history.
+
+    One ``UPDATE`` with correlated subqueries over the
+    ``(customer, scheduled_at)`` index. Returns the number of rows updated.
+    """
+    queryset = Customer.objects.all()
+    if customer_ids is not None:
+        queryset = queryset.filter(pk__in=list(customer_ids))
+    return queryset.update(
+        total_visits=Coalesce(_aggregate(Count("pk"), "visits"), 0),
+        total_spent=Coalesce(
+            _aggregate(Sum("price"), "spent"),
+            Value(Decimal("0.00")),
+            output_field=DecimalField(max_digits=10, decimal_places=2),
+        ),
+        last_visit=_latest_visit(),
+        updated_at=Now(),
+    )
@@ -0,0 +1,33 @@
+import io
+import uuid
+
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+
+from .importer import import_customers
+
+
+def import_task_key(task_id):
+    """Cache key holding the business a queued import belongs to."""
+    return f"customer_import:{task_id}"
+
+
+def queue_import(content, business_id, update_existing=True):
+    """
+    Queue ``import_customers_csv`` for a CSV text; returns the task id.
+
+    The content travels in the task message, so workers need no storage
+    shared with the web pods. The business is recorded under the task id
+    first, for the status endpoint to check access before answering.
+    """
+    task_id = str(uuid.uuid4())
+    cache.set(import_task_key(task_id), str(business_id), settings.CELERY_RESULT_EXPIRES)
+    import_customers_csv.apply_async((content, str(business_id), update_existing), task_id=task_id)
+    return task_id
+
+
+@shared_task
+def import_customers_csv(content, business_id, update_existing=True):
+    """Import a customer CSV handed over by the upload endpoint."""
+    return import_customers(business_id, io.StringIO(content, newline=""), update_existing=update_existing)
@@ -0,0 +1,215 @@
+"""API tests for Customer endpoints"""
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.businesses import bulk
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestConditionalGet:
+    """Test ETag / If-None-Match handling on list and detail endpoints"""
+
+    def test_list_not_modified(self, authenticated_client, customer):
+        """Test repeating a list request with its ETag returns 304"""
+        url = reverse("customer-list")
+        first = authenticated_client.get(url)
+        assert first.status_code == status.HTTP_200_OK
+
+        second = authenticated_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+        assert second["ETag"] == first["ETag"]
+        assert not second.content
+
+    def test_list_etag_changes_on_update(self, authenticated_client, customer):
+        """Test edits and deletions invalidate the list ETag"""
+        url = reverse("customer-list")
+        etag = authenticated_client.get(url)["ETag"]
+
+        customer.name = "Someone Else"
+        customer.save()
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+        etag = response["ETag"]
+        customer.delete()
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_list_etag_varies_by_query(self, authenticated_client, customer):
+        """Test different query strings get different ETags"""
+        url = reverse("customer-list")
+        etag = authenticated_client.get(url)["ETag"]
+        response = authenticated_client.get(url, {"business": str(customer.business_id)}, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_not_modified_uses_one_query(self, authenticated_client, customer, django_assert_num_queries):
+        """Test a 304 costs only the validator query"""
+        url = reverse("customer-list")
+        params = {"business": str(customer.business_id)}
+        etag = authenticated_client.get(url, params)["ETag"]
+        with django_assert_num_queries(1):
+            authenticated_client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+    def test_detail_not_modified(self, authenticated_client, customer):
+        """Test detail endpoints honor If-None-Match"""
+        url = reverse("customer-detail", kwargs={"pk": customer.id})
+        etag = authenticated_client.get(url)["ETag"]
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        customer.save()
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_missing_detail_still_404(self, authenticated_client):
+        """Test unknown objects are not masked by the validator"""
+        url = reverse("customer-detail", kwargs={"pk": 999999})
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH="*")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize(
+        "name", ["customer-detail", "staff-detail", "service-detail", "appointment-detail", "business-detail"]
+    )
+    def test_malformed_pk_is_404(self, authenticated_client, name):
+        """Test a pk that doesn't parse is a 404, not a server error"""
+        url = reverse(name, kwargs={"pk": "not-a-pk"})
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_appointment_etag_tracks_nested_rows(self, authenticated_client, appointment):
+        """Test renaming a related staff member changes the appointment ETag"""
+        url = reverse("appointment-detail", kwargs={"pk": appointment.id})
+        etag = authenticated_client.get(url)["ETag"]
+
+        appointment.staff.name = "New Barber"
+        appointment.staff.save()
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["staff_details"]["name"] == "New Barber"
+
+    def test_cached_catalog_not_modified(self, authenticated_client, service, django_assert_num_queries):
+        """Test cached catalog lists answer 304 without the database"""
+        url = reverse("service-list")
+        params = {"business": str(service.business_id)}
+        etag = authenticated_client.get(url, params)["ETag"]
+
+        with django_assert_num_queries(0):
+            response = authenticated_client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestBulkCustomers:
+    """Test the list-body bulk customer endpoint"""
+
+    def test_bulk_create_with_fixed_query_count(self, authenticated_client, business, django_assert_max_num_queries):
+        """Test many rows are validated and written in a handful of queries"""
+        url = reverse("customer-bulk")
+        rows = [{"business": str(business.id), "name": f"Client {i}", "phone": f"555{i:04}"} for i in range(200)]
+
+        with django_assert_max_num_queries(10):
+            response = authenticated_client.post(url, rows, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["created"] == 200
+        assert business.customers.count() == 200
+
+    def test_bulk_checks_access_once_per_business(self, authenticated_client, business, monkeypatch):
+        """Test business access is checked per business, not per row"""
+        checked = []
+
+        def can_access_business(user, business_id):
+            checked.append(business_id)
+            return True
+
+        monkeypatch.setattr(bulk, "can_access_business", can_access_business)
+        rows = [{"business": str(business.id), "name": f"Client {i}", "phone": f"555{i:04}"} for i in range(50)]
+
+        response = authenticated_client.post(reverse("customer-bulk"), rows, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert checked == [business.id]
+
+    def test_bulk_create_reports_row_errors(self, authenticated_client, business, customer):
+        """Test invalid and duplicate rows fail while valid rows are written"""
+        url = reverse("customer-bulk")
+        rows = [
+            {"business": str(business.id), "name": "Ok", "phone": "5550001"},
+            {"business": str(business.id), "name": "Dup", "phone": "5550001"},
+            {"business": str(business.id), "name": "Taken", "phone": customer.phone},
+            {"business": str(business.id), "phone": "5550002"},
+            {"business": "not-a-business", "name": "Bad", "phone": "5550003"},
+        ]
+
+        response = authenticated_client.post(url, rows, format="json")
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        statuses = [result["status"] for result in response.data["results"]]
+        assert statuses == ["created", "error", "error", "error", "error"]
+        errors = [result.get("errors", {}) for result in response.data["results"]]
+        assert "phone" in errors[1] and "phone" in errors[2]
+        assert "name" in errors[3] and "business" in errors[4]
+
+    def test_bulk_update(self, authenticated_client, customer):
+        """Test rows are updated by id and unknown ids are reported"""
+        url = reverse("customer-bulk")
+        rows = [{"id": customer.id, "notes": "VIP"}, {"id": 999999, "notes": "x"}]
+
+        response = authenticated_client.patch(url, rows, format="json")
+
+        assert response.status_code == status.HTTP_207_MULTI_STATUS
+        customer.refresh_from_db()
+        assert customer.notes == "VIP"
+        assert response.data["results"][1]["errors"] == {"id": ["Not found."]}
+
+    def test_bulk_delete(self, authenticated_client, customer):
+        """Test rows are deleted by id"""
+        url = reverse("customer-bulk")
+
+        response = authenticated_client.delete(url, [customer.id], format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["deleted"] == 1
+
+    def test_bulk_requires_list(self, authenticated_client):
+        """Test a non-list body is rejected"""
+        response = authenticated_client.post(reverse("customer-bulk"), {"name": "x"}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestCustomerExport:
+    """Test the streaming customer export"""
+
+    def test_csv_neutralizes_formulas(self, authenticated_client, business, customer):
+        """Test cells that look like spreadsheet formulas are escaped"""
+        customer.name = "=HYPERLINK(1)"
+        customer.notes = "-1+cmd|' /C calc'!A0"
+        customer.save()
+
+        response = authenticated_client.get(reverse("customer-export"), {"business": str(business.id)})
+
+        body = b"".join(response.streaming_content).decode()
+        assert "'=HYPERLINK(1)" in body
+        assert "'-1+cmd" in body
+        assert 'filename="customer-' in response["Content-Disposition"]
+
+    def test_csv_keeps_phones(self, authenticated_client, business, customer):
+        """Test E.164 phones are exported as they are, not as escaped text"""
+        customer.phone = "+15551234567"
+        customer.save()
+
+        response = authenticated_client.get(reverse("customer-export"), {"business": str(business.id)})
+
+        body = b"".join(response.streaming_content).decode()
+        assert ",+15551234567," in body
+        assert "'+1555" not in body
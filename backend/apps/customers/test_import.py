@@ -0,0 +1,267 @@
+"""Tests for customer CSV import"""
+
+import csv
+import io
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+
+from apps.customers import tasks, views
+from apps.customers.importer import CustomerImport, import_customers
+from apps.customers.models import Customer
+from apps.customers.phones import normalize_phone
+
+
+def csv_file(text):
+    return io.BytesIO(text.encode())
+
+
+@pytest.mark.unit
+class TestNormalizePhone:
+    """Test phone normalization"""
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("+1 (555) 123-4567", "+15551234567"),
+            ("0044 20 7946 0958", "+442079460958"),
+            ("555.123.4567 ext. 89", "5551234567"),
+        ],
+    )
+    def test_normalize(self, raw, expected):
+        """Test punctuation, 00 prefixes and extensions are handled"""
+        assert normalize_phone(raw, country_code="") == expected
+
+    def test_default_country_code(self):
+        """Test national numbers get the configured calling code"""
+        assert normalize_phone("0300 123 4567", country_code="57") == "+573001234567"
+
+    @pytest.mark.parametrize("raw", ["", "12-34", "+1234567890123456", None])
+    def test_invalid(self, raw):
+        """Test numbers with too few or too many digits are rejected"""
+        with pytest.raises(ValueError):
+            normalize_phone(raw)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestCustomerImport:
+    """Test the chunked customer importer"""
+
+    def test_import_creates_updates_and_dedupes(self, business, customer):
+        """Test one upsert per chunk and a per-row report"""
+        customer.phone = "+15550000001"
+        customer.save()
+        source = csv_file(
+            "Name,Phone,Email\n"
+            "Updated Name,+1 555 000 0001,\n"
+            "New Client,+1 555 000 0002,new@example.com\n"
+            "Same Client,(+1) 555-000-0002,\n"
+            ",+1 555 000 0003,\n"
+            "Bad Email,+1 555 000 0004,nope\n"
+        )
+
+        report = import_customers(business.id, source, chunk_size=2)
+
+        assert [row["status"] for row in report["rows"]] == [
+            "updated",
+            "created",
+            "duplicate",
+            "error",
+            "error",
+        ]
+        assert (report["created"], report["updated"], report["skipped"]) == (1, 1, 1)
+        assert report["failed"] == 2
+        customer.refresh_from_db()
+        assert customer.name == "Updated Name"
+        assert Customer.objects.get(phone="+15550000002").business == business
+
+    def test_phone_of_other_business_rejected(self, business, customer):
+        """Test a phone owned by another shop is never taken over"""
+        from conftest import BusinessFactory
+
+        other = BusinessFactory()
+        customer.phone = "+15550000009"
+        customer.save()
+
+        report = import_customers(other.id, csv_file("name,phone\nX,+15550000009\n"))
+
+        assert report["failed"] == 1
+        customer.refresh_from_db()
+        assert customer.business == business and customer.name != "X"
+
+    def test_matches_phone_as_typed_in_app(self, authenticated_client, business):
+        """Test a file row updates the customer whose phone was typed differently"""
+        authenticated_client.post(
+            reverse("customer-list"),
+            {"business": str(business.id), "name": "Typed", "phone": "(555) 123-4567"},
+        )
+
+        report = import_customers(business.id, csv_file("name,phone\nFrom File,5551234567\n"))
+
+        assert (report["created"], report["updated"]) == (0, 1)
+        assert business.customers.get().name == "From File"
+
+    def test_other_business_never_overwritten(self, business, customer):
+        """Test a phone inserted by another shop since the lookup is not taken over"""
+        from conftest import BusinessFactory
+
+        other = BusinessFactory()
+        importer = CustomerImport(other.id)
+        customer.phone = "+15550000010"
+        customer.save()
+
+        # As if the other shop's lookup ran before this customer existed
+        created = importer._create([(2, {"name": "X", "phone": "+15550000010", "phone_normalized": "1"})])
+
+        assert created == set()
+        customer.refresh_from_db()
+        assert customer.business == business and customer.name != "X"
+
+    def test_invalid_csv_rejected(self, business):
+        """Test csv errors (here an oversized field) are a ValueError"""
+        field = "x" * (csv.field_size_limit() + 1)
+        with pytest.raises(ValueError):
+            import_customers(business.id, csv_file(f"name,phone\n{field},1\n"))
+
+    def test_nul_byte_is_row_error(self, business):
+        """Test a NUL byte fails its row instead of reaching the database"""
+        report = import_customers(business.id, csv_file("name,phone\nA\0,+15550001000\n"))
+
+        assert report["failed"] == 1
+        assert not business.customers.exists()
+
+    def test_skip_existing(self, business, customer):
+        """Test existing customers are left alone when asked"""
+        customer.phone = "+15550000001"
+        customer.save()
+
+        report = import_customers(
+            business.id,
+            csv_file("name,phone\nRenamed,+15550000001\n"),
+            update_existing=False,
+        )
+
+        assert report["skipped"] == 1
+        customer.refresh_from_db()
+        assert customer.name != "Renamed"
+
+    def test_missing_columns(self, business):
+        """Test files without a phone column are rejected"""
+        with pytest.raises(ValueError):
+            import_customers(business.id, csv_file("name,email\nA,a@b.co\n"))
+
+    def test_management_command(self, business, tmp_path):
+        """Test the import_customers command"""
+        path = tmp_path / "customers.csv"
+        path.write_text("name,phone\nA,+15550001000\nB,+15550001001\n")
+
+        call_command("import_customers", str(path), business=str(business.id))
+
+        assert business.customers.count() == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestCustomerImportAPI:
+    """Test the customer import endpoint"""
+
+    def upload(self, text="name,phone\nA,+15550002000\n"):
+        return SimpleUploadedFile("customers.csv", text.encode(), "text/csv")
+
+    def test_small_file_imported_inline(self, authenticated_client, business):
+        """Test small uploads return the report directly"""
+        response = authenticated_client.post(
+            reverse("customer-import-csv"),
+            {"file": self.upload(), "business": str(business.id)},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["created"] == 1
+
+    def test_large_file_queued(self, authenticated_client, business, settings, monkeypatch):
+        """Test large uploads are handed to the Celery task with their content"""
+        settings.CUSTOMER_IMPORT_SYNC_MAX_BYTES = 0
+        queued = []
+        monkeypatch.setattr(
+            tasks.import_customers_csv, "apply_async", lambda args, task_id: queued.append((args, task_id))
+        )
+
+        response = authenticated_client.post(
+            reverse("customer-import-csv"),
+            {"file": self.upload(), "business": str(business.id)},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        args, task_id = queued[0]
+        assert response.data["task"] == task_id
+        tasks.import_customers_csv(*args)
+        assert business.customers.count() == 1
+
+    def test_oversized_file_rejected(self, authenticated_client, business, settings):
+        """Test uploads over CUSTOMER_IMPORT_MAX_BYTES return 400"""
+        settings.CUSTOMER_IMPORT_MAX_BYTES = 10
+        response = authenticated_client.post(
+            reverse("customer-import-csv"),
+            {"file": self.upload(), "business": str(business.id)},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_status_requires_business_access(self, authenticated_client, api_client, business, monkeypatch):
+        """Test only users of the import's business can poll it"""
+        from conftest import UserFactory
+
+        class FakeResult:
+            status = "FAILURE"
+            result = ValueError("Line 2: boom")
+
+            def __init__(self, task_id):
+                pass
+
+            def successful(self):
+                return False
+
+            def failed(self):
+                return True
+
+        monkeypatch.setattr(tasks.import_customers_csv, "apply_async", lambda args, task_id: None)
+        monkeypatch.setattr(views, "AsyncResult", FakeResult)
+        task_id = tasks.queue_import("name,phone\n", business.id)
+        url = reverse("customer-import-status", kwargs={"task_id": task_id})
+
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["error"] == "Line 2: boom"
+
+        api_client.force_authenticate(user=UserFactory())
+        assert api_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+        unknown = reverse("customer-import-status", kwargs={"task_id": "not-a-task"})
+        assert authenticated_client.get(unknown).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_bad_file_rejected(self, authenticated_client, business):
+        """Test a CSV without the required columns returns 400"""
+        response = authenticated_client.post(
+            reverse("customer-import-csv"),
+            {"file": self.upload("foo,bar\n1,2\n"), "business": str(business.id)},
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_invalid_csv_returns_400(self, authenticated_client, business):
+        """Test a file that is not valid CSV returns 400"""
+        field = "x" * (csv.field_size_limit() + 1)
+        response = authenticated_client.post(
+            reverse("customer-import-csv"),
+            {
+                "file": self.upload(f"name,phone\n{field},1\n"),
+                "business": str(business.id),
+            },
+            format="multipart",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,101 @@
+"""Tests for customer typeahead search"""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.businesses.models import Business
+from apps.customers.models import Customer
+
+
+def make_customer(business, name, phone, **extra):
+    return Customer.objects.create(business=business, name=name, phone=phone, **extra)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestCustomerSearch:
+    """Test GET /api/customers/search/"""
+
+    def search(self, client, business, q, **params):
+        url = reverse("customer-search")
+        return client.get(url, {"business": business.id, "q": q, **params})
+
+    def test_matches_name_and_word_prefixes(self, authenticated_client, business):
+        """Test the query matches the start of the name or of any word"""
+        make_customer(business, "Maria Lopez", "+573001110001")
+        make_customer(business, "Lorenzo Diaz", "+573001110002")
+        make_customer(business, "Ana Perez", "+573001110003")
+
+        response = self.search(authenticated_client, business, "lo")
+
+        assert response.status_code == status.HTTP_200_OK
+        names = {row["name"] for row in response.data["results"]}
+        assert names == {"Maria Lopez", "Lorenzo Diaz"}
+        assert set(response.data["results"][0]) == {
+            "id",
+            "name",
+            "phone",
+            "email",
+            "total_visits",
+            "last_visit",
+        }
+
+    def test_matches_phone_digits(self, authenticated_client, business):
+        """Test punctuation in stored or typed phones is ignored"""
+        customer = make_customer(business, "Phone Match", "+57 (300) 222-0001")
+        make_customer(business, "Other", "+573009990001")
+
+        response = self.search(authenticated_client, business, "57 300-22")
+
+        assert [row["id"] for row in response.data["results"]] == [customer.id]
+        customer.refresh_from_db()
+        assert customer.phone_normalized == "573002220001"
+
+    def test_ranked_by_recency_then_visits(self, authenticated_client, business):
+        """Test recent visitors come first and never-seen customers last"""
+        now = timezone.now()
+        never = make_customer(business, "Sam Never", "+10000000001")
+        old = make_customer(business, "Sam Old", "+10000000002", last_visit=now - timedelta(days=30))
+        recent = make_customer(business, "Sam Recent", "+10000000003", last_visit=now - timedelta(days=1))
+        busier = make_customer(
+            business,
+            "Sam Busy",
+            "+10000000004",
+            last_visit=now - timedelta(days=30),
+            total_visits=9,
+        )
+
+        response = self.search(authenticated_client, business, "sam", limit=3)
+
+        ids = [row["id"] for row in response.data["results"]]
+        assert ids == [recent.id, busier.id, old.id]
+        assert never.id not in ids
+
+    def test_scoped_to_business(self, authenticated_client, business, user):
+        """Test other businesses' customers are never returned"""
+        other = Business.objects.create(owner=user, name="Second shop")
+        make_customer(other, "Hidden Client", "+10000000005")
+
+        response = self.search(authenticated_client, business, "hidden")
+
+        assert response.data["results"] == []
+
+    def test_requires_access_to_business(self, authenticated_client, user):
+        """Test searching a business the user does not own is forbidden"""
+        stranger = get_user_model().objects.create_user("stranger", password="x")
+        foreign = Business.objects.create(owner=stranger, name="Foreign")
+
+        response = self.search(authenticated_client, foreign, "a")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_requires_business(self, authenticated_client):
+        """Test the business parameter is mandatory"""
+        response = authenticated_client.get(reverse("customer-search"), {"q": "a"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,106 @@
+"""Tests for incrementally maintained customer lifetime stats"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.appointments.models import Appointment
+from apps.customers.models import Customer
+
+
+def book(customer, staff, service, days_ago, status="completed", price="20.00"):
+    return Appointment.objects.create(
+        business=customer.business,
+        staff=staff,
+        customer=customer,
+        service=service,
+        scheduled_at=timezone.now() - timedelta(days=days_ago),
+        status=status,
+        price=Decimal(price),
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestLifetimeStats:
+    """Test status transitions keep customer counters current"""
+
+    def test_completion_counts_visit(self, customer, staff, service):
+        """Test completing an appointment adds a visit"""
+        appointment = book(customer, staff, service, 3, status="confirmed")
+        appointment.status = "completed"
+        appointment.save()
+
+        customer.refresh_from_db()
+        assert customer.total_visits == 1
+        assert customer.total_spent == Decimal("20.00")
+        assert customer.last_visit == appointment.scheduled_at
+
+    def test_leaving_completed_reverts_visit(self, customer, staff, service):
+        """Test un-completing restores the previous latest visit"""
+        older = book(customer, staff, service, 10)
+        newer = book(customer, staff, service, 2, price="35.00")
+
+        newer = Appointment.objects.get(pk=newer.pk)
+        newer.status = "cancelled"
+        newer.save()
+
+        customer.refresh_from_db()
+        assert customer.total_visits == 1
+        assert customer.total_spent == Decimal("20.00")
+        assert customer.last_visit == older.scheduled_at
+
+    def test_delete_and_price_change(self, customer, staff, service):
+        """Test price edits and deletes of completed visits are applied"""
+        first = book(customer, staff, service, 5)
+        second = book(customer, staff, service, 4)
+
+        first.price = Decimal("50.00")
+        first.save()
+        second.delete()
+
+        customer.refresh_from_db()
+        assert customer.total_visits == 1
+        assert customer.total_spent == Decimal("50.00")
+        assert customer.last_visit == first.scheduled_at
+
+    def test_patch_via_api(self, authenticated_client, customer, staff, service):
+        """Test status changes through the API update the counters"""
+        appointment = book(customer, staff, service, 1, status="in_progress")
+        url = reverse("appointment-detail", kwargs={"pk": appointment.id})
+
+        response = authenticated_client.patch(url, {"status": "completed"})
+
+        assert response.status_code == status.HTTP_200_OK
+        customer.refresh_from_db()
+        assert customer.total_visits == 1
+
+    def test_bulk_update_rebuilds_stats(self, authenticated_client, customer, staff, service):
+        """Test the bulk endpoint keeps counters current without signals"""
+        appointment = book(customer, staff, service, 1, status="confirmed")
+
+        authenticated_client.patch(
+            reverse("appointment-bulk"),
+            [{"id": appointment.id, "status": "completed"}],
+            format="json",
+        )
+
+        customer.refresh_from_db()
+        assert customer.total_visits == 1
+
+    def test_recompute_command_repairs(self, customer, staff, service):
+        """Test the management command rebuilds drifted counters"""
+        appointment = book(customer, staff, service, 6, price="42.50")
+        Customer.objects.filter(pk=customer.pk).update(total_visits=99, total_spent=0, last_visit=None)
+
+        call_command("recompute_customer_stats", batch_size=1)
+
+        customer.refresh_from_db()
+        assert customer.total_visits == 1
+        assert customer.total_spent == Decimal("42.50")
+        assert customer.last_visit == appointment.scheduled_at
@@ -1,17 +1,148 @@
-from rest_framework import viewsets
+from celery.result import AsyncResult
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.response import Response
+from apps.businesses.bulk import BulkWriteMixin
+from apps.businesses.models import Business
+from apps.businesses.tenancy import (
+    TenantScopedMixin,
+    can_access_business,
+    parse_business_id,
+)
+from config.conditional import ConditionalGetMixin
+from config.export import ExportMixin
+from config.fastlist import CompiledListMixin
+from config.fieldsets import FieldsetViewMixin
+from .importer import import_customers
 from .models import Customer
+from .phones import phone_search_key
+from .search import DEFAULT_LIMIT, search_customers
 from .serializers import CustomerSerializer
+from .tasks import import_task_key, queue_import
 
 
-class CustomerViewSet(viewsets.ModelViewSet):
+class CustomerViewSet(
+    BulkWriteMixin,
+    ExportMixin,
+    ConditionalGetMixin,
+    FieldsetViewMixin,
+    CompiledListMixin,
+    TenantScopedMixin,
+    viewsets.ModelViewSet,
+):
     """
-    ViewSet for Customer CRUD operations
+    ViewSet for Customer CRUD operations, scoped to the user's businesses
+
+    ``/api/customers/bulk/`` creates, updates or deletes many at once;
+    ``/api/customers/export/`` streams them as CSV or JSON Lines;
+    ``/api/customers/import/`` loads a CSV upload;
+    ``/api/customers/search/`` is the booking form's typeahead.
     """
 
     queryset = Customer.objects.all()
     serializer_class = CustomerSerializer
+    export_columns = {
+        column: column
+        for column in (
+            "id",
+            "business_id",
+            "name",
+            "phone",
+            "email",
+            "total_visits",
+            "total_spent",
+            "last_visit",
+            "notes",
+            "created_at",
+        )
+    }
+    bulk_derived_fields = ("phone_normalized",)
     # permission_classes = [permissions.AllowAny]  # Using global settings
 
-    def get_queryset(self):
-        """Return all customers for development"""
-        return Customer.objects.all()
+    def bulk_build(self, data, instance=None):
+        customer = super().bulk_build(data, instance)
+        customer.phone_normalized = phone_search_key(customer.phone)
+        return customer
+
+    @action(detail=False, methods=["get"])
+    def search(self, request):
+        """
+        Typeahead search by name or phone within one business.
+
+        GET /api/customers/search/?business=<uuid>&q=<term>&limit=10
+
+        Returns a short list of light rows, most recent visitors first.
+        """
+        business_id = parse_business_id(request.query_params.get("business"))
+        if not can_access_business(request.user, business_id):
+            raise PermissionDenied("You do not have access to this business.")
+        try:
+            limit = int(request.query_params.get("limit", DEFAULT_LIMIT))
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        queryset = Customer.objects.filter(business_id=business_id)
+        results = search_customers(queryset, request.query_params.get("q", ""), limit=limit)
+        return Response({"results": results})
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser, FormParser],
+    )
+    def import_csv(self, request):
+        """
+        Import a customer CSV into a business.
+
+        POST /api/customers/import/  (multipart: file, business, update_existing)
+
+        Small files are imported in the request and the per-row report is
+        returned. Larger ones, up to ``CUSTOMER_IMPORT_MAX_BYTES``, are
+        queued for a Celery worker: the response is ``202`` with a task id
+        to poll at ``/api/customers/import/<id>/``.
+        """
+        upload = request.FILES.get("file")
+        if upload is None:
+            raise ValidationError({"file": "This field is required."})
+        business_id = parse_business_id(request.data.get("business"))
+        if not can_access_business(request.user, business_id):
+            raise PermissionDenied("You do not have access to this business.")
+        if not Business.objects.filter(pk=business_id).exists():
+            raise ValidationError({"business": "Unknown business."})
+        update_existing = str(request.data.get("update_existing", "true")).lower()
+        update_existing = update_existing not in ("false", "0", "no")
+
+        if upload.size > settings.CUSTOMER_IMPORT_MAX_BYTES:
+            raise ValidationError({"file": f"Files over {settings.CUSTOMER_IMPORT_MAX_BYTES} bytes are not accepted."})
+
+        if upload.size <= settings.CUSTOMER_IMPORT_SYNC_MAX_BYTES:
+            try:
+                report = import_customers(business_id, upload.file, update_existing=update_existing)
+            except ValueError as error:
+                raise ValidationError({"file": str(error)})
+            return Response(report)
+
+        try:
+            content = upload.read().decode("utf-8-sig")
+        except UnicodeDecodeError:
+            raise ValidationError({"file": "The file is not UTF-8 text."})
+        task_id = queue_import(content, business_id, update_existing)
+        return Response({"task": task_id, "status": "queued"}, status=status.HTTP_202_ACCEPTED)
+
+    @action(detail=False, methods=["get"], url_path=r"import/(?P<task_id>[\w-]+)")
+    def import_status(self, request, task_id=None):
+        """State of a queued import, with its report once finished."""
+        business_id = cache.get(import_task_key(task_id))
+        if business_id is None or not can_access_business(request.user, business_id):
+            raise NotFound()
+        result = AsyncResult(task_id)
+        payload = {"task": task_id, "status": result.status.lower()}
+        if result.successful():
+            payload["report"] = result.result
+        elif result.failed():
+            payload["error"] = str(result.result)
+        return Response(payload)
@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import DailyRollup
+
+
+@admin.register(DailyRollup)
+class DailyRollupAdmin(admin.ModelAdmin):
+    list_display = ["day", "business", "staff", "service", "appointments", "revenue"]
+    list_filter = ["day"]
+    search_fields = ["business__name", "staff__name"]
+    date_hierarchy = "day"
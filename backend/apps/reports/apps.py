@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class ReportsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.reports"
+
+    def ready(self):
+        """Connect rollup invalidation signals when app is ready."""
+        from .signals import connect_rollup_signals
+
+        connect_rollup_signals()
@@ -0,0 +1,45 @@
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.appointments.models import Appointment
+from apps.reports.rollups import mark_dirty, refresh_rollups
+
+
+class Command(BaseCommand):
+    help = "Mark every appointment day dirty and rebuild the daily rollups"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--business", help="Only this business")
+        parser.add_argument(
+            "--mark-only",
+            action="store_true",
+            help="Queue the days for the Celery Beat task instead of rebuilding",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Appointment.objects.all()
+        if options["business"]:
+            try:
+                queryset = queryset.filter(business_id=uuid.UUID(options["business"]))
+            except ValueError:
+                raise CommandError(f"Invalid business id: {options['business']}")
+
+        days = (
+            queryset.annotate(day=TruncDate("scheduled_at", tzinfo=timezone.get_current_timezone()))
+            .order_by()
+            .values_list("business_id", "day")
+            .distinct()
+        )
+        pairs = list(days)
+        mark_dirty(pairs)
+        if options["mark_only"]:
+            self.stdout.write(self.style.SUCCESS(f"Marked {len(pairs)} days"))
+            return
+
+        rebuilt = 0
+        while batch := refresh_rollups():
+            rebuilt += batch
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rebuilt} days"))
@@ -0,0 +1,112 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("businesses", "0001_initial"),
+        ("services", "0002_updated_at_index"),
+        ("staff", "0002_updated_at_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("appointments", models.PositiveIntegerField(default=0)),
+                ("scheduled", models.PositiveIntegerField(default=0)),
+                ("confirmed", models.PositiveIntegerField(default=0)),
+                ("in_progress", models.PositiveIntegerField(default=0)),
+                ("completed", models.PositiveIntegerField(default=0)),
+                ("cancelled", models.PositiveIntegerField(default=0)),
+                ("no_show", models.PositiveIntegerField(default=0)),
+                (
+                    "revenue",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=12),
+                ),
+                ("booked_minutes", models.PositiveIntegerField(default=0)),
+                (
+                    "business",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_rollups",
+                        to="businesses.business",
+                    ),
+                ),
+                (
+                    "service",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="daily_rollups",
+                        to="services.service",
+                    ),
+                ),
+                (
+                    "staff",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_rollups",
+                        to="staff.staff",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "daily_rollups",
+                "ordering": ["day"],
+                "indexes": [
+                    models.Index(
+                        fields=["business", "day"],
+                        name="daily_rollu_busines_1a6a91_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="DirtyDay",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("marked_at", models.DateTimeField(auto_now=True)),
+                (
+                    "business",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dirty_days",
+                        to="businesses.business",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "rollup_dirty_days",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("business", "day"), name="rollup_dirty_day_unique"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,67 @@
+from django.db import models
+
+from apps.businesses.models import Business
+from apps.services.models import Service
+from apps.staff.models import Staff
+
+
+class DailyRollup(models.Model):
+    """
+    Appointment totals for one business, day, staff member and service
+
+    Rebuilt a whole (business, day) at a time by ``refresh_rollups``, so
+    reports never have to scan the appointments table.
+    """
+
+    business = models.ForeignKey(Business, on_delete=models.CASCADE, related_name="daily_rollups")
+    day = models.DateField()
+    staff = models.ForeignKey(Staff, on_delete=models.CASCADE, related_name="daily_rollups")
+    service = models.ForeignKey(
+        Service,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="daily_rollups",
+    )
+
+    # Appointment counts, in total and per status
+    appointments = models.PositiveIntegerField(default=0)
+    scheduled = models.PositiveIntegerField(default=0)
+    confirmed = models.PositiveIntegerField(default=0)
+    in_progress = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    cancelled = models.PositiveIntegerField(default=0)
+    no_show = models.PositiveIntegerField(default=0)
+
+    # Price of completed appointments
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    # Chair time held by appointments that were not cancelled or no-shows
+    booked_minutes = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "daily_rollups"
+        ordering = ["day"]
+        indexes = [
+            models.Index(fields=["business", "day"]),
+        ]
+
+    def __str__(self):
+        return f"{self.business_id} {self.day} staff={self.staff_id}"
+
+
+class DirtyDay(models.Model):
+    """A (business, day) whose rollups must be rebuilt"""
+
+    business = models.ForeignKey(Business, on_delete=models.CASCADE, related_name="dirty_days")
+    day = models.DateField()
+    # Re-marking bumps this, so a rebuild that raced a write is redone
+    marked_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "rollup_dirty_days"
+        constraints = [
+            models.UniqueConstraint(fields=["business", "day"], name="rollup_dirty_day_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.business_id} {self.day}"
@@ -0,0 +1,186 @@
+"""
+Incrementally maintained daily rollups.
+
+Appointment writes mark the (business, day) pairs they touch in
+``DirtyDay``. The ``refresh_rollups`` Celery Beat task rebuilds only those
+days: each rebuild reads one business-day of appointments and replaces
+its ``DailyRollup`` rows. Reports then sum at most one row per day, staff
+member and service, so a year is O(days) however busy the shop is.
+
+A day is only rebuilt while its marker row is locked. Runs that overlap
+(a Beat tick during ``rebuild_rollups``, or a run longer than the
+schedule interval) skip days another run holds, instead of both
+replacing the same rows and counting them twice.
+"""
+
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import DecimalField, F, Sum
+from django.db.models.functions import Coalesce, TruncMonth, TruncWeek
+from django.utils import timezone
+
+from apps.appointments.models import NON_BLOCKING_STATUSES, Appointment
+
+from .models import DailyRollup, DirtyDay
+
+STATUSES = [status for status, _ in Appointment.STATUS_CHOICES]
+COUNT_FIELDS = ["appointments", *STATUSES, "booked_minutes"]
+
+DEFAULT_REFRESH_LIMIT = 500
+
+PERIODS = {
+    "day": F("day"),
+    "week": TruncWeek("day"),
+    "month": TruncMonth("day"),
+}
+BREAKDOWNS = {
+    "staff": ("staff_id", "staff__name"),
+    "service": ("service_id", "service__name"),
+}
+
+
+def day_bounds(day):
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return start, start + timedelta(days=1)
+
+
+def local_day(moment):
+    """Calendar day of ``moment`` in the current time zone."""
+    if timezone.is_naive(moment):
+        # Saved naive values are interpreted in the current time zone too
+        return moment.date()
+    return timezone.localdate(moment)
+
+
+def touched_days(appointment, deleted=False):
+    """(business_id, day) pairs a write to ``appointment`` affects."""
+    pairs = {(appointment.business_id, local_day(appointment.scheduled_at))}
+    loaded = getattr(appointment, "_loaded_values", {})
+    if not deleted and "scheduled_at" in loaded:
+        business_id = loaded.get("business_id", appointment.business_id)
+        pairs.add((business_id, local_day(loaded["scheduled_at"])))
+    return pairs
+
+
+def mark_dirty(pairs):
+    """Queue (business_id, day) pairs for rebuilding with one upsert."""
+    rows = [DirtyDay(business_id=business, day=day) for business, day in set(pairs)]
+    if rows:
+        DirtyDay.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["business", "day"],
+            update_fields=["marked_at"],
+        )
+
+
+def _empty_totals():
+    return {**{field: 0 for field in COUNT_FIELDS}, "revenue": Decimal("0")}
+
+
+def rebuild_day(business_id, day):
+    """
+    Replace the rollup rows of one business-day from its appointments.
+
+    Call it inside a transaction holding the day's ``DirtyDay`` lock (see
+    ``refresh_rollups``), so no other rebuild interleaves.
+    """
+    start, end = day_bounds(day)
+    rows = Appointment.objects.filter(
+        business_id=business_id, scheduled_at__gte=start, scheduled_at__lt=end
+    ).values_list("staff_id", "service_id", "status", "price", "scheduled_at", "ends_at")
+
+    totals = {}
+    for staff_id, service_id, status, price, scheduled_at, ends_at in rows:
+        entry = totals.setdefault((staff_id, service_id), _empty_totals())
+        entry["appointments"] += 1
+        entry[status] += 1
+        if status == "completed":
+            entry["revenue"] += price
+        if status not in NON_BLOCKING_STATUSES:
+            entry["booked_minutes"] += int((ends_at - scheduled_at).total_seconds() // 60)
+
+    with transaction.atomic():
+        DailyRollup.objects.filter(business_id=business_id, day=day).delete()
+        DailyRollup.objects.bulk_create(
+            DailyRollup(
+                business_id=business_id,
+                day=day,
+                staff_id=staff_id,
+                service_id=service_id,
+                **entry,
+            )
+            for (staff_id, service_id), entry in totals.items()
+        )
+
+
+def refresh_rollups(limit=DEFAULT_REFRESH_LIMIT):
+    """
+    Rebuild up to ``limit`` dirty days, oldest mark first.
+
+    Each marker is locked (``skip_locked``) before its day is rebuilt and
+    deleted in the same transaction; markers another run holds are left
+    to it. A write that re-marks the day waits for the lock and marks it
+    again afterwards, so it is picked up on the next run. Returns the
+    number of days rebuilt.
+    """
+    pending = list(DirtyDay.objects.order_by("marked_at").values_list("pk", "business_id", "day")[:limit])
+    rebuilt = 0
+    for pk, business_id, day in pending:
+        with transaction.atomic():
+            claimed = DirtyDay.objects.select_for_update(skip_locked=True).filter(pk=pk).first()
+            if claimed is None:
+                # Rebuilt meanwhile, or being rebuilt by another run
+                continue
+            rebuild_day(business_id, day)
+            claimed.delete()
+        rebuilt += 1
+    return rebuilt
+
+
+def _sums():
+    sums = {field: Coalesce(Sum(field), 0) for field in COUNT_FIELDS}
+    sums["revenue"] = Coalesce(
+        Sum("revenue"),
+        Decimal("0"),
+        output_field=DecimalField(max_digits=14, decimal_places=2),
+    )
+    return sums
+
+
+def _format_row(row):
+    row["revenue"] = str(Decimal(row["revenue"]).quantize(Decimal("0.01")))
+    return row
+
+
+def revenue_report(business_id, start, end, period="day", breakdown=None):
+    """
+    Rollup totals per ``period`` for days in ``[start, end]``.
+
+    ``period`` is day, week or month; ``breakdown`` optionally splits each
+    period by staff or service. Three small queries over the
+    ``(business, day)`` indexes, whatever the number of appointments.
+    """
+    group = ["period", *BREAKDOWNS.get(breakdown, ())]
+    rows = (
+        DailyRollup.objects.filter(business_id=business_id, day__range=(start, end))
+        .annotate(period=PERIODS[period])
+        .values(*group)
+        .annotate(**_sums())
+        .order_by(*group)
+    )
+    totals = DailyRollup.objects.filter(business_id=business_id, day__range=(start, end)).aggregate(**_sums())
+    # Days changed since the last refresh; their figures may lag behind
+    pending = DirtyDay.objects.filter(business_id=business_id, day__range=(start, end)).count()
+    return {
+        "business": str(business_id),
+        "from": start.isoformat(),
+        "to": end.isoformat(),
+        "period": period,
+        "breakdown": breakdown,
+        "pending_days": pending,
+        "totals": _format_row(totals),
+        "rows": [_format_row(row) for row in rows],
+    }
@@ -0,0 +1,20 @@
+"""Mark rollup days dirty whenever appointments change."""
+
+from django.db.models.signals import post_delete, post_save
+
+from .rollups import mark_dirty, touched_days
+
+
+def mark_days_on_save(sender, instance, **kwargs):
+    mark_dirty(touched_days(instance))
+
+
+def mark_days_on_delete(sender, instance, **kwargs):
+    mark_dirty(touched_days(instance, deleted=True))
+
+
+def connect_rollup_signals():
+    from apps.appointments.models import Appointment
+
+    post_save.connect(mark_days_on_save, sender=Appointment, dispatch_uid="rollup-days-save")
+    post_delete.connect(mark_days_on_delete, sender=Appointment, dispatch_uid="rollup-days-delete")
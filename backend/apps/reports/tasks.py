@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from .rollups import DEFAULT_REFRESH_LIMIT, refresh_rollups
+
+
+@shared_task(ignore_result=True)
+def refresh_daily_rollups(limit=DEFAULT_REFRESH_LIMIT):
+    """Rebuild the rollups of days touched since the last run."""
+    return refresh_rollups(limit)
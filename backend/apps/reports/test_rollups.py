@@ -0,0 +1,146 @@
+"""Tests for daily rollups and the reports endpoint"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.appointments.models import Appointment
+from apps.reports import rollups
+from apps.reports.models import DailyRollup, DirtyDay
+from apps.reports.rollups import refresh_rollups
+from apps.reports.tasks import refresh_daily_rollups
+
+
+@pytest.fixture
+def book(business, staff, customer, service):
+    def book(days_ago, status="completed", price="25.00", hour=10):
+        day = timezone.localdate() - timedelta(days=days_ago)
+        return Appointment.objects.create(
+            business=business,
+            staff=staff,
+            customer=customer,
+            service=service,
+            scheduled_at=timezone.make_aware(timezone.datetime(day.year, day.month, day.day, hour)),
+            status=status,
+            price=Decimal(price),
+        )
+
+    return book
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestRollups:
+    """Test incremental rollup maintenance"""
+
+    def test_writes_mark_days_and_refresh_rebuilds(self, book, business, service):
+        """Test only touched days are rebuilt and markers are cleared"""
+        book(3)
+        book(3, status="cancelled", hour=11)
+        book(3, status="scheduled", hour=12)
+        assert DirtyDay.objects.count() == 1
+
+        assert refresh_rollups() == 1
+
+        (rollup,) = DailyRollup.objects.filter(business=business)
+        assert rollup.appointments == 3
+        assert (rollup.completed, rollup.cancelled, rollup.scheduled) == (1, 1, 1)
+        assert rollup.revenue == Decimal("25.00")
+        assert rollup.booked_minutes == 2 * service.duration
+        assert not DirtyDay.objects.exists()
+        assert refresh_rollups() == 0
+
+    def test_moving_appointment_marks_both_days(self, book):
+        """Test rescheduling dirties the old and the new day"""
+        appointment = book(5)
+        refresh_rollups()
+
+        appointment = Appointment.objects.get(pk=appointment.pk)
+        appointment.scheduled_at -= timedelta(days=1)
+        appointment.save()
+
+        assert DirtyDay.objects.count() == 2
+        refresh_rollups()
+        days = list(DailyRollup.objects.values_list("day", flat=True))
+        assert days == [timezone.localdate() - timedelta(days=6)]
+
+    def test_days_claimed_by_another_run_are_skipped(self, book, monkeypatch):
+        """Test a day rebuilt by an overlapping run is not rebuilt again"""
+        book(2)
+        book(3)
+        rebuilt = []
+
+        def rebuild_day(business_id, day):
+            # Another run takes the remaining day while this one works
+            DirtyDay.objects.exclude(day=day).delete()
+            rebuilt.append(day)
+
+        monkeypatch.setattr(rollups, "rebuild_day", rebuild_day)
+
+        assert refresh_rollups() == 1
+        assert len(rebuilt) == 1
+        assert not DirtyDay.objects.exists()
+
+    def test_celery_task_and_rebuild_command(self, book):
+        """Test the beat task and the backfill command"""
+        book(2)
+        refresh_daily_rollups()
+        assert DailyRollup.objects.count() == 1
+
+        DailyRollup.objects.all().delete()
+        call_command("rebuild_rollups")
+        assert DailyRollup.objects.count() == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestReportsAPI:
+    """Test reports served from the rollups"""
+
+    def test_monthly_report(self, authenticated_client, business, book, staff):
+        """Test totals per period with a staff breakdown"""
+        book(1, price="30.00")
+        book(2, price="20.00")
+        refresh_rollups()
+        url = reverse("business-reports", kwargs={"pk": business.id})
+
+        response = authenticated_client.get(url, {"period": "month", "by": "staff"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["totals"]["revenue"] == "50.00"
+        assert response.data["totals"]["completed"] == 2
+        assert {row["staff__name"] for row in response.data["rows"]} == {staff.name}
+        assert response.data["pending_days"] == 0
+
+    def test_dashboard_month_uses_rollups(self, authenticated_client, business, book):
+        """Test the dashboard month adds rolled-up days to today's figures"""
+        if timezone.localdate().day == 1:
+            pytest.skip("No earlier day in the current month")
+        book(1, price="30.00")
+        refresh_rollups()
+        book(0, price="5.00")
+
+        url = reverse("business-stats", kwargs={"pk": business.id})
+        month = authenticated_client.get(url).data["month"]
+
+        assert month["total"] == 2
+        assert month["revenue"] == "35.00"
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"period": "year"},
+            {"by": "customer"},
+            {"from": "2025-02-01", "to": "2025-01-01"},
+        ],
+    )
+    def test_invalid_params(self, authenticated_client, business, params):
+        """Test unsupported report parameters return 400"""
+        url = reverse("business-reports", kwargs={"pk": business.id})
+        response = authenticated_client.get(url, params)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -27,6 +27,7 @@ class Service(models.Model):
         ordering = ["name"]
         indexes = [
             models.Index(fields=["business", "is_active"]),
+            models.Index(fields=["business", "updated_at"]),
         ]
 
     def __str__(self):
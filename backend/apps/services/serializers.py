@@ -1,8 +1,10 @@
 from rest_framework import serializers
+from config.fieldsets import FieldsetSerializerMixin
+from config.instrumentation import TimedSerializerMixin
 from .models import Service
 
 
-class ServiceSerializer(serializers.ModelSerializer):
+class ServiceSerializer(TimedSerializerMixin, FieldsetSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Service
         fields = [
@@ -0,0 +1,89 @@
+"""API tests for Service endpoints"""
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestCatalogCache:
+    """Test the per-business read-through cache on catalog lists"""
+
+    @pytest.mark.parametrize("route", ["service-list", "staff-list"])
+    def test_second_read_skips_database(
+        self,
+        authenticated_client,
+        business,
+        service,
+        staff,
+        route,
+        django_assert_num_queries,
+    ):
+        """Test steady-state catalog reads do not touch the database"""
+        url = reverse(route)
+        params = {"business": str(business.id)}
+
+        first = authenticated_client.get(url, params)
+        with django_assert_num_queries(0):
+            second = authenticated_client.get(url, params)
+
+        assert first["X-Cache"] == "MISS"
+        assert second["X-Cache"] == "HIT"
+        assert second.data == first.data
+
+    def test_save_invalidates_cached_list(self, authenticated_client, business, service):
+        """Test editing a service refreshes the cached list"""
+        url = reverse("service-list")
+        params = {"business": str(business.id)}
+        authenticated_client.get(url, params)
+
+        service.name = "Renamed Cut"
+        service.save()
+        response = authenticated_client.get(url, params)
+
+        assert response["X-Cache"] == "MISS"
+        assert response.data["results"][0]["name"] == "Renamed Cut"
+
+    def test_delete_invalidates_cached_list(self, authenticated_client, business, service):
+        """Test deleting a service refreshes the cached list"""
+        url = reverse("service-list")
+        params = {"business": str(business.id)}
+        authenticated_client.get(url, params)
+
+        service.delete()
+        response = authenticated_client.get(url, params)
+
+        assert response.data["results"] == []
+
+    def test_unscoped_list_is_not_cached(self, authenticated_client, service):
+        """Test lists without ?business= bypass the cache"""
+        response = authenticated_client.get(reverse("service-list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert "X-Cache" not in response
+
+    def test_foreign_business_not_served_from_cache(self, api_client, business, service):
+        """Test a cached catalog is not leaked to other tenants"""
+        from conftest import UserFactory
+
+        owner = business.owner
+        api_client.force_authenticate(user=owner)
+        api_client.get(reverse("service-list"), {"business": str(business.id)})
+
+        api_client.force_authenticate(user=UserFactory())
+        response = api_client.get(reverse("service-list"), {"business": str(business.id)})
+
+        assert response.data["results"] == []
+
+    def test_cache_counters(self, authenticated_client, business, service):
+        """Test hit/miss counters are exposed"""
+        url = reverse("service-list")
+        params = {"business": str(business.id)}
+        authenticated_client.get(url, params)
+        authenticated_client.get(url, params)
+
+        response = authenticated_client.get(reverse("service-cache-stats"))
+
+        assert response.data["hits"] == 1
+        assert response.data["misses"] == 1
+        assert response.data["hit_ratio"] == 0.5
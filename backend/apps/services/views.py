@@ -1,17 +1,18 @@
 from rest_framework import viewsets
+from apps.businesses.tenancy import CachedListMixin, TenantScopedMixin
+from config.fieldsets import FieldsetViewMixin
 from .models import Service
 from .serializers import ServiceSerializer
 
 
-class ServiceViewSet(viewsets.ModelViewSet):
+class ServiceViewSet(CachedListMixin, FieldsetViewMixin, TenantScopedMixin, viewsets.ModelViewSet):
     """
-    ViewSet for Service CRUD operations
+    ViewSet for Service CRUD operations, scoped to the user's businesses
+
+    ``?business=`` list responses are served from a per-business cache.
     """
 
     queryset = Service.objects.all()
     serializer_class = ServiceSerializer
+    cache_namespace = "services"
     # permission_classes = [permissions.AllowAny]  # Using global settings
-
-    def get_queryset(self):
-        """Return all services for development"""
-        return Service.objects.all()
@@ -0,0 +1,55 @@
+"""Async mirrors of the availability endpoints (see ``config.async_views``)."""
+
+from django.http import Http404
+from rest_framework.exceptions import ValidationError
+
+from apps.businesses.tenancy import parse_business_id
+from config.async_views import async_api_view, json_response, tenant_queryset
+
+from .models import Staff
+from .views import aslots_for, availability_window, parse_span, requested_service, slot_payload, window_payload
+
+
+async def _window(params, business_id):
+    start, end = parse_span(params)
+    services = requested_service(params, business_id)
+    service = await services.afirst() if services is not None else None
+    return availability_window(params, start, end, service)
+
+
+@async_api_view
+async def staff_availability(request, pk):
+    """GET /api/async/staff/{id}/availability/?service=&from=&to="""
+    staff = await tenant_queryset(request, Staff.objects.all())
+    member = await staff.filter(pk=pk).afirst()
+    if member is None:
+        raise Http404
+    window = await _window(request.query_params, member.business_id)
+    slots = (await aslots_for([member], window))[member.id]
+    return json_response({"staff": member.id, **window_payload(window), "slots": slot_payload(slots)})
+
+
+@async_api_view
+async def business_availability(request):
+    """GET /api/async/staff/availability/?business=<id>&service=&from=&to="""
+    if not request.query_params.get("business"):
+        raise ValidationError({"business": "This parameter is required."})
+    business_id = parse_business_id(request.query_params["business"])
+    staff = await tenant_queryset(request, Staff.objects.all())
+    members = [member async for member in staff.filter(is_active=True)]
+    window = await _window(request.query_params, business_id)
+    slots = await aslots_for(members, window)
+    return json_response(
+        {
+            "business": str(business_id),
+            **window_payload(window),
+            "staff": [
+                {
+                    "staff": member.id,
+                    "name": member.name,
+                    "slots": slot_payload(slots[member.id]),
+                }
+                for member in members
+            ],
+        }
+    )
@@ -0,0 +1,219 @@
+"""
+Free-slot search over staff schedules and booked appointments.
+
+``Staff.schedule`` maps weekdays to working intervals in the business's
+local time::
+
+    {
+        "monday": [["09:00", "12:00"], ["13:00", "18:00"]],
+        "tue": {"start": "10:00", "end": "16:00"},
+        "sunday": []
+    }
+
+Day keys are full names or three-letter abbreviations; days that are not
+listed are days off. An empty schedule falls back to
+``DEFAULT_WORKING_HOURS``.
+
+Working hours and appointments are compiled into sorted interval lists
+and subtracted with a linear merge, so a month-long window across a whole
+shop is a handful of queries plus O(intervals) Python.
+"""
+
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+
+from apps.appointments.models import DEFAULT_DURATION_MINUTES, Appointment
+
+WEEKDAYS = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+]
+
+DAY_ALIASES = {alias: index for index, day in enumerate(WEEKDAYS) for alias in (day, day[:3])}
+
+DEFAULT_WORKING_HOURS = {day: [["09:00", "18:00"]] for day in WEEKDAYS if day != "sunday"}
+
+DEFAULT_DURATION = DEFAULT_DURATION_MINUTES
+DEFAULT_STEP = 15
+
+
+def _parse_time(value):
+    if value in ("24:00", "24:00:00"):
+        return time.max
+    return time.fromisoformat(value)
+
+
+def _parse_interval(raw):
+    if isinstance(raw, dict):
+        start, end = raw.get("start"), raw.get("end")
+    elif isinstance(raw, (list, tuple)) and len(raw) == 2:
+        start, end = raw
+    else:
+        raise ValueError(f"Invalid working interval: {raw!r}")
+    try:
+        start, end = _parse_time(start), _parse_time(end)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid working interval: {raw!r}")
+    if start >= end:
+        raise ValueError(f"Working interval ends before it starts: {raw!r}")
+    return start, end
+
+
+def compile_schedule(schedule):
+    """
+    Normalize a ``Staff.schedule`` into ``{weekday: [(start, end), ...]}``.
+
+    Weekdays follow ``date.weekday()`` (Monday is 0). Raises ``ValueError``
+    for anything that cannot be read.
+    """
+    if not schedule:
+        schedule = DEFAULT_WORKING_HOURS
+    if not isinstance(schedule, dict):
+        raise ValueError("Schedule must be an object keyed by weekday.")
+
+    compiled = {}
+    for key, raw in schedule.items():
+        weekday = DAY_ALIASES.get(str(key).strip().lower())
+        if weekday is None:
+            raise ValueError(f"Unknown weekday: {key!r}")
+        if isinstance(raw, dict) or (isinstance(raw, (list, tuple)) and len(raw) == 2 and isinstance(raw[0], str)):
+            raw = [raw]
+        intervals = sorted(_parse_interval(item) for item in raw or [])
+        compiled[weekday] = _merge(intervals)
+    return compiled
+
+
+def _merge(intervals):
+    """Merge sorted, possibly overlapping intervals."""
+    merged = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def working_intervals(compiled, start, end, tz=None):
+    """Concrete working datetime intervals within ``[start, end)``."""
+    tz = tz or timezone.get_current_timezone()
+    day = timezone.localtime(start, tz).date()
+    last_day = timezone.localtime(end, tz).date()
+    intervals = []
+    while day <= last_day:
+        for open_at, close_at in compiled.get(day.weekday(), []):
+            opens = timezone.make_aware(datetime.combine(day, open_at), tz)
+            closes = timezone.make_aware(datetime.combine(day, close_at), tz)
+            opens, closes = max(opens, start), min(closes, end)
+            if opens < closes:
+                intervals.append((opens, closes))
+        day += timedelta(days=1)
+    return intervals
+
+
+def subtract(free, busy):
+    """
+    Remove ``busy`` from ``free``; both sorted by start time.
+
+    A single forward pass over both lists.
+    """
+    result = []
+    busy = _merge(sorted(busy))
+    index = 0
+    for start, end in free:
+        cursor = start
+        while index < len(busy) and busy[index][1] <= cursor:
+            index += 1
+        probe = index
+        while probe < len(busy) and busy[probe][0] < end:
+            busy_start, busy_end = busy[probe]
+            if busy_start > cursor:
+                result.append((cursor, busy_start))
+            cursor = max(cursor, busy_end)
+            probe += 1
+        if cursor < end:
+            result.append((cursor, end))
+    return result
+
+
+def slots_in(free, duration, step):
+    """Bookable slot starts of length ``duration`` on a ``step`` grid."""
+    slots = []
+    step_seconds = int(step.total_seconds())
+    for start, end in free:
+        if start.microsecond:
+            start = start.replace(microsecond=0) + timedelta(seconds=1)
+        # Align to the grid so slots read 09:00, 09:15, ... not 09:07
+        offset = int(start.timestamp()) % step_seconds
+        cursor = start + timedelta(seconds=(step_seconds - offset) % step_seconds)
+        while cursor + duration <= end:
+            slots.append((cursor, cursor + duration))
+            cursor += step
+    return slots
+
+
+def find_slots(schedule, busy, start, end, duration, step):
+    """Free slots for one staff member given their busy intervals."""
+    free = subtract(working_intervals(compile_schedule(schedule), start, end), busy)
+    return slots_in(free, duration, step)
+
+
+def _busy_rows(staff_ids, start, end):
+    return (
+        Appointment.objects.blocking()
+        .filter(staff_id__in=staff_ids)
+        .overlapping(start, end)
+        .values_list("staff_id", "scheduled_at", "ends_at")
+    )
+
+
+def _group_busy(staff_ids, rows):
+    busy = {staff_id: [] for staff_id in staff_ids}
+    for staff_id, scheduled_at, ends_at in rows:
+        busy[staff_id].append((scheduled_at, ends_at))
+    return busy
+
+
+def busy_intervals(staff_ids, start, end):
+    """
+    Booked intervals per staff member overlapping ``[start, end)``.
+
+    One query over the ``(staff, ends_at)`` index.
+    """
+    return _group_busy(staff_ids, _busy_rows(staff_ids, start, end))
+
+
+async def abusy_intervals(staff_ids, start, end):
+    """Async ``busy_intervals``."""
+    rows = [row async for row in _busy_rows(staff_ids, start, end)]
+    return _group_busy(staff_ids, rows)
+
+
+def _free_slots(staff_members, busy, start, end, duration, step):
+    return {
+        member.id: find_slots(member.schedule, busy[member.id], start, end, duration, step) for member in staff_members
+    }
+
+
+def availability_for(staff_members, start, end, duration, step):
+    """``{staff.id: [(slot_start, slot_end), ...]}`` for each staff member."""
+    start = max(start, timezone.now())
+    if start >= end:
+        return {member.id: [] for member in staff_members}
+    busy = busy_intervals([member.id for member in staff_members], start, end)
+    return _free_slots(staff_members, busy, start, end, duration, step)
+
+
+async def aavailability_for(staff_members, start, end, duration, step):
+    """Async ``availability_for``."""
+    start = max(start, timezone.now())
+    if start >= end:
+        return {member.id: [] for member in staff_members}
+    busy = await abusy_intervals([member.id for member in staff_members], start, end)
+    return _free_slots(staff_members, busy, start, end, duration, step)
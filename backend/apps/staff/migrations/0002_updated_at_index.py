@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("staff", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="staff",
+            index=models.Index(
+                fields=["business", "updated_at"], name="staff_busines_7e65fe_idx"
+            ),
+        ),
+    ]
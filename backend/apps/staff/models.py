@@ -37,6 +37,7 @@ class Staff(models.Model):
         ordering = ["name"]
         indexes = [
             models.Index(fields=["business", "is_active"]),
+            models.Index(fields=["business", "updated_at"]),
         ]
 
     def __str__(self):
@@ -1,8 +1,11 @@
 from rest_framework import serializers
+from config.fieldsets import FieldsetSerializerMixin
+from config.instrumentation import TimedSerializerMixin
+from .availability import compile_schedule
 from .models import Staff
 
 
-class StaffSerializer(serializers.ModelSerializer):
+class StaffSerializer(TimedSerializerMixin, FieldsetSerializerMixin, serializers.ModelSerializer):
     role_display = serializers.CharField(source="get_role_display", read_only=True)
 
     class Meta:
@@ -23,3 +26,10 @@ class StaffSerializer(serializers.ModelSerializer):
             "updated_at",
         ]
         read_only_fields = ["id", "created_at", "updated_at"]
+
+    def validate_schedule(self, value):
+        try:
+            compile_schedule(value)
+        except ValueError as error:
+            raise serializers.ValidationError(str(error))
+        return value
@@ -0,0 +1,168 @@
+"""Tests for staff availability and free-slot search"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from apps.appointments.models import Appointment
+from apps.staff.availability import compile_schedule, find_slots, subtract
+
+
+def aware(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+# 2030-01-07 is a Monday
+MONDAY = aware(2030, 1, 7)
+
+
+@pytest.mark.unit
+class TestIntervals:
+    """Test schedule compilation and interval arithmetic"""
+
+    def test_compile_accepts_aliases_and_shapes(self):
+        """Test day aliases and both interval shapes are understood"""
+        compiled = compile_schedule(
+            {
+                "mon": [["13:00", "18:00"], ["09:00", "12:00"]],
+                "Tuesday": {"start": "10:00", "end": "16:00"},
+                "sunday": [],
+            }
+        )
+        assert [(s.hour, e.hour) for s, e in compiled[0]] == [(9, 12), (13, 18)]
+        assert [(s.hour, e.hour) for s, e in compiled[1]] == [(10, 16)]
+        assert compiled[6] == []
+
+    @pytest.mark.parametrize(
+        "schedule",
+        [{"funday": []}, {"monday": [["18:00", "09:00"]]}, {"monday": ["nope"]}],
+    )
+    def test_compile_rejects_invalid(self, schedule):
+        """Test unreadable schedules raise ValueError"""
+        with pytest.raises(ValueError):
+            compile_schedule(schedule)
+
+    def test_subtract_splits_free_time(self):
+        """Test busy intervals carve holes out of free time"""
+        free = [(MONDAY, MONDAY + timedelta(hours=8))]
+        busy = [
+            (MONDAY + timedelta(hours=1), MONDAY + timedelta(hours=2)),
+            (MONDAY + timedelta(hours=1, minutes=30), MONDAY + timedelta(hours=3)),
+        ]
+        assert subtract(free, busy) == [
+            (MONDAY, MONDAY + timedelta(hours=1)),
+            (MONDAY + timedelta(hours=3), MONDAY + timedelta(hours=8)),
+        ]
+
+    def test_find_slots_skips_booked_time(self):
+        """Test slots are laid on the step grid around bookings"""
+        schedule = {"monday": [["09:00", "11:00"]]}
+        nine = MONDAY + timedelta(hours=9)
+        busy = [(nine + timedelta(minutes=30), nine + timedelta(minutes=60))]
+
+        slots = find_slots(
+            schedule,
+            busy,
+            MONDAY,
+            MONDAY + timedelta(days=1),
+            timedelta(minutes=30),
+            timedelta(minutes=30),
+        )
+
+        assert [s.strftime("%H:%M") for s, _ in slots] == ["09:00", "10:00", "10:30"]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestAvailabilityAPI:
+    """Test the staff availability endpoints"""
+
+    @pytest.fixture
+    def monday_staff(self, staff):
+        staff.schedule = {"monday": [["09:00", "12:00"]]}
+        staff.save()
+        return staff
+
+    def test_staff_availability(self, authenticated_client, monday_staff, service, customer):
+        """Test booked appointments are removed from a staff member's slots"""
+        Appointment.objects.create(
+            business=monday_staff.business,
+            staff=monday_staff,
+            customer=customer,
+            service=service,
+            scheduled_at=MONDAY + timedelta(hours=10),
+            price=service.price,
+        )
+        Appointment.objects.create(
+            business=monday_staff.business,
+            staff=monday_staff,
+            customer=customer,
+            service=service,
+            scheduled_at=MONDAY + timedelta(hours=11),
+            status="cancelled",
+            price=service.price,
+        )
+        url = reverse("staff-availability", args=[monday_staff.id])
+
+        response = authenticated_client.get(
+            url,
+            {"service": service.id, "from": "2030-01-07", "to": "2030-01-08"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["duration"] == service.duration
+        starts = [slot["start"][11:16] for slot in response.data["slots"]]
+        assert "10:00" not in starts and "10:15" not in starts
+        assert "09:00" in starts and "11:00" in starts and "11:30" in starts
+
+    def test_business_availability(self, authenticated_client, business, monday_staff, service):
+        """Test the business-wide view lists every active staff member"""
+        response = authenticated_client.get(
+            reverse("staff-business-availability"),
+            {
+                "business": str(business.id),
+                "from": "2030-01-07",
+                "to": "2030-01-08",
+                "duration": 60,
+                "step": 60,
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        (entry,) = response.data["staff"]
+        assert entry["staff"] == monday_staff.id
+        assert [slot["start"][11:16] for slot in entry["slots"]] == [
+            "09:00",
+            "10:00",
+            "11:00",
+        ]
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"from": "2030-01-07", "to": "2030-03-01"},
+            {"from": "2030-01-08", "to": "2030-01-07"},
+            {"from": "not-a-date"},
+            {"step": 0},
+            {"service": "abc"},
+        ],
+    )
+    def test_invalid_window(self, authenticated_client, staff, params):
+        """Test bad windows are rejected"""
+        url = reverse("staff-availability", args=[staff.id])
+        response = authenticated_client.get(url, params)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_business_availability_requires_business(self, authenticated_client):
+        """Test the business-wide view needs ?business="""
+        response = authenticated_client.get(reverse("staff-business-availability"))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_invalid_schedule_rejected(self, authenticated_client, staff):
+        """Test the staff API validates schedules"""
+        url = reverse("staff-detail", args=[staff.id])
+        response = authenticated_client.patch(url, {"schedule": {"monday": [["18:00", "09:00"]]}}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
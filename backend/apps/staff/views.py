@@ -1,17 +1,197 @@
+from datetime import datetime, time, timedelta
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from apps.businesses.tenancy import (
+    CachedListMixin,
+    TenantScopedMixin,
+    parse_business_id,
+)
+from apps.services.models import Service
+from config.fieldsets import FieldsetViewMixin
+from .availability import (
+    DEFAULT_DURATION,
+    DEFAULT_STEP,
+    aavailability_for,
+    availability_for,
+)
 from .models import Staff
 from .serializers import StaffSerializer
 
+MAX_AVAILABILITY_WINDOW = timedelta(days=31)
+DEFAULT_AVAILABILITY_WINDOW = timedelta(days=7)
 
-class StaffViewSet(viewsets.ModelViewSet):
+
+def _parse_moment(value, param):
+    """Accept an ISO date (local midnight) or datetime."""
+    try:
+        moment = parse_datetime(value)
+        day = None if moment else parse_date(value)
+    except ValueError:
+        moment = day = None
+    if moment is None:
+        if day is None:
+            raise ValidationError({param: "Must be an ISO date or datetime."})
+        moment = datetime.combine(day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def _parse_minutes(params, param, default, low, high):
+    value = params.get(param)
+    if value in (None, ""):
+        return default
+    try:
+        minutes = int(value)
+    except ValueError:
+        raise ValidationError({param: "Must be a number of minutes."})
+    if not low <= minutes <= high:
+        raise ValidationError({param: f"Must be between {low} and {high}."})
+    return minutes
+
+
+def parse_span(params):
+    """Validated ``(start, end)`` of an availability request."""
+    start = _parse_moment(params["from"], "from") if params.get("from") else timezone.now()
+    end = _parse_moment(params["to"], "to") if params.get("to") else start + DEFAULT_AVAILABILITY_WINDOW
+    if end <= start:
+        raise ValidationError({"to": "Must be after 'from'."})
+    if end - start > MAX_AVAILABILITY_WINDOW:
+        raise ValidationError({"to": "Window may span at most 31 days."})
+    return start, end
+
+
+def requested_service(params, business_id):
+    """Queryset for the ``?service=`` of the business, if one was given."""
+    if not params.get("service"):
+        return None
+    try:
+        service_id = int(params["service"])
+    except ValueError:
+        raise ValidationError({"service": "Must be a service id."})
+    return Service.objects.filter(pk=service_id, business_id=business_id)
+
+
+def availability_window(params, start, end, service):
+    """Slot length and grid for a request; ``service`` is the looked-up row."""
+    if params.get("service") and service is None:
+        raise ValidationError({"service": "Unknown service for this business."})
+    duration = _parse_minutes(
+        params,
+        "duration",
+        service.duration if service else DEFAULT_DURATION,
+        5,
+        12 * 60,
+    )
+    step = _parse_minutes(params, "step", DEFAULT_STEP, 5, 240)
+    return {
+        "service": service,
+        "start": start,
+        "end": end,
+        "duration": timedelta(minutes=duration),
+        "step": timedelta(minutes=step),
+    }
+
+
+def _window_args(window):
+    return window["start"], window["end"], window["duration"], window["step"]
+
+
+def slots_for(staff_members, window):
+    try:
+        return availability_for(staff_members, *_window_args(window))
+    except ValueError as error:
+        raise ValidationError({"schedule": str(error)})
+
+
+async def aslots_for(staff_members, window):
+    try:
+        return await aavailability_for(staff_members, *_window_args(window))
+    except ValueError as error:
+        raise ValidationError({"schedule": str(error)})
+
+
+def window_payload(window):
+    return {
+        "service": window["service"].pk if window["service"] else None,
+        "duration": int(window["duration"].total_seconds() // 60),
+        "from": window["start"].isoformat(),
+        "to": window["end"].isoformat(),
+    }
+
+
+def slot_payload(slots):
+    return [{"start": s.isoformat(), "end": e.isoformat()} for s, e in slots]
+
+
+class StaffViewSet(CachedListMixin, FieldsetViewMixin, TenantScopedMixin, viewsets.ModelViewSet):
     """
-    ViewSet for Staff CRUD operations
+    ViewSet for Staff CRUD operations, scoped to the user's businesses
+
+    ``?business=`` list responses are served from a per-business cache.
     """
 
     queryset = Staff.objects.all()
     serializer_class = StaffSerializer
+    cache_namespace = "staff"
     # permission_classes = [permissions.AllowAny]  # Using global settings
 
-    def get_queryset(self):
-        """Return all staff for development"""
-        return Staff.objects.all()
+    def _availability_params(self, business_id):
+        params = self.request.query_params
+        start, end = parse_span(params)
+        services = requested_service(params, business_id)
+        service = services.first() if services is not None else None
+        return availability_window(params, start, end, service)
+
+    @action(detail=True, methods=["get"])
+    def availability(self, request, pk=None):
+        """
+        Bookable slots for one staff member.
+
+        GET /api/staff/{id}/availability/?service=3&from=2025-01-06&to=2025-01-13
+
+        ``service`` sets the slot length from its duration (``duration`` in
+        minutes overrides it); ``step`` is the slot grid in minutes.
+        """
+        member = self.get_object()
+        window = self._availability_params(member.business_id)
+        slots = slots_for([member], window)[member.id]
+        return Response(
+            {
+                "staff": member.id,
+                **window_payload(window),
+                "slots": slot_payload(slots),
+            }
+        )
+
+    @action(detail=False, methods=["get"], url_path="availability")
+    def business_availability(self, request):
+        """
+        Bookable slots for every active staff member of a business.
+
+        GET /api/staff/availability/?business=<id>&service=3&from=...&to=...
+        """
+        if not request.query_params.get("business"):
+            raise ValidationError({"business": "This parameter is required."})
+        business_id = parse_business_id(request.query_params["business"])
+        members = list(self.filter_queryset(self.get_queryset()).filter(is_active=True))
+        window = self._availability_params(business_id)
+        slots = slots_for(members, window)
+        return Response(
+            {
+                "business": str(business_id),
+                **window_payload(window),
+                "staff": [
+                    {
+                        "staff": member.id,
+                        "name": member.name,
+                        "slots": slot_payload(slots[member.id]),
+                    }
+                    for member in members
+                ],
+            }
+        )
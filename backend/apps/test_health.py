@@ -1,9 +1,20 @@
 """Tests for health check endpoints"""
 
+import threading
+import time
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
 
+from config import health
+
+
+@pytest.fixture(autouse=True)
+def checks_on_probe(settings):
+    """Check on every probe; no monitor thread outliving the test"""
+    settings.HEALTH_CHECK_INTERVAL = 0
+
 
 @pytest.mark.django_db
 @pytest.mark.integration
@@ -33,3 +44,97 @@ class TestHealthChecks:
         assert "checks" in response.json()
         assert "database" in response.json()["checks"]
         assert "cache" in response.json()["checks"]
+
+
+def failing():
+    raise ConnectionError("connection refused")
+
+
+def ok():
+    pass
+
+
+@pytest.fixture
+def use_checks(monkeypatch, settings):
+    """Point /readyz/ at a monitor running the given checks"""
+    settings.HEALTH_CHECK_TIMEOUT = 0.2
+
+    def use(**checks):
+        monitor = health.HealthMonitor(checks)
+        monkeypatch.setattr(health, "monitor", monitor)
+        return monitor
+
+    return use
+
+
+@pytest.mark.unit
+class TestReadiness:
+    """Test readiness states reported from the health monitor"""
+
+    def test_ready_reports_latency(self, api_client, use_checks):
+        """Test every check reports its status and latency"""
+        use_checks(database=(ok, True), cache=(ok, False))
+        response = api_client.get(reverse("readyz"))
+
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert body["status"] == "ready"
+        assert body["checks"]["database"]["status"] == "up"
+        assert body["checks"]["cache"]["latency_ms"] >= 0
+
+    def test_non_critical_failure_is_degraded(self, api_client, use_checks):
+        """Test a failing non-critical check keeps the pod in rotation"""
+        use_checks(database=(ok, True), broker=(failing, False))
+        response = api_client.get(reverse("readyz"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == "degraded"
+        assert response.json()["checks"]["broker"] == {
+            "status": "down",
+            "critical": False,
+            "latency_ms": response.json()["checks"]["broker"]["latency_ms"],
+            "error": "connection refused",
+        }
+
+    def test_critical_failure_is_not_ready(self, api_client, use_checks):
+        """Test a failing critical check takes the pod out of rotation"""
+        use_checks(database=(failing, True), cache=(ok, False))
+        response = api_client.get(reverse("readyz"))
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["status"] == "not_ready"
+
+    def test_slow_check_times_out(self, api_client, use_checks):
+        """Test a hanging check is reported as a timeout, not waited for"""
+        release = threading.Event()
+        use_checks(database=(ok, True), cache=(lambda: release.wait(5), False))
+        try:
+            start = time.monotonic()
+            response = api_client.get(reverse("readyz"))
+            assert time.monotonic() - start < 1
+        finally:
+            release.set()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["checks"]["cache"]["status"] == "timeout"
+
+    def test_stale_results_are_not_ready(self, use_checks, settings):
+        """Test results the monitor stopped refreshing fail the probe"""
+        monitor = use_checks(database=(ok, True))
+        monitor.refresh()
+        results, checked_at = monitor.latest
+        monitor.latest = (results, checked_at - 60)
+        settings.HEALTH_CHECK_STALE_AFTER = 30
+
+        assert monitor.report()[0] == "not_ready"
+
+    def test_probe_serves_cached_results(self, api_client, use_checks, settings):
+        """Test probes don't run the checks when the monitor runs them"""
+        calls = []
+        use_checks(database=(lambda: calls.append(1), True))
+        settings.HEALTH_CHECK_INTERVAL = 3600
+
+        for _ in range(3):
+            response = api_client.get(reverse("readyz"))
+            assert response.json()["status"] == "ready"
+        assert len(calls) <= 2  # the first probe and the monitor's first round
@@ -0,0 +1,69 @@
+"""Tests for the Prometheus metrics endpoint"""
+
+import pytest
+from django.urls import reverse
+from prometheus_client.parser import text_string_to_metric_families
+from rest_framework import status
+
+
+@pytest.fixture(autouse=True)
+def no_broker(settings):
+    """Skip the Celery queue lengths; there is no broker in tests"""
+    settings.METRICS_CELERY_QUEUES = []
+
+
+def samples(response):
+    return {
+        (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+        for family in text_string_to_metric_families(response.content.decode())
+        for sample in family.samples
+    }
+
+
+def sample(values, name, **labels):
+    return values.get((name, tuple(sorted(labels.items()))), 0)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+class TestMetricsEndpoint:
+    """Test /metrics exposes request, query and cache figures"""
+
+    def test_request_latency_and_queries(self, authenticated_client, business):
+        """Test requests are counted per route with their query totals"""
+        url = reverse("metrics")
+        before = samples(authenticated_client.get(url))
+
+        authenticated_client.get(reverse("business-list"))
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain")
+        after = samples(response)
+        labels = {"method": "GET", "route": "business-list", "status": "200"}
+        count = "http_request_duration_seconds_count"
+        assert sample(after, count, **labels) == sample(before, count, **labels) + 1
+        queries = "http_request_db_queries_sum"
+        assert sample(after, queries, route="business-list") > sample(before, queries, route="business-list")
+
+    def test_cache_lookups(self, authenticated_client, staff):
+        """Test cached list hits are counted per namespace"""
+        url = reverse("staff-list")
+        params = {"business": staff.business_id}
+        before = samples(authenticated_client.get(reverse("metrics")))
+
+        authenticated_client.get(url, params)
+        authenticated_client.get(url, params)
+
+        after = samples(authenticated_client.get(reverse("metrics")))
+        hits = [name for name in after if name[0] == "cache_lookups_total" and ("result", "hit") in name[1]]
+        assert sum(after[name] for name in hits) > sum(before.get(name, 0) for name in hits)
+
+    def test_token_required_when_configured(self, api_client, settings):
+        """Test METRICS_TOKEN restricts scraping"""
+        settings.METRICS_TOKEN = "secret"
+        url = reverse("metrics")
+
+        assert api_client.get(url).status_code == status.HTTP_403_FORBIDDEN
+        response = api_client.get(url, HTTP_AUTHORIZATION="Bearer secret")
+        assert response.status_code == status.HTTP_200_OK
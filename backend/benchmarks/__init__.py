@@ -0,0 +1,13 @@
+"""
+API latency and query-count benchmarks.
+
+    pytest benchmarks/ --no-cov -p no:randomly
+    BENCH_PROFILE=medium pytest benchmarks/test_endpoints.py --no-cov
+
+``BENCH_PROFILE`` picks the seeded data set (see ``seed.PROFILES``),
+``BENCH_ROUNDS`` the timed requests per endpoint. Results are written to
+``benchmarks/results/<commit>-<profile>.json`` (or ``BENCH_OUTPUT``);
+``python -m benchmarks.compare old.json new.json`` diffs two runs.
+
+The suite lives outside ``testpaths``, so the regular test run skips it.
+"""
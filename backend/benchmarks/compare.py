@@ -0,0 +1,49 @@
+"""
+Compare two benchmark result files.
+
+    python -m benchmarks.compare results/abc123-small.json results/def456-small.json
+
+Prints p50/p95 and query counts side by side, flagging endpoints whose
+p95 grew by more than ``--threshold`` percent or that run more queries.
+Exits with status 1 if any did.
+"""
+
+import argparse
+import json
+import sys
+
+
+def compare(old, new, threshold):
+    regressions = 0
+    print(f"{'endpoint':24} {'p50 ms':>17} {'p95 ms':>17} {'queries':>9}")
+    for name in sorted(set(old["endpoints"]) | set(new["endpoints"])):
+        before = old["endpoints"].get(name)
+        after = new["endpoints"].get(name)
+        if before is None or after is None:
+            print(f"{name:24} {'(only in one run)':>17}")
+            continue
+        change = (after["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100
+        slower = change > threshold or after["queries"] > before["queries"]
+        regressions += slower
+        print(
+            f"{name:24} {before['p50_ms']:>8.2f}>{after['p50_ms']:<8.2f}"
+            f"{before['p95_ms']:>8.2f}>{after['p95_ms']:<8.2f}"
+            f"{before['queries']:>4}>{after['queries']:<4}"
+            f"{'  REGRESSION' if slower else ''}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args(argv)
+    with open(args.old) as old, open(args.new) as new:
+        regressions = compare(json.load(old), json.load(new), args.threshold)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
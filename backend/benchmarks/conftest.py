@@ -0,0 +1,125 @@
+"""Seeded tenants, an authenticated client and the results recorder."""
+
+import itertools
+import json
+import os
+import statistics
+import subprocess
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .seed import seed
+
+PROFILE = os.getenv("BENCH_PROFILE", "small")
+ROUNDS = int(os.getenv("BENCH_ROUNDS", 30))
+WARMUP_ROUNDS = 3
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class Recorder:
+    """Time API calls and collect per-endpoint latency and query figures."""
+
+    def __init__(self):
+        self.endpoints = {}
+        self.sequence = itertools.count()
+
+    def measure(self, name, request, prepare=lambda index: {}):
+        """
+        Run ``request(**prepare(index))`` for warmup plus ``ROUNDS`` rounds.
+
+        ``prepare`` builds each round's arguments outside the timed
+        section, with a fresh ``index`` for unique payloads.
+        """
+        latencies, queries = [], []
+        for round_ in range(WARMUP_ROUNDS + ROUNDS):
+            kwargs = prepare(next(self.sequence))
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = request(**kwargs)
+                elapsed = time.perf_counter() - start
+            assert response.status_code < 400, (name, response.status_code)
+            if round_ >= WARMUP_ROUNDS:
+                latencies.append(elapsed * 1000)
+                queries.append(len(captured))
+
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        self.endpoints[name] = {
+            "p50_ms": round(statistics.median(latencies), 3),
+            "p95_ms": round(cuts[94], 3),
+            "mean_ms": round(statistics.fmean(latencies), 3),
+            "queries": max(queries),
+        }
+        return self.endpoints[name]
+
+
+@pytest.fixture(scope="session")
+def tenants(django_db_setup, django_db_blocker):
+    """The seeded ``BENCH_PROFILE`` data set, created once per run."""
+    with django_db_blocker.unblock():
+        owner, counts = seed(PROFILE)
+        business = owner.businesses.get()
+        return SimpleNamespace(
+            owner=owner,
+            business=business,
+            counts=counts,
+            staff=business.staff_members.order_by("pk").first(),
+            service=business.services.order_by("pk").first(),
+            customer=business.customers.order_by("pk").first(),
+            appointment=business.appointments.order_by("-scheduled_at").first(),
+        )
+
+
+@pytest.fixture(scope="session")
+def recorder(tenants):
+    """Collects every endpoint's figures and writes them as JSON at the end."""
+    recorder = Recorder()
+    yield recorder
+
+    commit = _commit()
+    output = Path(os.getenv("BENCH_OUTPUT", RESULTS_DIR / f"{commit}-{PROFILE}.json"))
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(
+            {
+                "commit": commit,
+                "profile": PROFILE,
+                "database": connection.vendor,
+                "rounds": ROUNDS,
+                "created_at": timezone.now().isoformat(),
+                "rows": tenants.counts,
+                "endpoints": dict(sorted(recorder.endpoints.items())),
+            },
+            indent=2,
+        )
+        + "\n"
+    )
+    print(f"\nBenchmark results written to {output}")
+
+
+@pytest.fixture
+def bench_client(tenants):
+    """API client authenticating with a real bearer token."""
+    client = APIClient()
+    token = RefreshToken.for_user(tenants.owner).access_token
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client
@@ -0,0 +1,139 @@
+"""
+Seed realistic tenants for the benchmarks with the test factories.
+
+Rows are built with the factories from ``conftest.py`` and written with
+``bulk_create`` in batches. Model ``save()`` side effects the API relies
+on (appointment ``ends_at``, customer ``phone_normalized``) are applied
+by hand; the reporting rollups are left cold.
+"""
+
+import math
+import random
+from datetime import timedelta
+
+import factory.random
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from apps.appointments.models import Appointment
+from apps.businesses.models import Business
+from apps.customers.models import Customer
+from apps.customers.phones import phone_search_key
+from apps.services.models import Service
+from apps.staff.models import Staff
+from conftest import AppointmentFactory, BusinessFactory, CustomerFactory, ServiceFactory, StaffFactory, UserFactory
+
+PROFILES = {
+    "small": {"businesses": 1, "customers": 500, "appointments": 10_000},
+    "medium": {"businesses": 10, "customers": 5_000, "appointments": 100_000},
+    "large": {"businesses": 100, "customers": 50_000, "appointments": 1_000_000},
+}
+STAFF_PER_BUSINESS = 4
+SERVICES_PER_BUSINESS = 6
+BATCH_SIZE = 5_000
+PASSWORD = "bench-password"
+
+STATUS_WEIGHTS = {
+    "completed": 60,
+    "scheduled": 20,
+    "confirmed": 10,
+    "cancelled": 7,
+    "no_show": 3,
+}
+
+
+def _batched(rows, model):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            model.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        model.objects.bulk_create(batch)
+
+
+def seed(profile="small", seed=42):
+    """
+    Create one profile's tenants; return the benchmark user and counts.
+
+    The first business is owned by the returned user (password
+    ``PASSWORD``); the others by users of their own.
+    """
+    sizes = PROFILES[profile]
+    rng = random.Random(seed)
+    factory.random.reseed_random(seed)
+
+    owner = UserFactory(username="bench-owner")
+    owner.set_password(PASSWORD)
+    owner.save()
+    owners = [owner] + [UserFactory() for _ in range(sizes["businesses"] - 1)]
+    businesses = [BusinessFactory(owner=user) for user in owners]
+
+    staff = {business.pk: StaffFactory.create_batch(STAFF_PER_BUSINESS, business=business) for business in businesses}
+    services = {
+        business.pk: ServiceFactory.create_batch(
+            SERVICES_PER_BUSINESS, business=business, duration=rng.choice((20, 30, 45))
+        )
+        for business in businesses
+    }
+
+    per_business = max(sizes["customers"] // len(businesses), 1)
+    _batched(
+        (
+            CustomerFactory.build(
+                business=business,
+                phone=phone,
+                phone_normalized=phone_search_key(phone),
+            )
+            for index, business in enumerate(businesses)
+            for phone in (f"+1555{index:03d}{number:06d}" for number in range(per_business))
+        ),
+        Customer,
+    )
+    customers = {business.pk: list(Customer.objects.filter(business=business)) for business in businesses}
+
+    # A year of history plus a month of upcoming bookings. Each staff
+    # member's bookings get consecutive, equal slots of the span, so none
+    # overlap (PostgreSQL enforces that with an exclusion constraint).
+    start = timezone.now().replace(minute=0, second=0, microsecond=0)
+    start -= timedelta(days=365)
+    quarters = 395 * 24 * 4
+    statuses, weights = zip(*STATUS_WEIGHTS.items())
+
+    bookings = {}
+    for _ in range(sizes["appointments"]):
+        member = rng.choice(staff[rng.choice(businesses).pk])
+        bookings[member] = bookings.get(member, 0) + 1
+
+    def appointments():
+        for member, count in bookings.items():
+            business = member.business
+            slot = quarters // count
+            for number in range(count):
+                service = rng.choice(services[business.pk])
+                spare = slot - math.ceil(service.duration / 15)
+                if spare < 0:
+                    raise ValueError(f"Too many appointments per staff member for {profile}")
+                scheduled_at = start + timedelta(minutes=15 * (number * slot + rng.randint(0, spare)))
+                yield AppointmentFactory.build(
+                    business=business,
+                    staff=member,
+                    customer=rng.choice(customers[business.pk]),
+                    service=service,
+                    scheduled_at=scheduled_at,
+                    ends_at=Appointment.compute_ends_at(scheduled_at, service),
+                    price=service.price,
+                    status=rng.choices(statuses, weights)[0],
+                )
+
+    _batched(appointments(), Appointment)
+
+    return owner, {
+        "businesses": Business.objects.count(),
+        "staff": Staff.objects.count(),
+        "services": Service.objects.count(),
+        "customers": Customer.objects.count(),
+        "appointments": Appointment.objects.count(),
+        "users": User.objects.count(),
+    }
@@ -0,0 +1,98 @@
+"""Latency and query counts of the list, detail, create and auth endpoints."""
+
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .seed import PASSWORD
+
+pytestmark = [pytest.mark.django_db, pytest.mark.slow]
+
+LISTS = ["business", "staff", "service", "customer", "appointment"]
+
+
+@pytest.mark.parametrize("basename", LISTS)
+def test_list(bench_client, tenants, recorder, basename):
+    url = reverse(f"{basename}-list")
+    params = {"business": tenants.business.pk}
+
+    recorder.measure(f"{basename}-list", lambda: bench_client.get(url, params))
+
+
+@pytest.mark.parametrize("basename", LISTS)
+def test_detail(bench_client, tenants, recorder, basename):
+    instance = getattr(tenants, basename)
+    url = reverse(f"{basename}-detail", args=[instance.pk])
+
+    recorder.measure(f"{basename}-detail", lambda: bench_client.get(url))
+
+
+def test_create_customer(bench_client, tenants, recorder):
+    url = reverse("customer-list")
+
+    def prepare(index):
+        return {
+            "business": str(tenants.business.pk),
+            "name": f"Bench Customer {index}",
+            "phone": f"+1999{index:07d}",
+        }
+
+    recorder.measure(
+        "customer-create",
+        lambda **data: bench_client.post(url, data, format="json"),
+        prepare,
+    )
+
+
+def test_create_appointment(bench_client, tenants, recorder):
+    url = reverse("appointment-list")
+    # Past the seeded range, one slot per round so none overlap
+    start = timezone.now().replace(microsecond=0) + timedelta(days=400)
+
+    def prepare(index):
+        return {
+            "business": str(tenants.business.pk),
+            "staff": tenants.staff.pk,
+            "customer": tenants.customer.pk,
+            "service": tenants.service.pk,
+            "scheduled_at": (start + timedelta(hours=index)).isoformat(),
+        }
+
+    recorder.measure(
+        "appointment-create",
+        lambda **data: bench_client.post(url, data, format="json"),
+        prepare,
+    )
+
+
+def test_login(tenants, recorder):
+    client = APIClient()
+    url = reverse("auth_login")
+    data = {"username": tenants.owner.username, "password": PASSWORD}
+
+    recorder.measure("auth-login", lambda: client.post(url, data, format="json"))
+
+
+def test_refresh(tenants, recorder):
+    client = APIClient()
+    url = reverse("auth_refresh")
+
+    def prepare(index):
+        # Refresh tokens are single use (rotation with blacklisting)
+        return {"refresh": str(RefreshToken.for_user(tenants.owner))}
+
+    recorder.measure(
+        "auth-refresh",
+        lambda **data: client.post(url, data, format="json"),
+        prepare,
+    )
+
+
+def test_me(bench_client, recorder):
+    url = reverse("auth_profile")
+
+    recorder.measure("auth-me", lambda: bench_client.get(url))
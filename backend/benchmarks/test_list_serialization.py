@@ -0,0 +1,71 @@
+"""
+Benchmark: one appointment list page, serializer vs. compiled path.
+
+Run with ``pytest benchmarks/test_list_serialization.py -s --no-cov``;
+it is outside ``testpaths`` so the regular suite skips it.
+"""
+
+import statistics
+import time
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.appointments.models import Appointment
+from apps.appointments.serializers import AppointmentListSerializer
+from config.fastlist import compile_serializer
+from config.renderers import ORJSONRenderer
+
+PAGE_SIZE = 100
+ROUNDS = 30
+
+
+def timed(func):
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+@pytest.fixture
+def page(business, staff, customer, service):
+    start = timezone.now()
+    Appointment.objects.bulk_create(
+        Appointment(
+            business=business,
+            staff=staff,
+            customer=customer,
+            service=service,
+            scheduled_at=start + timedelta(hours=index),
+            ends_at=start + timedelta(hours=index, minutes=30),
+            price=service.price,
+        )
+        for index in range(PAGE_SIZE)
+    )
+    return Appointment.objects.filter(business=business).order_by("-scheduled_at")
+
+
+@pytest.mark.django_db
+@pytest.mark.slow
+def test_compiled_list_is_faster(page):
+    def serializer_path():
+        rows = page.select_related("staff", "customer", "service")
+        JSONRenderer().render(AppointmentListSerializer(rows, many=True).data)
+
+    compiled = compile_serializer(AppointmentListSerializer)
+
+    def compiled_path():
+        ORJSONRenderer().render(compiled.render(compiled.values(page)))
+
+    baseline = timed(serializer_path)
+    fast = timed(compiled_path)
+
+    print(
+        f"\n{PAGE_SIZE} rows: serializer {baseline * 1000:.2f} ms, "
+        f"compiled {fast * 1000:.2f} ms ({baseline / fast:.1f}x)"
+    )
+    assert fast < baseline
@@ -0,0 +1,27 @@
+"""Routes for the async read endpoints, mounted at ``/api/async/``."""
+
+from django.urls import path
+
+from apps.appointments.async_views import appointment_list
+from apps.businesses.async_views import business_stats, business_workspace
+from apps.staff.async_views import business_availability, staff_availability
+
+urlpatterns = [
+    path("appointments/", appointment_list, name="async-appointment-list"),
+    path(
+        "staff/availability/",
+        business_availability,
+        name="async-staff-business-availability",
+    ),
+    path(
+        "staff/<int:pk>/availability/",
+        staff_availability,
+        name="async-staff-availability",
+    ),
+    path("businesses/<uuid:pk>/stats/", business_stats, name="async-business-stats"),
+    path(
+        "businesses/<uuid:pk>/workspace/",
+        business_workspace,
+        name="async-business-workspace",
+    ),
+]
@@ -0,0 +1,106 @@
+"""
+Native async read endpoints, mounted under ``/api/async/``.
+
+DRF views are synchronous: under ASGI every request to them still holds a
+worker thread while it waits on the database. The hot read paths are
+mirrored here as ``async def`` Django views that await the async ORM, so a
+single uvicorn worker can keep many slow requests in flight at once. They
+answer with the same JSON as their DRF counterparts.
+
+Only bearer tokens are accepted (``CachedJWTAuthentication``); requests
+without one are anonymous, as with the DRF views' read permissions.
+"""
+
+import functools
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404, HttpResponse
+from rest_framework import exceptions
+
+from apps.accounts.authentication import CachedJWTAuthentication
+from apps.businesses.tenancy import accessible_businesses, scope_to_tenant
+
+from .renderers import ORJSONRenderer
+
+_authenticator = CachedJWTAuthentication()
+_renderer = ORJSONRenderer()
+
+
+def json_response(data, status=200, etag=None):
+    response = HttpResponse(_renderer.render(data), status=status, content_type=_renderer.media_type)
+    if etag:
+        response["ETag"] = etag
+    return response
+
+
+def not_modified(etag):
+    response = HttpResponse(status=304)
+    response["ETag"] = etag
+    return response
+
+
+def _error_response(request, error):
+    # Same body shape as DRF's default exception handler
+    detail = error.detail
+    data = detail if isinstance(detail, (dict, list)) else {"detail": detail}
+    response = json_response(data, status=error.status_code)
+    if isinstance(error, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+        response["WWW-Authenticate"] = _authenticator.authenticate_header(request)
+    return response
+
+
+async def authenticate(request):
+    """The bearer token's user, or ``AnonymousUser``."""
+    result = await sync_to_async(_authenticator.authenticate)(request)
+    return result[0] if result else AnonymousUser()
+
+
+def async_api_view(view):
+    """
+    Wrap an ``async def`` read view with authentication and DRF-style errors.
+
+    ``request.user`` is set from the bearer token, and ``request.query_params``
+    aliases ``request.GET`` so parsing helpers shared with the DRF views
+    work unchanged. ``APIException`` and ``Http404`` become JSON errors.
+    """
+
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            error = exceptions.MethodNotAllowed(request.method)
+            return _error_response(request, error)
+        request.query_params = request.GET
+        try:
+            request.user = await authenticate(request)
+            return await view(request, *args, **kwargs)
+        except exceptions.APIException as error:
+            return _error_response(request, error)
+        except Http404:
+            return _error_response(request, exceptions.NotFound())
+
+    return wrapper
+
+
+async def tenant_queryset(request, queryset, tenant_field="business"):
+    """``scope_to_tenant`` for an async view (its access check may query)."""
+    return await sync_to_async(scope_to_tenant)(
+        queryset,
+        request.user,
+        request.query_params.get("business"),
+        tenant_field,
+    )
+
+
+async def get_business(request, pk):
+    """The business ``pk`` if the user may see it, else ``Http404``."""
+    try:
+        pk = uuid.UUID(str(pk))
+    except ValueError:
+        raise Http404
+    businesses = await sync_to_async(accessible_businesses)(request.user)
+    business = await businesses.filter(pk=pk).afirst()
+    if business is None:
+        raise Http404
+    return business
@@ -1,9 +1,17 @@
 import os
+import time
 from celery import Celery
+from celery.signals import task_postrun, task_prerun, worker_init
 
 # Set the default Django settings module
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
+# Django setup imports config.metrics, whose gauges open files in the
+# multiprocess directory right away; it must exist before that. Emptying
+# it is left to the container command: children may already write here.
+if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
 app = Celery("barber_crm")
 
 # Load config from Django settings with CELERY namespace
@@ -16,3 +24,38 @@ app.autodiscover_tasks()
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
+
+
+# Prometheus: task durations, served by the worker on CELERY_METRICS_PORT.
+# Set PROMETHEUS_MULTIPROC_DIR so the prefork children's samples add up.
+_task_started = {}
+
+
+@task_prerun.connect
+def _start_task_timer(task_id=None, **kwargs):
+    _task_started[task_id] = time.perf_counter()
+
+
+@task_postrun.connect
+def _observe_task(task_id=None, task=None, state=None, **kwargs):
+    from config.metrics import TASK_DURATION
+
+    started = _task_started.pop(task_id, None)
+    if started is not None:
+        TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(time.perf_counter() - started)
+
+
+@worker_init.connect
+def _serve_metrics(**kwargs):
+    port = os.getenv("CELERY_METRICS_PORT")
+    if not port:
+        return
+    from prometheus_client import REGISTRY, start_http_server
+
+    from config.metrics import multiprocess_registry
+
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = multiprocess_registry()
+    else:
+        registry = REGISTRY
+    start_http_server(int(port), registry=registry)
@@ -0,0 +1,103 @@
+"""ETag / If-None-Match support for DRF ViewSets."""
+
+import hashlib
+
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def make_etag(request, *parts):
+    """
+    Weak ETag over validator ``parts`` and the requested representation.
+
+    The full URL and negotiated media type are part of the hash, so pages,
+    filters and formats of the same resource never share a tag.
+    """
+    representation = [
+        request.build_absolute_uri(),
+        getattr(request, "accepted_media_type", ""),
+    ]
+    payload = "|".join(str(part) for part in [*representation, *parts])
+    digest = hashlib.md5(payload.encode(), usedforsecurity=False).hexdigest()
+    return f"W/{quote_etag(digest)}"
+
+
+def etag_matches(request, etag):
+    """Weak comparison of ``etag`` against the request's If-None-Match."""
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return False
+    candidates = parse_etags(header)
+    if "*" in candidates:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == opaque for candidate in candidates)
+
+
+def not_modified(etag):
+    response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    response["ETag"] = etag
+    return response
+
+
+def queryset_validator(queryset, fields):
+    """
+    ``(max(field) for each field, count)`` for a queryset in one query.
+
+    The count catches deletions that leave the newest timestamp unchanged.
+    """
+    aggregates = {f"v{index}": Max(field) for index, field in enumerate(fields)}
+    result = queryset.order_by().aggregate(n=Count("pk"), **aggregates)
+    return [result[f"v{index}"] for index in range(len(fields))] + [result["n"]]
+
+
+class ConditionalGetMixin:
+    """
+    Answer ``list`` and ``retrieve`` with ``304 Not Modified`` when possible.
+
+    The validator is computed from ``etag_fields`` (``updated_at`` by
+    default, plus related ``*__updated_at`` columns when nested data is
+    rendered) before anything is serialized. A matching ``If-None-Match``
+    returns an empty 304; otherwise the normal response is sent with an
+    ``ETag`` header.
+    """
+
+    etag_fields = ("updated_at",)
+
+    def get_list_etag(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        return make_etag(request, *queryset_validator(queryset, self.etag_fields))
+
+    def get_detail_etag(self, request):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+            row = queryset.values_list(*self.etag_fields).first()
+        except (TypeError, ValueError, ValidationError):
+            # Malformed pk: let get_object() answer 404
+            return None
+        if row is None:
+            return None
+        return make_etag(request, *row)
+
+    def list(self, request, *args, **kwargs):
+        etag = self.get_list_etag(request)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        response = super().list(request, *args, **kwargs)
+        response["ETag"] = etag
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        etag = self.get_detail_etag(request)
+        if etag is not None and etag_matches(request, etag):
+            return not_modified(etag)
+        response = super().retrieve(request, *args, **kwargs)
+        if etag is not None:
+            response["ETag"] = etag
+        return response
@@ -0,0 +1,178 @@
+"""
+Compiled read-only serialization for list pages.
+
+``ModelSerializer`` builds a model instance per row and then walks every
+field: attribute lookups through related objects, ``get_<field>_display``
+calls, Decimal quantizing and datetime formatting, each behind several
+layers of method calls. For a 100-row page that dominates the request.
+
+``CompiledSerializer`` is derived once from a serializer class. It maps
+every field to a ``values()`` lookup (``staff.name`` -> ``staff__name``,
+``get_status_display`` -> ``status``) and a plain converter function (a
+precomputed choice map, a fixed Decimal quantum, the DRF datetime
+format), then builds each row dict directly from the ``values()`` row.
+The output is identical to the serializer's.
+
+Serializers with fields it cannot map (method fields, nested
+serializers, ``source="*"``) are not compiled; ``CompiledListMixin``
+falls back to the regular path for them, and for ``?fields=`` /
+``?expand=`` requests.
+"""
+
+import functools
+from decimal import Decimal
+
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .fieldsets import _DISPLAY, _wants_fieldset
+from .instrumentation import serializer_timer
+
+# Field classes whose representation of a non-null column value is the value
+_PASSTHROUGH = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.FloatField,
+    serializers.IntegerField,
+    serializers.JSONField,
+    serializers.PrimaryKeyRelatedField,
+)
+
+
+class Uncompilable(Exception):
+    """The serializer has a field without a ``values()`` equivalent."""
+
+
+def _decimal(field):
+    coerce = getattr(field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING)
+    unsupported = field.localize or field.normalize_output or not coerce
+    if unsupported or field.decimal_places is None:
+        raise Uncompilable(field.field_name)
+    quantum = Decimal(1).scaleb(-field.decimal_places)
+    return lambda value: f"{Decimal(value).quantize(quantum):f}"
+
+
+def _datetime(field):
+    if getattr(field, "format", api_settings.DATETIME_FORMAT) != ISO_8601:
+        raise Uncompilable(field.field_name)
+
+    def convert(value):
+        # Same as DateTimeField.to_representation: current zone, "Z" for UTC
+        if timezone.is_aware(value):
+            value = timezone.localtime(value)
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+    return convert
+
+
+def _converter(field, model_field, display):
+    """Function turning a non-null column value into the field's output."""
+    if display:
+        labels = {value: str(label) for value, label in model_field.flatchoices}
+        return lambda value: labels.get(value, value)
+    if isinstance(field, serializers.DecimalField):
+        return _decimal(field)
+    if isinstance(field, serializers.DateTimeField):
+        return _datetime(field)
+    if isinstance(field, serializers.DateField):
+        return lambda value: value.isoformat()
+    if isinstance(field, serializers.UUIDField):
+        return str
+    if isinstance(field, serializers.PrimaryKeyRelatedField) and field.pk_field:
+        raise Uncompilable(field.field_name)
+    if isinstance(field, _PASSTHROUGH):
+        return None
+    raise Uncompilable(field.field_name)
+
+
+def _lookup(model, field):
+    """``(values() lookup, model field, is_display)`` for a serializer field."""
+    if field.source == "*" or isinstance(field, serializers.BaseSerializer):
+        raise Uncompilable(field.field_name)
+    path, current = [], model
+    attrs = field.source_attrs
+    for index, attr in enumerate(attrs):
+        display = _DISPLAY.fullmatch(attr) if index == len(attrs) - 1 else None
+        name = display.group(1) if display else attr
+        try:
+            model_field = current._meta.get_field(name)
+        except Exception:
+            raise Uncompilable(field.field_name)
+        path.append(model_field.name)
+        if index < len(attrs) - 1:
+            if not model_field.is_relation or model_field.many_to_many:
+                raise Uncompilable(field.field_name)
+            current = model_field.related_model
+    if model_field.is_relation and (model_field.many_to_many or model_field.one_to_many):
+        raise Uncompilable(field.field_name)
+    return "__".join(path), model_field, bool(display)
+
+
+class CompiledSerializer:
+    """Row dicts for a serializer class, built from ``values()`` rows."""
+
+    def __init__(self, serializer_class):
+        serializer = serializer_class()
+        model = serializer.Meta.model
+        self.spec = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            lookup, model_field, display = _lookup(model, field)
+            self.spec.append((name, lookup, _converter(field, model_field, display)))
+        self.lookups = list(dict.fromkeys(lookup for _, lookup, _ in self.spec))
+
+    def values(self, queryset, extra=()):
+        """``queryset`` projected to the columns this serializer needs."""
+        lookups = [*self.lookups, *(name for name in extra if name not in self.lookups)]
+        return queryset.values(*lookups)
+
+    def render(self, rows):
+        spec = self.spec
+        with serializer_timer():
+            return [
+                {
+                    name: (row[lookup] if convert is None or row[lookup] is None else convert(row[lookup]))
+                    for name, lookup, convert in spec
+                }
+                for row in rows
+            ]
+
+
+@functools.cache
+def compile_serializer(serializer_class):
+    """Cached ``CompiledSerializer`` for a class, or ``None`` if unsupported."""
+    try:
+        return CompiledSerializer(serializer_class)
+    except Uncompilable:
+        return None
+
+
+class CompiledListMixin:
+    """
+    Serve ``list`` through ``compile_serializer(get_serializer_class())``.
+
+    Pagination still applies: the paginator receives a ``values()``
+    queryset and keyset cursors read their columns from the row dicts.
+    """
+
+    def list(self, request, *args, **kwargs):
+        compiled = None
+        if not _wants_fieldset(request):
+            compiled = compile_serializer(self.get_serializer_class())
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+
+        ordering = getattr(self.pagination_class, "ordering", ())
+        queryset = compiled.values(
+            self.filter_queryset(self.get_queryset()),
+            extra=[field.lstrip("-") for field in ordering],
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(compiled.render(page))
+        return Response(compiled.render(queryset))
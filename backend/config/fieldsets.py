@@ -0,0 +1,183 @@
+"""
+Sparse fieldsets (``?fields=``) and opt-in expansion (``?expand=``).
+
+``GET /api/appointments/?fields=id,scheduled_at,staff_details.name``
+renders only those fields; a dotted path trims a nested serializer.
+``?expand=staff,customer`` picks which of a serializer's
+``expandable_fields`` (nested related objects) are rendered; without it
+each serializer keeps its ``default_expand``. Both only apply to reads:
+writes always validate and render the full serializer.
+
+``FieldsetViewMixin`` then narrows the queryset to match, reading only the
+columns the trimmed serializer renders (``only()``) and joining only the
+relations it nests (``select_related``).
+"""
+
+import re
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+_DISPLAY = re.compile(r"get_(\w+)_display")
+
+
+def parse_fieldset(value):
+    """``"id,staff_details.name"`` -> ``{"id": {}, "staff_details": {"name": {}}}``"""
+    tree = {}
+    for path in value.split(","):
+        path = path.strip()
+        if not path:
+            continue
+        node = tree
+        for part in path.split("."):
+            node = node.setdefault(part.strip(), {})
+    return tree
+
+
+def parse_expand(value):
+    return {name.strip() for name in value.split(",") if name.strip()}
+
+
+def _wants_fieldset(request):
+    if request is None or request.method not in SAFE_METHODS:
+        return False
+    params = request.query_params
+    return bool(params.get("fields")) or "expand" in params
+
+
+class FieldsetSerializerMixin:
+    """
+    Honor ``?fields=`` and ``?expand=`` on a serializer.
+
+    ``expandable_fields`` maps expansion names to nested serializer
+    fields; ``default_expand`` lists those rendered when the request does
+    not say (``None`` means all of them).
+    """
+
+    expandable_fields = {}
+    default_expand = None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fieldset, expand = self._requested_fieldset()
+
+        if expand is None:
+            expand = set(self.expandable_fields) if self.default_expand is None else set(self.default_expand)
+        unknown = expand - set(self.expandable_fields)
+        if unknown:
+            raise ValidationError({"expand": f"Unknown expansion(s): {', '.join(sorted(unknown))}."})
+        for name, field_name in self.expandable_fields.items():
+            # Naming an expandable field in ?fields= expands it too
+            if name not in expand and field_name not in (fieldset or {}):
+                fields.pop(field_name, None)
+
+        if not fieldset:
+            return fields
+        unknown = set(fieldset) - set(fields)
+        if unknown:
+            raise ValidationError({"fields": f"Unknown field(s): {', '.join(sorted(unknown))}."})
+        trimmed = {}
+        for name, field in fields.items():
+            if name not in fieldset:
+                continue
+            if fieldset[name]:
+                nested = field.child if isinstance(field, ListSerializer) else field
+                if not isinstance(nested, FieldsetSerializerMixin):
+                    raise ValidationError({"fields": f"'{name}' has no sub-fields."})
+                nested._fieldset = fieldset[name]
+            trimmed[name] = field
+        return trimmed
+
+    def _requested_fieldset(self):
+        """``(fieldset, expand)`` for this serializer; ``None`` means unset."""
+        if hasattr(self, "_fieldset"):
+            # Nested under a dotted ?fields= path
+            return self._fieldset, None
+        top_level = self.parent is None or (isinstance(self.parent, ListSerializer) and self.parent.parent is None)
+        request = self.context.get("request")
+        if not top_level or not _wants_fieldset(request):
+            return None, None
+        params = request.query_params
+        fieldset = parse_fieldset(params["fields"]) if params.get("fields") else None
+        expand = parse_expand(params["expand"]) if "expand" in params else None
+        return fieldset, expand
+
+
+def _column(model, attr):
+    display = _DISPLAY.fullmatch(attr)
+    try:
+        return model._meta.get_field(display.group(1) if display else attr)
+    except FieldDoesNotExist:
+        return None
+
+
+def _plan(serializer, model, prefix, relations, columns):
+    """Collect the columns and joins ``serializer`` reads; ``False`` if unknown."""
+    columns.add(prefix + model._meta.pk.name)
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if field.source == "*":
+            return False
+        current, path = model, prefix
+        attrs = field.source_attrs
+        for index, attr in enumerate(attrs):
+            last = index == len(attrs) - 1
+            column = _column(current, attr)
+            if column is None:
+                return False
+            if not column.is_relation:
+                if not last:
+                    return False
+                columns.add(path + column.name)
+                break
+            if column.many_to_many or column.one_to_many:
+                return False
+            columns.add(path + column.name)
+            if last and not isinstance(field, BaseSerializer):
+                break
+            relations.add(path + column.name)
+            current, path = column.related_model, f"{path}{column.name}__"
+            if last:
+                nested = field.child if isinstance(field, ListSerializer) else field
+                if not _plan(nested, current, path, relations, columns):
+                    return False
+            else:
+                columns.add(path + current._meta.pk.name)
+    return True
+
+
+def queryset_plan(serializer, model):
+    """``(relations, columns)`` a serializer renders, or ``None`` if unclear."""
+    relations, columns = set(), set()
+    if not _plan(serializer, model, "", relations, columns):
+        return None
+    return relations, columns
+
+
+class FieldsetViewMixin:
+    """
+    Match ``list``/``retrieve`` querysets to the requested fieldset.
+
+    Only applies when ``?fields=`` or ``?expand=`` is given; the default
+    querysets are left as they are.
+    """
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action not in ("list", "retrieve") or not _wants_fieldset(self.request):
+            return queryset
+        plan = queryset_plan(self.get_serializer(), queryset.model)
+        if plan is None:
+            return queryset
+        relations, columns = plan
+        # Keyset cursors read the ordering columns off the last row
+        ordering = getattr(self.pagination_class, "ordering", ())
+        columns.update(field.lstrip("-") for field in ordering)
+        queryset = queryset.select_related(None)
+        if relations:
+            # A bare select_related() would follow every foreign key
+            queryset = queryset.select_related(*relations)
+        return queryset.only(*columns)
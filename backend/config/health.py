@@ -1,6 +1,182 @@
-from django.http import JsonResponse
-from django.db import connection
+"""
+Health endpoints.
+
+``/healthz/`` and ``/livez/`` only tell that the process answers.
+``/readyz/`` reports its dependencies, but does not check them itself: a
+background thread per process (``HealthMonitor``) runs every check each
+``HEALTH_CHECK_INTERVAL`` seconds, in parallel and bounded by
+``HEALTH_CHECK_TIMEOUT``, and the probe serves the last result from
+memory. A slow database or Redis then shows up as a failed check, not as
+a probe timeout.
+
+Each check reports its status (``up``, ``down`` or ``timeout``) and
+latency. Only critical checks take the pod out of rotation:
+
+- ``database`` (critical)
+- ``cache``: Redis; the app cache falls through to computing values
+- ``broker``: Celery; only background jobs are delayed
+
+A failed non-critical check makes the pod ``degraded``, still served
+(200). A result older than ``HEALTH_CHECK_STALE_AFTER`` seconds, e.g.
+because the monitor thread died, counts as not ready.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from django.conf import settings
 from django.core.cache import cache
+from django.db import connection
+from django.http import JsonResponse
+
+logger = logging.getLogger(__name__)
+
+
+def check_database():
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    finally:
+        # The check runs in a pool thread; don't keep a connection there
+        connection.close()
+
+
+def check_cache():
+    key = f"health_check:{uuid.uuid4().hex}"
+    cache.set(key, "ok", 10)
+    if cache.get(key) != "ok":
+        raise RuntimeError("Cache did not return the value just written")
+
+
+def check_broker():
+    from config.celery import app
+
+    with app.connection_for_read() as conn:
+        conn.ensure_connection(max_retries=1, interval_start=0, timeout=settings.HEALTH_CHECK_TIMEOUT)
+
+
+# name -> (check, critical)
+CHECKS = {
+    "database": (check_database, True),
+    "cache": (check_cache, False),
+    "broker": (check_broker, False),
+}
+
+
+class HealthMonitor:
+    """Runs ``checks`` in the background and keeps the latest results."""
+
+    def __init__(self, checks):
+        self.checks = checks
+        self.latest = None
+        self._lock = threading.Lock()
+        self._thread_pid = None
+        self._pool_pid = None
+        self._pool = None
+        self._running = {}
+
+    def start(self):
+        """Start the refresh thread in this process, once."""
+        with self._lock:
+            # Forked workers inherit the object but not the thread
+            if self._thread_pid == os.getpid():
+                return
+            self._thread_pid = os.getpid()
+        threading.Thread(target=self._loop, name="health-monitor", daemon=True).start()
+
+    def _loop(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Health checks failed to run")
+            time.sleep(settings.HEALTH_CHECK_INTERVAL)
+
+    def _executor(self):
+        with self._lock:
+            if self._pool_pid != os.getpid():
+                self._pool_pid = os.getpid()
+                self._running = {}
+                self._pool = ThreadPoolExecutor(max_workers=len(self.checks), thread_name_prefix="health-check")
+            return self._pool
+
+    def refresh(self):
+        """Run every check once, in parallel, and store the results."""
+        executor = self._executor()
+        timeout = settings.HEALTH_CHECK_TIMEOUT
+        futures = {}
+        for name, (check, _) in self.checks.items():
+            running = self._running.get(name)
+            if running is not None and not running.done():
+                # Still stuck from an earlier round; don't pile up threads
+                futures[name] = running
+            else:
+                futures[name] = self._running[name] = executor.submit(self._timed, check)
+
+        deadline = time.monotonic() + timeout
+        results = {}
+        for name, future in futures.items():
+            critical = self.checks[name][1]
+            try:
+                error, latency = future.result(max(0, deadline - time.monotonic()))
+            except FutureTimeout:
+                results[name] = self._result("timeout", critical, timeout)
+                continue
+            if error is None:
+                results[name] = self._result("up", critical, latency)
+            else:
+                results[name] = self._result("down", critical, latency, error)
+        self.latest = (results, time.time())
+        return results
+
+    @staticmethod
+    def _timed(check):
+        start = time.perf_counter()
+        try:
+            check()
+        except Exception as e:
+            return str(e) or type(e).__name__, time.perf_counter() - start
+        return None, time.perf_counter() - start
+
+    @staticmethod
+    def _result(status, critical, latency, error=None):
+        result = {
+            "status": status,
+            "critical": critical,
+            "latency_ms": round(latency * 1000, 1),
+        }
+        if error:
+            result["error"] = error
+        return result
+
+    def report(self):
+        """``(status, body)`` from the latest results."""
+        if self.latest is None:
+            # First probe in this process: nothing to serve yet
+            self.refresh()
+        results, checked_at = self.latest
+        age = time.time() - checked_at
+        failed = [name for name, result in results.items() if result["status"] != "up"]
+        if age > settings.HEALTH_CHECK_STALE_AFTER or any(self.checks[name][1] for name in failed):
+            status = "not_ready"
+        elif failed:
+            status = "degraded"
+        else:
+            status = "ready"
+        return status, {
+            "status": status,
+            "checks": results,
+            "checked_at": checked_at,
+            "age_s": round(age, 1),
+        }
+
+
+monitor = HealthMonitor(CHECKS)
 
 
 def healthz(request):
@@ -15,29 +191,9 @@ def livez(request):
 
 def readyz(request):
     """Readiness probe - can the app serve traffic?"""
-    checks = {
-        "database": False,
-        "cache": False,
-    }
-
-    # Check database
-    try:
-        connection.ensure_connection()
-        checks["database"] = True
-    except Exception as e:
-        checks["database_error"] = str(e)
-
-    # Check Redis cache
-    try:
-        cache.set("health_check", "ok", 10)
-        checks["cache"] = cache.get("health_check") == "ok"
-    except Exception as e:
-        checks["cache_error"] = str(e)
-
-    all_healthy = all([checks["database"], checks["cache"]])
-    status_code = 200 if all_healthy else 503
-
-    return JsonResponse(
-        {"status": "ready" if all_healthy else "not_ready", "checks": checks},
-        status=status_code,
-    )
+    if settings.HEALTH_CHECK_INTERVAL:
+        monitor.start()
+    else:
+        monitor.refresh()
+    status, body = monitor.report()
+    return JsonResponse(body, status=503 if status == "not_ready" else 200)
@@ -0,0 +1,161 @@
+"""
+Prometheus metrics, served at ``/metrics``.
+
+Web processes record, per route (the URL name, not the raw path):
+
+- ``http_request_duration_seconds``: request latency histogram
+- ``http_request_db_queries`` / ``http_request_db_seconds``: SQL queries
+  run and time spent in them per request
+- ``http_requests_in_progress`` and ``web_workers``: busy vs. live worker
+  processes, i.e. worker utilization
+- ``cache_lookups_total``: application cache hits and misses per namespace
+
+Scraping ``/metrics`` also reads the Celery queue lengths from the
+broker. Celery workers record ``celery_task_duration_seconds`` and serve
+it on ``CELERY_METRICS_PORT`` (see ``config.celery``).
+
+With several processes per pod (gunicorn workers, Celery prefork
+children) set ``PROMETHEUS_MULTIPROC_DIR``: every process then writes its
+samples there and ``/metrics`` aggregates them. ``gunicorn.conf.py`` does
+this for the web server.
+"""
+
+import logging
+import os
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Request latency",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_QUERIES = Histogram(
+    "http_request_db_queries",
+    "SQL queries per request",
+    ["route"],
+    buckets=QUERY_BUCKETS,
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_seconds",
+    "Time spent in SQL queries per request",
+    ["route"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "Requests being handled",
+    multiprocess_mode="livesum",
+)
+WEB_WORKERS = Gauge(
+    "web_workers",
+    "Live web worker processes",
+    multiprocess_mode="livesum",
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups",
+    "Application cache lookups",
+    ["namespace", "result"],
+)
+TASK_DURATION = Histogram(
+    "celery_task_duration_seconds",
+    "Celery task run time",
+    ["task", "state"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300),
+)
+
+
+def route_of(request):
+    """Low-cardinality label for a request: its URL name or pattern."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    return match.view_name or match.route
+
+
+def observe_request(request, response, metrics, total):
+    """Record a finished request (called by ``RequestMetricsMiddleware``)."""
+    route = route_of(request)
+    REQUEST_LATENCY.labels(request.method, route, response.status_code).observe(total)
+    REQUEST_QUERIES.labels(route).observe(metrics.queries)
+    REQUEST_DB_TIME.labels(route).observe(metrics.db_time)
+
+
+def observe_cache_lookup(namespace, hit):
+    CACHE_LOOKUPS.labels(namespace, "hit" if hit else "miss").inc()
+
+
+class CeleryQueueCollector:
+    """Queue lengths read from the broker at scrape time."""
+
+    def collect(self):
+        from config.celery import app
+
+        if not settings.METRICS_CELERY_QUEUES:
+            return
+        gauge = GaugeMetricFamily(
+            "celery_queue_length",
+            "Messages waiting in a Celery queue",
+            labels=["queue"],
+        )
+        try:
+            with app.connection_for_read() as conn:
+                conn.ensure_connection(max_retries=1, timeout=1)
+                channel = conn.default_channel
+                for queue in settings.METRICS_CELERY_QUEUES:
+                    declared = channel.queue_declare(queue, passive=True)
+                    gauge.add_metric([queue], declared.message_count)
+        except Exception:
+            logger.warning("Could not read Celery queue lengths")
+            return
+        yield gauge
+
+
+def multiprocess_registry():
+    """Registry aggregating every process's samples in the multiproc dir."""
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+class _DefaultRegistry:
+    """This process's own samples, when not in multiprocess mode."""
+
+    def collect(self):
+        return REGISTRY.collect()
+
+
+def _registry():
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = multiprocess_registry()
+    else:
+        registry = CollectorRegistry()
+        registry.register(_DefaultRegistry())
+    registry.register(CeleryQueueCollector())
+    return registry
+
+
+def metrics_view(request):
+    """Prometheus text exposition of all metrics."""
+    token = settings.METRICS_TOKEN
+    if token and request.headers.get("Authorization") != f"Bearer {token}":
+        return HttpResponseForbidden()
+    return HttpResponse(generate_latest(_registry()), content_type=CONTENT_TYPE_LATEST)
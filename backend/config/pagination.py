@@ -0,0 +1,196 @@
+"""Keyset (cursor) pagination for large, append-heavy tables."""
+
+import base64
+import binascii
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _field_name(ordering_field):
+    return ordering_field.lstrip("-")
+
+
+def reverse_ordering(ordering):
+    """Flip the direction of every field in an ordering tuple."""
+    return tuple(_field_name(field) if field.startswith("-") else f"-{field}" for field in ordering)
+
+
+def seek_filter(ordering, position):
+    """
+    Build the WHERE clause that seeks past ``position`` in ``ordering``.
+
+    For ``("-scheduled_at", "-id")`` and position ``(t, 42)`` this yields
+    ``scheduled_at < t OR (scheduled_at = t AND id < 42)``, which an index
+    on the ordering columns answers with a range scan instead of an OFFSET.
+    """
+    clause = Q()
+    for index, field in enumerate(ordering):
+        name = _field_name(field)
+        lookup = "lt" if field.startswith("-") else "gt"
+        step = Q(**{f"{name}__{lookup}": position[index]})
+        for previous, value in zip(ordering[:index], position[:index]):
+            step &= Q(**{_field_name(previous): value})
+        clause |= step
+    return clause
+
+
+def row_position(row, ordering):
+    """Read the ordering values from a model instance or a ``values()`` dict."""
+    if isinstance(row, dict):
+        return [row[_field_name(field)] for field in ordering]
+    return [getattr(row, _field_name(field)) for field in ordering]
+
+
+def _encode_value(value):
+    # Keep full microsecond precision; DjangoJSONEncoder truncates to
+    # milliseconds, which would make the seek skip or repeat rows.
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(position, reverse=False):
+    payload = json.dumps({"p": position, "r": int(reverse)}, default=_encode_value)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor, ordering, model=None):
+    """
+    Return ``(position, reverse)`` or raise ``NotFound`` for a bad cursor.
+
+    With ``model`` every position value is converted with its ordering
+    field's ``to_python``, so a tampered cursor never reaches the ORM.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        position, reverse = payload["p"], bool(payload["r"])
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise NotFound("Invalid cursor")
+    if not isinstance(position, list) or len(position) != len(ordering):
+        raise NotFound("Invalid cursor")
+    if model is not None:
+        try:
+            position = [
+                model._meta.get_field(_field_name(field)).to_python(value) for field, value in zip(ordering, position)
+            ]
+        except (DjangoValidationError, TypeError, ValueError):
+            raise NotFound("Invalid cursor")
+        if None in position:
+            raise NotFound("Invalid cursor")
+    return position, reverse
+
+
+def paginate_rows(rows, page_size, position, reverse):
+    """
+    Trim a ``page_size + 1`` fetch and work out which neighbours exist.
+
+    Returns ``(page, has_next, has_previous)`` with ``page`` in forward
+    order regardless of the direction it was fetched in.
+    """
+    has_more = len(rows) > page_size
+    page = list(rows[:page_size])
+    if reverse:
+        page.reverse()
+        return page, position is not None, has_more
+    return page, has_more, position is not None
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks on the full ordering tuple.
+
+    Unlike ``PageNumberPagination`` it never runs ``COUNT(*)`` and never
+    scans past skipped rows, so page latency stays flat however deep a
+    client pages. Cursors are opaque base64 tokens carrying the ordering
+    values of the boundary row.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    cursor_query_param = "cursor"
+
+    def get_page_size(self, request):
+        value = request.query_params.get(self.page_size_query_param)
+        if value:
+            try:
+                size = int(value)
+            except ValueError:
+                size = 0
+            if size > 0:
+                return min(size, self.max_page_size)
+        return self.page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.set_page(list(self.seek(queryset, request)))
+
+    def seek(self, queryset, request):
+        """
+        The sliced queryset holding the requested page (plus one row).
+
+        Split from ``paginate_queryset`` so async views can fetch the rows
+        themselves and hand them to ``set_page``.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        self.position, self.reverse = decode_cursor(cursor, self.ordering, queryset.model) if cursor else (None, False)
+
+        ordering = reverse_ordering(self.ordering) if self.reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if self.position is not None:
+            queryset = queryset.filter(seek_filter(ordering, self.position))
+        return queryset[: self.page_size + 1]
+
+    def set_page(self, rows):
+        """Record the fetched ``rows`` as the current page and return it."""
+        self.page, self.has_next, self.has_previous = paginate_rows(rows, self.page_size, self.position, self.reverse)
+        return self.page
+
+    def get_paginated_data(self, data):
+        return OrderedDict(
+            [
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+                ("results", data),
+            ]
+        )
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        cursor = encode_cursor(row_position(self.page[-1], self.ordering))
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        cursor = encode_cursor(row_position(self.page[0], self.ordering), True)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,57 @@
+"""
+Response renderers.
+
+``ORJSONRenderer`` is the default. ``MessagePackRenderer`` answers clients
+sending ``Accept: application/msgpack``; it is registered only when the
+``msgpack`` package is installed.
+"""
+
+import orjson
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` on orjson.
+
+    Strings, numbers, dicts, lists and UUIDs are encoded natively.
+    Datetimes and everything else (Decimal, lazy strings, querysets) go
+    through DRF's encoder, so the output matches ``JSONRenderer``.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_encoder.default, option=options)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack bodies with the same values as the JSON ones.
+
+    Types MessagePack has no encoding for (datetimes, Decimal, UUID) are
+    rendered as the strings the JSON renderer produces.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=_encoder.default, datetime=False)
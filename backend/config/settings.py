@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from pathlib import Path
+import importlib.util
 import os
 from datetime import timedelta
 from dotenv import load_dotenv
@@ -66,9 +67,11 @@ INSTALLED_APPS = [
     "apps.customers",
     "apps.appointments",
     "apps.services",
+    "apps.reports",
 ]
 
 MIDDLEWARE = [
+    "config.instrumentation.RequestMetricsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -107,7 +110,8 @@ if os.getenv("DATABASE_URL"):
     DATABASES = {
         "default": dj_database_url.config(
             default=os.getenv("DATABASE_URL"),
-            conn_max_age=600,
+            # Set to 0 under ASGI: connections are not reused across requests
+            conn_max_age=int(os.getenv("DB_CONN_MAX_AGE", 600)),
             conn_health_checks=True,
         )
     }
@@ -183,13 +187,27 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.CachedJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "config.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "config.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 100,
 }
 
+# MessagePack (Accept: application/msgpack) when the msgpack package is installed
+if importlib.util.find_spec("msgpack"):
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].insert(1, "config.renderers.MessagePackRenderer")
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"].insert(1, "config.parsers.MessagePackParser")
+
 # JWT Configuration
 
 
@@ -202,6 +220,9 @@ SIMPLE_JWT = {
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
 }
 
+# How long an authenticated user and profile are served from the cache
+AUTH_PRINCIPAL_CACHE_SECONDS = int(os.getenv("AUTH_PRINCIPAL_CACHE_SECONDS", 300))
+
 # Celery Configuration
 CELERY_BROKER_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("REDIS_URL", "redis://localhost:6379/0")
@@ -209,6 +230,69 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
+# Task results (and the business of a queued customer import) are kept a day
+CELERY_RESULT_EXPIRES = 24 * 60 * 60
+# How often Beat queues the reminders coming due
+REMINDER_INTERVAL_SECONDS = int(os.getenv("REMINDER_INTERVAL_SECONDS", 5 * 60))
+CELERY_BEAT_SCHEDULE = {
+    "refresh-daily-rollups": {
+        "task": "apps.reports.tasks.refresh_daily_rollups",
+        "schedule": timedelta(seconds=int(os.getenv("ROLLUP_REFRESH_SECONDS", 5 * 60))),
+    },
+    "schedule-appointment-reminders": {
+        "task": "apps.appointments.tasks.schedule_appointment_reminders",
+        "schedule": timedelta(seconds=REMINDER_INTERVAL_SECONDS),
+    },
+}
+
+# Appointment reminders (apps.appointments.reminders): sent this long
+# before the appointment, in batches of REMINDER_BATCH_SIZE, through
+# REMINDER_NOTIFIER (ConsoleNotifier or FileNotifier in
+# apps.appointments.notifiers, or any class with send(reminders))
+REMINDER_LEAD_SECONDS = int(os.getenv("REMINDER_LEAD_SECONDS", 24 * 60 * 60))
+REMINDER_BATCH_SIZE = int(os.getenv("REMINDER_BATCH_SIZE", 500))
+REMINDER_NOTIFIER = os.getenv("REMINDER_NOTIFIER", "apps.appointments.notifiers.ConsoleNotifier")
+REMINDER_FILE_PATH = os.getenv("REMINDER_FILE_PATH", str(BASE_DIR / "reminders.jsonl"))
+
+# Customer import
+# Uploads up to this size are imported inside the request; larger files
+# are queued for a Celery worker, with the CSV in the task message, up to
+# CUSTOMER_IMPORT_MAX_BYTES.
+CUSTOMER_IMPORT_SYNC_MAX_BYTES = int(os.getenv("CUSTOMER_IMPORT_SYNC_MAX_BYTES", 1024 * 1024))
+CUSTOMER_IMPORT_MAX_BYTES = int(os.getenv("CUSTOMER_IMPORT_MAX_BYTES", 20 * 1024 * 1024))
+# Calling code prepended to phone numbers written without one, e.g. "1"
+PHONE_DEFAULT_COUNTRY_CODE = os.getenv("PHONE_DEFAULT_COUNTRY_CODE", "")
+
+# Per-request query/cache/serializer figures (config.instrumentation): the
+# Server-Timing header exposes internals to clients, so it is off unless
+# DEBUG or enabled explicitly
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", str(DEBUG)) == "True"
+
+# /metrics (config.metrics): optional bearer token Prometheus must send,
+# and the Celery queues whose length is reported
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+METRICS_CELERY_QUEUES = [queue for queue in os.getenv("METRICS_CELERY_QUEUES", "celery").split(",") if queue]
+
+# /readyz/ (config.health): dependency checks run in the background every
+# HEALTH_CHECK_INTERVAL seconds (0: on every probe), each bounded by
+# HEALTH_CHECK_TIMEOUT; results older than HEALTH_CHECK_STALE_AFTER fail
+HEALTH_CHECK_INTERVAL = float(os.getenv("HEALTH_CHECK_INTERVAL", 10))
+HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", 2))
+HEALTH_CHECK_STALE_AFTER = float(os.getenv("HEALTH_CHECK_STALE_AFTER", 3 * HEALTH_CHECK_INTERVAL + 5))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        # One JSON line per request at INFO; only logged by default in DEBUG
+        "config.instrumentation": {
+            "handlers": ["console"],
+            "level": os.getenv("REQUEST_LOG_LEVEL", "INFO" if DEBUG else "WARNING"),
+            "propagate": False,
+        },
+    },
+}
 
 # Redis Cache
 CACHES = {
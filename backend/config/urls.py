@@ -7,6 +7,7 @@ from apps.customers.views import CustomerViewSet
 from apps.services.views import ServiceViewSet
 from apps.appointments.views import AppointmentViewSet
 from config.health import healthz, livez, readyz
+from config.metrics import metrics_view
 
 # Create API router
 router = DefaultRouter()
@@ -18,6 +19,7 @@ router.register(r"appointments", AppointmentViewSet, basename="appointment")
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("api/async/", include("config.async_urls")),
     path("api/", include(router.urls)),
     path("api/auth/", include("apps.accounts.urls")),
     path("api-auth/", include("rest_framework.urls")),
@@ -25,4 +27,6 @@ urlpatterns = [
     path("healthz/", healthz, name="healthz"),
     path("livez/", livez, name="livez"),
     path("readyz/", readyz, name="readyz"),
+    # Prometheus scrape target
+    path("metrics", metrics_view, name="metrics"),
 ]
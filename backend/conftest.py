@@ -81,6 +81,22 @@ class AppointmentFactory(DjangoModelFactory):
 
 
 # Fixtures
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    """Use an isolated in-process cache instead of Redis"""
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "barber-crm-tests",
+        }
+    }
+    from django.core.cache import cache
+
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
 @pytest.fixture
 def user():
     """Create a test user"""
@@ -119,6 +135,28 @@ def appointment(business, staff, customer, service):
     )
 
 
+@pytest.fixture
+def query_budget():
+    """Assert a block runs at most ``limit`` SQL queries
+
+    with query_budget(3):
+        client.get(url)
+    """
+    from contextlib import contextmanager
+
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    @contextmanager
+    def budget(limit):
+        with CaptureQueriesContext(connection) as queries:
+            yield queries
+        executed = [query["sql"] for query in queries.captured_queries]
+        assert len(executed) <= limit, f"{len(executed)} queries, budget {limit}:\n" + "\n".join(executed)
+
+    return budget
+
+
 @pytest.fixture
 def api_client():
     """Create an API client"""
@@ -0,0 +1,53 @@
+"""
+Gunicorn settings, selected with ``SERVER_PROFILE``.
+
+- ``wsgi`` (default): sync workers on ``config.wsgi``. One request per
+  worker at a time, so a slow query blocks the whole worker.
+- ``asgi``: uvicorn workers on ``config.asgi``. The ``/api/async/``
+  endpoints await the database instead of holding a thread, so each
+  worker keeps many requests in flight; fewer workers fit the same
+  memory limit.
+
+``WEB_CONCURRENCY`` overrides the worker count of either profile.
+
+Prometheus runs in multiprocess mode: workers write their samples to
+``PROMETHEUS_MULTIPROC_DIR`` and ``/metrics`` aggregates them (see
+``config.metrics``). The directory is emptied when the server starts.
+"""
+
+import os
+import shutil
+
+# Must be set before any worker imports prometheus_client
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus-web")
+
+profile = os.getenv("SERVER_PROFILE", "wsgi")
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))
+
+if profile == "asgi":
+    wsgi_app = "config.asgi:application"
+    worker_class = "uvicorn_worker.UvicornWorker"
+    workers = int(os.getenv("WEB_CONCURRENCY", 2))
+else:
+    wsgi_app = "config.wsgi:application"
+    workers = int(os.getenv("WEB_CONCURRENCY", 4))
+
+
+def on_starting(server):
+    directory = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+
+def post_fork(server, worker):
+    from config.metrics import WEB_WORKERS
+
+    WEB_WORKERS.set(1)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
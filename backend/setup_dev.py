@@ -7,6 +7,7 @@ django.setup()
 
 from django.contrib.auth.models import User  # noqa: E402
 from django.core.management import call_command  # noqa: E402
+from apps.businesses.models import Business  # noqa: E402
 
 
 def setup():
@@ -21,10 +22,11 @@ def setup():
         print("Superuser 'admin' already exists.")
 
     print("📦 Creating sample data...")
-    # Import sample data creation logic
-    # We can just exec the existing file to avoid code duplication
-    with open("create_sample_data.py", "r") as f:
-        exec(f.read())
+    if Business.objects.exists():
+        print("Businesses already exist, skipping.")
+    else:
+        # Scale up with e.g. --businesses 100 --customers 5000 --months 12
+        call_command("generate_load_data", businesses=2, owner="admin")
 
 
 if __name__ == "__main__":
@@ -30,29 +30,43 @@ def appointment_modal():
                 ),
                 rx.divider(color=styles.GRAY_800, margin_y="16px"),
                 rx.vstack(
-                    # Customer Select
+                    # Customer Search
                     rx.vstack(
                         rx.text("Customer", size="2", weight="medium", color=styles.GRAY_300),
-                        rx.select.root(
-                            rx.select.trigger(
-                                placeholder="Select customer...",
-                                width="100%",
-                                style={
-                                    "background": styles.GRAY_900,
-                                    "border": styles.BORDER_SUBTLE,
-                                    "border_radius": "10px",
-                                },
-                            ),
-                            rx.select.content(
+                        rx.input(
+                            placeholder="Search by name or phone...",
+                            value=AppState.customer_query,
+                            on_change=AppState.search_customers,
+                            debounce_timeout=250,
+                            background=styles.GRAY_900,
+                            border=styles.BORDER_SUBTLE,
+                            border_radius="10px",
+                            padding="12px 16px",
+                            color=styles.WHITE,
+                            width="100%",
+                        ),
+                        rx.cond(
+                            AppState.customer_results.length() > 0,
+                            rx.vstack(
                                 rx.foreach(
-                                    AppState.customers,
-                                    lambda c: rx.select.item(c.name, value=c.id),
+                                    AppState.customer_results,
+                                    lambda c: rx.hstack(
+                                        rx.text(c.name, size="2", color=styles.WHITE),
+                                        rx.spacer(),
+                                        rx.text(c.phone, size="1", color=styles.GRAY_500),
+                                        on_click=AppState.select_appt_customer(c.id, c.name),
+                                        padding="8px 12px",
+                                        width="100%",
+                                        cursor="pointer",
+                                        _hover={"background": styles.GRAY_800},
+                                    ),
                                 ),
                                 background=styles.CARD_BG,
+                                border=styles.BORDER_SUBTLE,
+                                border_radius="10px",
+                                spacing="0",
+                                width="100%",
                             ),
-                            value=AppState.form_appt_customer,
-                            on_change=AppState.set_form_appt_customer,
-                            width="100%",
                         ),
                         spacing="2",
                         width="100%",
@@ -310,7 +324,7 @@ def appointments_content():
             rx.hstack(
                 rx.icon("calendar-clock", size=18, color=styles.GOLD),
                 rx.text("Today", size="2", weight="medium", color=styles.WHITE),
-                rx.text("0 appointments", size="2", color=styles.GRAY_500),
+                rx.text(f"{AppState.today_appointments} appointments", size="2", color=styles.GRAY_500),
                 spacing="2",
                 align="center",
                 padding="12px 20px",
@@ -321,7 +335,7 @@ def appointments_content():
             rx.hstack(
                 rx.icon("calendar", size=18, color=styles.BLUE),
                 rx.text("This Week", size="2", weight="medium", color=styles.WHITE),
-                rx.text(f"{AppState.total_appointments} appointments", size="2", color=styles.GRAY_500),
+                rx.text(f"{AppState.week_appointments} appointments", size="2", color=styles.GRAY_500),
                 spacing="2",
                 align="center",
                 padding="12px 20px",
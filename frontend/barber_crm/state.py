@@ -7,9 +7,29 @@ import httpx
 import reflex as rx
 from pydantic import BaseModel
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # API URL - can be overridden via environment variable
 API_BASE_URL = os.getenv("API_URL", "http://localhost:8000/api")
 
+# Ask for MessagePack when we can decode it; the API answers JSON otherwise
+ACCEPT = "application/msgpack, application/json;q=0.9" if msgpack else "application/json"
+
+
+def api_client() -> httpx.AsyncClient:
+    """HTTP client negotiating the most compact response format."""
+    return httpx.AsyncClient(headers={"Accept": ACCEPT})
+
+
+def decode(resp: httpx.Response):
+    """Response body, whichever format the API chose."""
+    if msgpack and resp.headers.get("Content-Type", "").startswith("application/msgpack"):
+        return msgpack.unpackb(resp.content)
+    return resp.json()
+
 
 # ============ DATA MODELS ============
 class Business(BaseModel):
@@ -125,7 +145,7 @@ class AuthState(rx.State):
         self.auth_error = ""
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.post(
                     f"{API_BASE_URL}/auth/login/",
                     json={
@@ -136,7 +156,7 @@ class AuthState(rx.State):
                 )
 
                 if resp.status_code == 200:
-                    data = resp.json()
+                    data = decode(resp)
                     self.access_token = data.get("access", "")
                     self.refresh_token = data.get("refresh", "")
 
@@ -148,7 +168,7 @@ class AuthState(rx.State):
                     self._reset_login_form()
                     return rx.redirect("/dashboard")
                 else:
-                    error_data = resp.json()
+                    error_data = decode(resp)
                     self.auth_error = error_data.get("detail", "Invalid credentials")
         except Exception as e:
             self.auth_error = f"Connection error: {e!s}"
@@ -169,7 +189,7 @@ class AuthState(rx.State):
         self.auth_error = ""
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.post(
                     f"{API_BASE_URL}/auth/register/",
                     json={
@@ -185,7 +205,7 @@ class AuthState(rx.State):
                 )
 
                 if resp.status_code == 201:
-                    data = resp.json()
+                    data = decode(resp)
                     self.access_token = data.get("access", "")
                     self.refresh_token = data.get("refresh", "")
 
@@ -197,7 +217,7 @@ class AuthState(rx.State):
                     self._reset_register_form()
                     return rx.redirect("/dashboard")
                 else:
-                    error_data = resp.json()
+                    error_data = decode(resp)
                     # Extract first error message
                     if isinstance(error_data, dict):
                         for key, value in error_data.items():
@@ -229,7 +249,7 @@ class AuthState(rx.State):
             return
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.get(
                     f"{API_BASE_URL}/auth/me/",
                     headers={"Authorization": f"Bearer {self.access_token}"},
@@ -237,7 +257,7 @@ class AuthState(rx.State):
                 )
 
                 if resp.status_code == 200:
-                    user_data = resp.json()
+                    user_data = decode(resp)
                     self.user = UserProfile(**user_data)
                     self.is_authenticated = True
                     self.is_master = user_data.get("is_master", False)
@@ -254,7 +274,7 @@ class AuthState(rx.State):
             return
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.post(
                     f"{API_BASE_URL}/auth/refresh/",
                     json={"refresh": self.refresh_token},
@@ -262,7 +282,7 @@ class AuthState(rx.State):
                 )
 
                 if resp.status_code == 200:
-                    data = resp.json()
+                    data = decode(resp)
                     self.access_token = data.get("access", "")
                     if "refresh" in data:
                         self.refresh_token = data["refresh"]
@@ -298,11 +318,18 @@ class AppState(AuthState):
     # Optimistic UI - pending operations
     _pending_deletes: list[str] = []
 
+    # Conditional GET validators for data currently held in state
+    _businesses_etag: str = ""
+    _workspace_etag: str = ""
+    _workspace_business_id: str = ""
+
     # Stats
     total_customers: int = 0
     total_appointments: int = 0
     total_staff: int = 0
     total_services: int = 0
+    today_appointments: int = 0
+    week_appointments: int = 0
 
     # ============ MODAL STATES ============
     show_customer_modal: bool = False
@@ -323,6 +350,9 @@ class AppState(AuthState):
     form_service_price: str = ""
     form_service_duration: str = "30"
     form_appt_customer: str = ""
+    form_appt_customer_name: str = ""
+    customer_query: str = ""
+    customer_results: list[Customer] = []
     form_appt_staff: str = ""
     form_appt_service: str = ""
     form_appt_date: str = ""
@@ -369,6 +399,9 @@ class AppState(AuthState):
 
     def _reset_appointment_form(self):
         self.form_appt_customer = ""
+        self.form_appt_customer_name = ""
+        self.customer_query = ""
+        self.customer_results = []
         self.form_appt_staff = ""
         self.form_appt_service = ""
         self.form_appt_date = ""
@@ -383,15 +416,18 @@ class AppState(AuthState):
         self.is_loading = True
         self.error_message = ""
         try:
-            headers = self.auth_headers if self.access_token else {}
-            async with httpx.AsyncClient() as client:
+            headers = dict(self.auth_headers) if self.access_token else {}
+            if self._businesses_etag and self.businesses:
+                headers["If-None-Match"] = self._businesses_etag
+            async with api_client() as client:
                 response = await client.get(
                     f"{self.api_url}/businesses/",
                     headers=headers,
                     timeout=10.0,
                 )
                 if response.status_code == 200:
-                    data = response.json()
+                    self._businesses_etag = response.headers.get("ETag", "")
+                    data = decode(response)
                     items = data.get("results", data) if isinstance(data, dict) else data
                     self.businesses = [Business(**item) for item in items]
                     if not self.selected_business_id and self.businesses:
@@ -414,64 +450,47 @@ class AppState(AuthState):
             return
         self.is_loading = True
         try:
-            headers = self.auth_headers if self.access_token else {}
-            async with httpx.AsyncClient() as client:
-                # Load customers
-                resp = await client.get(
-                    f"{self.api_url}/customers/",
-                    params={"business": self.selected_business_id},
-                    headers=headers,
-                    timeout=10.0,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    items = data.get("results", data) if isinstance(data, dict) else data
-                    self.customers = [Customer(**item) for item in items]
-                    self.total_customers = len(self.customers)
-
-                # Load staff
-                resp = await client.get(
-                    f"{self.api_url}/staff/",
-                    params={"business": self.selected_business_id},
-                    headers=headers,
-                    timeout=10.0,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    items = data.get("results", data) if isinstance(data, dict) else data
-                    self.staff = [Staff(**item) for item in items]
-                    self.total_staff = len(self.staff)
-
-                # Load services
-                resp = await client.get(
-                    f"{self.api_url}/services/",
-                    params={"business": self.selected_business_id},
-                    headers=headers,
-                    timeout=10.0,
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    items = data.get("results", data) if isinstance(data, dict) else data
-                    self.services = [Service(**item) for item in items]
-                    self.total_services = len(self.services)
-
-                # Load appointments
+            headers = dict(self.auth_headers) if self.access_token else {}
+            # Only revalidate when state still holds this business's data
+            if self._workspace_etag and self._workspace_business_id == self.selected_business_id:
+                headers["If-None-Match"] = self._workspace_etag
+            async with api_client() as client:
+                # One request for customers, staff, services, appointments and totals
                 resp = await client.get(
-                    f"{self.api_url}/appointments/",
-                    params={"business": self.selected_business_id},
+                    f"{self.api_url}/businesses/{self.selected_business_id}/workspace/",
                     headers=headers,
                     timeout=10.0,
                 )
+                # 304 Not Modified: keep what is already loaded
                 if resp.status_code == 200:
-                    data = resp.json()
-                    items = data.get("results", data) if isinstance(data, dict) else data
-                    self.appointments = [Appointment(**item) for item in items]
-                    self.total_appointments = len(self.appointments)
+                    self._apply_workspace(decode(resp))
+                    self._workspace_etag = resp.headers.get("ETag", "")
+                    self._workspace_business_id = self.selected_business_id
         except Exception as e:
             self.error_message = f"Error loading data: {e!s}"
         finally:
             self.is_loading = False
 
+    def _apply_workspace(self, data: dict):
+        self.customers = [Customer(**item) for item in data.get("customers", [])]
+        self.staff = [Staff(**item) for item in data.get("staff", [])]
+        self.services = [Service(**item) for item in data.get("services", [])]
+        self.appointments = [Appointment(**item) for item in data.get("appointments", [])]
+        self.total_customers = len(self.customers)
+        self.total_staff = len(self.staff)
+        self.total_services = len(self.services)
+        self.total_appointments = len(self.appointments)
+        # Totals come from the server so they cover more than the loaded rows
+        self._apply_stats(data.get("stats") or {})
+
+    def _apply_stats(self, stats: dict):
+        self.total_customers = stats.get("total_customers", self.total_customers)
+        self.total_staff = stats.get("total_staff", self.total_staff)
+        self.total_services = stats.get("total_services", self.total_services)
+        self.total_appointments = stats.get("total_appointments", self.total_appointments)
+        self.today_appointments = stats.get("today", {}).get("total", 0)
+        self.week_appointments = stats.get("week", {}).get("total", 0)
+
     # ============ OPTIMISTIC CREATE - CUSTOMER ============
     async def create_customer(self):
         if not self.form_customer_name:
@@ -505,7 +524,7 @@ class AppState(AuthState):
         # API call in background
         try:
             headers = self.auth_headers if self.access_token else {}
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.post(
                     f"{self.api_url}/customers/",
                     json=payload,
@@ -514,7 +533,7 @@ class AppState(AuthState):
                 )
                 if resp.status_code == 201:
                     # Replace temp customer with real one
-                    real_data = resp.json()
+                    real_data = decode(resp)
                     self.customers = [Customer(**real_data) if c.id == temp_id else c for c in self.customers]
                 else:
                     # Revert optimistic update
@@ -559,7 +578,7 @@ class AppState(AuthState):
 
         try:
             headers = self.auth_headers if self.access_token else {}
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.post(
                     f"{self.api_url}/staff/",
                     json=payload,
@@ -567,7 +586,7 @@ class AppState(AuthState):
                     timeout=10.0,
                 )
                 if resp.status_code == 201:
-                    real_data = resp.json()
+                    real_data = decode(resp)
                     self.staff = [Staff(**real_data) if s.id == temp_id else s for s in self.staff]
                 else:
                     self.staff = [s for s in self.staff if s.id != temp_id]
@@ -610,7 +629,7 @@ class AppState(AuthState):
 
         try:
             headers = self.auth_headers if self.access_token else {}
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.post(
                     f"{self.api_url}/services/",
                     json=payload,
@@ -618,7 +637,7 @@ class AppState(AuthState):
                     timeout=10.0,
                 )
                 if resp.status_code == 201:
-                    real_data = resp.json()
+                    real_data = decode(resp)
                     self.services = [Service(**real_data) if s.id == temp_id else s for s in self.services]
                 else:
                     self.services = [s for s in self.services if s.id != temp_id]
@@ -629,6 +648,45 @@ class AppState(AuthState):
             self.total_services = len(self.services)
             self.error_message = f"Error: {e!s}"
 
+    # ============ CUSTOMER TYPEAHEAD ============
+    async def search_customers(self, query: str):
+        """Look customers up by name or phone as the user types."""
+        self.customer_query = query
+        self.form_appt_customer = ""
+        self.form_appt_customer_name = ""
+        if len(query.strip()) < 2 or not self.selected_business_id:
+            self.customer_results = []
+            return
+        try:
+            headers = self.auth_headers if self.access_token else {}
+            async with api_client() as client:
+                resp = await client.get(
+                    f"{self.api_url}/customers/search/",
+                    params={"business": self.selected_business_id, "q": query},
+                    headers=headers,
+                    timeout=5.0,
+                )
+            # Drop answers to a query the user has already typed past
+            if resp.status_code == 200 and query == self.customer_query:
+                self.customer_results = [
+                    Customer(
+                        id=str(row["id"]),
+                        name=row["name"],
+                        phone=row.get("phone") or "",
+                        email=row.get("email") or "",
+                        total_visits=row.get("total_visits") or 0,
+                    )
+                    for row in decode(resp).get("results", [])
+                ]
+        except Exception as e:
+            self.error_message = f"Error searching customers: {e!s}"
+
+    def select_appt_customer(self, customer_id: str, name: str):
+        self.form_appt_customer = customer_id
+        self.form_appt_customer_name = name
+        self.customer_query = name
+        self.customer_results = []
+
     # ============ OPTIMISTIC CREATE - APPOINTMENT ============
     async def create_appointment(self):
         if not all(
@@ -647,7 +705,9 @@ class AppState(AuthState):
         scheduled_at = f"{self.form_appt_date}T{self.form_appt_time}:00"
 
         # Find names for optimistic display
-        customer_name = next((c.name for c in self.customers if c.id == self.form_appt_customer), "Customer")
+        customer_name = self.form_appt_customer_name or next(
+            (c.name for c in self.customers if c.id == self.form_appt_customer), "Customer"
+        )
         staff_name = next((s.name for s in self.staff if s.id == self.form_appt_staff), "Staff")
         service_name = next((s.name for s in self.services if s.id == self.form_appt_service), "Service")
 
@@ -678,7 +738,7 @@ class AppState(AuthState):
 
         try:
             headers = self.auth_headers if self.access_token else {}
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.post(
                     f"{self.api_url}/appointments/",
                     json=payload,
@@ -686,7 +746,7 @@ class AppState(AuthState):
                     timeout=10.0,
                 )
                 if resp.status_code == 201:
-                    real_data = resp.json()
+                    real_data = decode(resp)
                     self.appointments = [Appointment(**real_data) if a.id == temp_id else a for a in self.appointments]
                 else:
                     self.appointments = [a for a in self.appointments if a.id != temp_id]
@@ -709,7 +769,7 @@ class AppState(AuthState):
 
         try:
             headers = self.auth_headers if self.access_token else {}
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.delete(
                     f"{self.api_url}/customers/{customer_id}/",
                     headers=headers,
@@ -737,7 +797,7 @@ class AppState(AuthState):
 
         try:
             headers = self.auth_headers if self.access_token else {}
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.delete(
                     f"{self.api_url}/staff/{staff_id}/",
                     headers=headers,
@@ -762,7 +822,7 @@ class AppState(AuthState):
 
         try:
             headers = self.auth_headers if self.access_token else {}
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.delete(
                     f"{self.api_url}/services/{service_id}/",
                     headers=headers,
@@ -788,7 +848,7 @@ class AppState(AuthState):
 
         try:
             headers = self.auth_headers if self.access_token else {}
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.delete(
                     f"{self.api_url}/appointments/{appt_id}/",
                     headers=headers,
@@ -822,7 +882,7 @@ class AppState(AuthState):
 
         try:
             headers = self.auth_headers if self.access_token else {}
-            async with httpx.AsyncClient() as client:
+            async with api_client() as client:
                 resp = await client.patch(
                     f"{self.api_url}/appointments/{appt_id}/",
                     json={"status": new_status},